@@ -5,6 +5,8 @@ Ana Çalıştırıcı - CLI veya UI
 Kullanım:
   python main.py                           # Streamlit UI başlat
   python main.py --cli "konu"              # CLI mode
+  python main.py --batch topics.jsonl      # Batch mode (çok konu, tek süreç)
+  python main.py --resume RUN_ID           # Yarıda kalan araştırmaya devam
   python main.py --test                    # Test mode
 """
 
@@ -12,6 +14,10 @@ import sys
 import os
 import argparse
 import asyncio
+import json
+import re
+import time
+from datetime import datetime
 
 # Proje root
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -36,14 +42,14 @@ def run_ui():
     ])
 
 
-async def run_cli(topic: str, context: str = None):
+async def run_cli(topic: str, context: str = None, deadline_seconds: float = None):
     """CLI modunda çalıştır"""
     
     orchestrator = ResearchOrchestrator()
     
     print("\n🚀 CLI Mode: Deep Research başlatılıyor...\n")
     
-    results = await orchestrator.run_research(topic, context)
+    results = await orchestrator.run_research(topic, context, deadline_seconds=deadline_seconds)
     
     if results['success']:
         # Sonuçları kaydet
@@ -55,6 +61,173 @@ async def run_cli(topic: str, context: str = None):
         print(f"\n❌ Hata: {results.get('error')}")
 
 
+async def run_resume(run_id: str):
+    """Checkpoint'i olan araştırmaya kaldığı yerden devam et"""
+    from src.workflow.checkpoint import list_checkpoints
+    
+    orchestrator = ResearchOrchestrator()
+    
+    try:
+        results = await orchestrator.resume(run_id)
+    except (FileNotFoundError, ValueError) as e:
+        await orchestrator._close_crawler_pool()
+        print(f"\n❌ {e}")
+        
+        runs = list_checkpoints()
+        if runs:
+            print("\nDevam ettirilebilecek araştırmalar:")
+            for run in runs[:10]:
+                print(f"   {run['run_id']}  [{run['stage']}, {run['completed_subtopics']} alt başlık]  {run['topic'][:60]}")
+        return
+    
+    if results['success']:
+        files = orchestrator.save_results(results)
+        
+        print("\n✅ İşlem tamamlandı!")
+        print(f"\n📄 Rapor: {files['report']}")
+    else:
+        print(f"\n❌ Hata: {results.get('error')}")
+
+
+def _slugify(text: str) -> str:
+    """Dosya adı olarak güvenli kısa ad (küçük harf, a-z0-9 ve _)"""
+    return re.sub(r'[^a-z0-9]+', '_', text.lower())[:40].strip('_')
+
+
+def load_batch_topics(path: str) -> list:
+    """
+    topics.jsonl oku
+    
+    Her satır: {"topic": "...", "context": "...", "id": "...", "deadline_seconds": 90} (topic dışı opsiyonel)
+    Düz metin satırları da konu olarak kabul edilir; nesne olmayan JSON
+    satırları (sayı, liste, ...) atlanır. id çıktı dosya adı olduğu için
+    slug'a çevrilir.
+    """
+    jobs = []
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                item = line
+            
+            if isinstance(item, str):
+                item = {'topic': item}
+            
+            if not isinstance(item, dict):
+                print(f"⚠️  Satır {line_number}: JSON nesnesi değil ({type(item).__name__}), atlandı")
+                continue
+            
+            if not isinstance(item.get('topic'), str) or not item['topic'].strip():
+                print(f"⚠️  Satır {line_number}: 'topic' yok, atlandı")
+                continue
+            
+            job_id = _slugify(str(item['id'])) if item.get('id') is not None else ''
+            item['id'] = job_id or f"{len(jobs) + 1:04d}_{_slugify(item['topic'])}"
+            jobs.append(item)
+    
+    return jobs
+
+
+async def run_batch(topics_file: str, concurrency: int, output_dir: str = "output", deadline_seconds: float = None):
+    """
+    Batch modu: tüm konular tek süreçte, paylaşılan kaynaklarla
+    
+    - Ajanlar ve tarayıcı havuzu tüm işler için tek (araştırma limiti,
+      rate limiter, LLM ve arama cache'leri zaten süreç genelinde paylaşılır)
+    - Aynı anda `concurrency` konu çalışır; alt başlıklar ortak (adaptif)
+      limitte sıraya girer, bir konu planlanırken/yazılırken diğerleri araştırır
+    - Her iş bitince sonuçları yazılır ve manifest'e bir satır eklenir
+    """
+    from src.agents.planner_agent import PlannerAgent
+    from src.agents.researcher_agent import ResearcherAgent
+    from src.agents.writer_agent import WriterAgent
+    from src.tools.crawler_pool import CrawlerPool
+    
+    jobs = load_batch_topics(topics_file)
+    if not jobs:
+        print(f"❌ {topics_file} içinde konu bulunamadı")
+        return
+    
+    batch_dir = os.path.join(output_dir, f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    os.makedirs(batch_dir, exist_ok=True)
+    manifest_path = os.path.join(batch_dir, "manifest.jsonl")
+    
+    print(f"\n📦 Batch Mode: {len(jobs)} konu, aynı anda {concurrency} iş")
+    print(f"   Çıktı: {batch_dir}\n")
+    
+    # Paylaşılan bileşenler (model kurulumu bir kez)
+    planner = PlannerAgent()
+    researcher = ResearcherAgent()
+    writer = WriterAgent()
+    crawler_pool = CrawlerPool.from_config()
+    job_slots = asyncio.Semaphore(concurrency)
+    
+    manifest_lock = asyncio.Lock()
+    completed = {'success': 0, 'failed': 0}
+    batch_start = time.time()
+    
+    async def run_job(job: dict):
+        async with job_slots:
+            orchestrator = ResearchOrchestrator(
+                planner=planner,
+                researcher=researcher,
+                writer=writer,
+                crawler_pool=crawler_pool
+            )
+            
+            job_start = time.time()
+            try:
+                results = await orchestrator.run_research(
+                    job['topic'],
+                    job.get('context'),
+                    deadline_seconds=job.get('deadline_seconds', deadline_seconds)
+                )
+            except Exception as e:
+                results = {'success': False, 'error': str(e)}
+            
+            entry = {
+                'id': job['id'],
+                'topic': job['topic'],
+                'success': results.get('success', False),
+                'duration_seconds': round(time.time() - job_start, 1)
+            }
+            
+            if entry['success']:
+                entry['files'] = orchestrator.save_results(results, output_dir=batch_dir, base_name=job['id'])
+                quality = results.get('quality_metrics') or {}
+                entry['quality_score'] = quality.get('overall_score')
+                completed['success'] += 1
+            else:
+                entry['error'] = results.get('error')
+                completed['failed'] += 1
+            
+            # İş bittiği anda manifest'e yaz (yarıda kalan batch'te de sonuçlar korunur)
+            async with manifest_lock:
+                with open(manifest_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            
+            done = completed['success'] + completed['failed']
+            status = "✅" if entry['success'] else f"❌ {entry.get('error')}"
+            print(f"\n📦 [{done}/{len(jobs)}] {job['id']}: {status}\n")
+    
+    try:
+        await asyncio.gather(*(run_job(job) for job in jobs))
+    finally:
+        await crawler_pool.close()
+    
+    print("\n" + "="*70)
+    print(f"📦 BATCH TAMAMLANDI: {completed['success']} başarılı, {completed['failed']} başarısız")
+    print(f"⏱️  Toplam süre: {time.time() - batch_start:.1f} saniye")
+    print(f"📄 Manifest: {manifest_path}")
+    print("="*70 + "\n")
+
+
 def run_test():
     """Test modunda çalıştır"""
     
@@ -76,6 +249,9 @@ def main():
 Örnekler:
   python main.py                                    # UI mode (varsayılan)
   python main.py --cli "Kuantum bilgisayarlar"      # CLI mode
+  python main.py --cli "Kuantum bilgisayarlar" --deadline 90   # 90 saniyelik süre bütçesi
+  python main.py --batch topics.jsonl --concurrency 4   # Batch mode
+  python main.py --resume 20250101_120000_a1b2c3    # Yarıda kalan run'a devam
   python main.py --test                             # Test mode
         """
     )
@@ -94,6 +270,42 @@ def main():
         help='Ek bağlam (opsiyonel, --cli ile kullan)'
     )
     
+    parser.add_argument(
+        '--batch',
+        type=str,
+        metavar='TOPICS_JSONL',
+        help='Batch modunda çalıştır (her satır bir konu: {"topic": ..., "context": ...})'
+    )
+    
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=None,
+        help='Batch modunda aynı anda çalışan konu sayısı (varsayılan: performance.max_concurrent_jobs)'
+    )
+    
+    parser.add_argument(
+        '--output-dir',
+        type=str,
+        default='output',
+        help='Batch sonuçlarının yazılacağı dizin'
+    )
+    
+    parser.add_argument(
+        '--deadline',
+        type=float,
+        default=None,
+        metavar='SECONDS',
+        help='Run süre bütçesi; dolunca araştırma hafifletilir (varsayılan: scheduling.deadline_seconds)'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        type=str,
+        metavar='RUN_ID',
+        help='Yarıda kalan araştırmaya checkpoint\'ten devam et'
+    )
+    
     parser.add_argument(
         '--test',
         action='store_true',
@@ -105,8 +317,15 @@ def main():
     # Mode seçimi
     if args.test:
         run_test()
+    elif args.batch:
+        from src.utils.config_loader import get_config
+        
+        concurrency = args.concurrency or get_config('performance.max_concurrent_jobs', 2)
+        asyncio.run(run_batch(args.batch, concurrency, args.output_dir, args.deadline))
+    elif args.resume:
+        asyncio.run(run_resume(args.resume))
     elif args.cli:
-        asyncio.run(run_cli(args.cli, args.context))
+        asyncio.run(run_cli(args.cli, args.context, args.deadline))
     else:
         # Default: UI
         run_ui()
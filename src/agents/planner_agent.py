@@ -12,14 +12,13 @@ Görev: Verilen konuyu analiz edip araştırma planı oluştur
 
 import os
 import sys
-import time
 from typing import List, Dict
 from dotenv import load_dotenv
 import google.generativeai as genai
 
 # Proje utils'leri
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from src.utils.retry_helper import retry_with_exponential_backoff
+from src.utils.llm_gateway import get_llm_gateway
 from src.utils.config_loader import get_model_name, get_config
 from src.utils.logger import logger, log_agent_action
 
@@ -71,13 +70,14 @@ KURALLAR:
 JSON formatında yanıt ver, başka açıklama ekleme.
 """
         
-        self.model = genai.GenerativeModel(
+        self.model = get_llm_gateway().create_model(
             model_name=self.model_name,
             system_instruction=system_instruction,
             generation_config={
                 "temperature": 0.7,  # Yaratıcı ama kontrollü
                 "response_mime_type": "application/json"  # JSON zorla
-            }
+            },
+            agent="planner"
         )
     
     def create_plan(self, topic: str, context: str = None) -> Dict:
@@ -100,15 +100,9 @@ JSON formatında yanıt ver, başka açıklama ekleme.
         
         log_agent_action("PlannerAgent", "create_plan_start", {"topic": topic[:50]})
         
-        # Retry wrapper ile API çağrısı
-        @retry_with_exponential_backoff(max_retries=3)
-        def _call_api():
-            return self.model.generate_content(prompt)
-        
-        response = _call_api()
-        
-        # Rate limit: 5 req/min = 12 saniye arası gerekli
-        time.sleep(13)
+        # Geçici hatalar gateway'de tekrar denenir; aynı konu/bağlam için
+        # plan cache'ten gelir (çökme sonrası tekrar çalıştırma)
+        response = get_llm_gateway().generate_sync(self.model, prompt, use_cache=True)
         
         # JSON parse (Gemini zaten JSON döner)
         import json
@@ -142,7 +136,7 @@ Kullanıcı Geri Bildirimi:
 Bu geri bildirime göre planı güncelle. Aynı JSON formatında döndür.
 """
         
-        response = self.model.generate_content(prompt)
+        response = get_llm_gateway().generate_sync(self.model, prompt)
         updated_plan = json.loads(response.text)
         
         return updated_plan
@@ -14,17 +14,17 @@ Yetenekler:
 import os
 import sys
 import asyncio
-import time
-from typing import List, Dict
+from typing import List, Dict, Optional
 from dotenv import load_dotenv
 import google.generativeai as genai
-from crawl4ai import AsyncWebCrawler
 
 # Proje root'unu path'e ekle
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.tools.web_tools import search_web_simple
+from src.tools.web_tools import search_web_simple, collect_search_results
+from src.tools.crawler_pool import CrawlerPool
 from src.utils.source_scorer import SourceScorer
+from src.utils.llm_gateway import get_llm_gateway
 from src.utils.logger import logger, log_agent_action
 
 load_dotenv()
@@ -62,17 +62,28 @@ YETENEKLERİN:
 JSON formatında yanıt ver.
 """
         
-        self.model = genai.GenerativeModel(
+        self.model = get_llm_gateway().create_model(
             model_name=self.model_name,
             tools=[search_web_simple],  # Web search tool
             system_instruction=system_instruction
         )
+        
+        # Synthesis model (JSON zorla) - her alt başlıkta yeniden kurulmaz
+        self.synthesis_model = get_llm_gateway().create_model(
+            model_name=self.model_name,
+            generation_config={
+                "temperature": 0.5,
+                "response_mime_type": "application/json"
+            },
+            agent="researcher"
+        )
     
     async def research_topic(
         self,
         topic: str,
         max_sources: int = 5,
-        scrape_content: bool = True
+        scrape_content: bool = True,
+        crawler_pool: Optional[CrawlerPool] = None
     ) -> Dict:
         """
         Konuyu araştır
@@ -81,6 +92,7 @@ JSON formatında yanıt ver.
             topic: Araştırılacak konu
             max_sources: Maksimum kaynak sayısı
             scrape_content: URL içeriklerini scrape et mi?
+            crawler_pool: Paylaşılan crawler havuzu (yoksa geçici havuz açılır)
         
         Returns:
             dict: Araştırma sonuçları (source scores dahil)
@@ -99,19 +111,24 @@ JSON formatında yanıt ver.
 En fazla {max_sources} kaynak kullan."""
         
         print("   📡 Web search...")
-        response = chat.send_message(search_prompt)
+        gateway = get_llm_gateway()
+        
+        # LLM'in tool çağrılarıyla yaptığı aramaların sonuçlarını yakala
+        with collect_search_results() as collected:
+            response = await gateway.send_message(chat, search_prompt)
         
         # LLM'in bulduğu kaynakları içeren yanıtı al
         initial_findings = response.text
         
-        # Search'ten gelen kaynakları al ve skorla
-        search_results = search_web_simple(topic, max_sources)
-        scored_sources = scorer.score_multiple_sources(search_results)
+        search_results = self._unique_by_url(collected)
+        if not search_results:
+            # Model tool'u hiç çağırmadıysa tek seferlik doğrudan arama
+            search_results = await gateway.run_blocking(search_web_simple, topic, max_sources)
         
-        print(f"   ✅ İlk bulgular toplandı ({len(scored_sources)} kaynak)")
+        # Kaynakları skorla, en güvenilir max_sources tanesini tut
+        scored_sources = scorer.score_multiple_sources(search_results)[:max_sources]
         
-        # Rate limit: 5 req/min = 12 saniye arası gerekli
-        time.sleep(13)
+        print(f"   ✅ İlk bulgular toplandı ({len(scored_sources)} kaynak)")
         
         # 2. Eğer scraping istenmişse, URL'leri scrape et
         scraped_data = []
@@ -119,12 +136,12 @@ En fazla {max_sources} kaynak kullan."""
             urls = [s['url'] for s in scored_sources[:3]]  # En güvenilir 3 URL
             
             print(f"   🕷️  {len(urls)} URL scraping...")
-            scraped_data = await self._scrape_urls(urls)
+            scraped_data = await self._scrape_urls(urls, crawler_pool)
             print(f"   ✅ {len(scraped_data)} URL scrape edildi")
         
         # 3. Final analiz: Tüm verileri sentezle
         print("   🧠 Final analiz...")
-        analysis = self._synthesize_findings(
+        analysis = await self._synthesize_findings(
             topic=topic,
             initial_findings=initial_findings,
             scraped_data=scraped_data
@@ -143,42 +160,34 @@ En fazla {max_sources} kaynak kullan."""
         
         return analysis
     
-    async def _scrape_urls(self, urls: List[str]) -> List[Dict]:
-        """URL'leri scrape et"""
-        results = []
+    @staticmethod
+    def _unique_by_url(results: List[Dict]) -> List[Dict]:
+        """Aynı URL'i birden fazla tool çağrısı döndürdüyse tekilleştir"""
+        seen = set()
+        unique = []
         
-        async with AsyncWebCrawler(verbose=False) as crawler:
-            for url in urls:
-                try:
-                    result = await crawler.arun(url=url)
-                    
-                    if result.success:
-                        # İlk 3000 karakter al
-                        content = result.markdown[:3000]
-                        results.append({
-                            'url': url,
-                            'content': content,
-                            'success': True
-                        })
-                    else:
-                        results.append({
-                            'url': url,
-                            'error': result.error_message,
-                            'success': False
-                        })
-                except Exception as e:
-                    results.append({
-                        'url': url,
-                        'error': str(e),
-                        'success': False
-                    })
-                
-                # Rate limiting
-                await asyncio.sleep(0.5)
+        for result in results:
+            url = result.get('url')
+            if url and url not in seen:
+                seen.add(url)
+                unique.append(result)
         
-        return results
+        return unique
     
-    def _synthesize_findings(
+    async def _scrape_urls(
+        self,
+        urls: List[str],
+        crawler_pool: Optional[CrawlerPool] = None
+    ) -> List[Dict]:
+        """URL'leri eşzamanlı scrape et (paylaşılan havuz üzerinden)"""
+        if crawler_pool is not None:
+            return await crawler_pool.fetch_many(urls)
+        
+        # Tek başına kullanım: bu çağrı için geçici havuz
+        async with CrawlerPool.from_config() as pool:
+            return await pool.fetch_many(urls)
+    
+    async def _synthesize_findings(
         self,
         topic: str,
         initial_findings: str,
@@ -213,19 +222,8 @@ Tüm bu bilgileri analiz et ve şu formatta JSON döndür:
 }
 """
         
-        # Synthesis model (JSON zorla)
-        synthesis_model = genai.GenerativeModel(
-            model_name=self.model_name,
-            generation_config={
-                "temperature": 0.5,
-                "response_mime_type": "application/json"
-            }
-        )
-        
-        response = synthesis_model.generate_content(synthesis_prompt)
-        
-        # Rate limit için bekle
-        time.sleep(13)
+        # Aynı bulgular için sentez tekrar çalıştırmada cache'ten gelir
+        response = await get_llm_gateway().generate(self.synthesis_model, synthesis_prompt, use_cache=True)
         
         import json
         analysis = json.loads(response.text)
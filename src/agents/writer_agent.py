@@ -13,9 +13,14 @@ Görev: Araştırma bulgularını profesyonel rapora dönüştür
 """
 
 import os
+import re
 import sys
 import time
-from typing import List, Dict, Generator, Optional
+import queue
+import threading
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Generator, Iterator, Optional, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
 import google.generativeai as genai
@@ -24,17 +29,35 @@ import google.generativeai as genai
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from src.utils.perspective_analyzer import PerspectiveAnalyzer
 from src.utils.quality_metrics import QualityMetrics
+from src.utils.llm_gateway import get_llm_gateway
+from src.utils.config_loader import get_config
+from src.utils.resumable import result_section_key, resumable, results_key
 from src.utils.logger import logger, log_agent_action
 
 load_dotenv()
 genai.configure(api_key=os.getenv('GOOGLE_API_KEY'))
 
 
+def renumber_section(section: str, number: int) -> str:
+    """Bölümün ilk '## N.' başlığını verilen numaraya çevir"""
+    return re.sub(r'^## \d+\.', f'## {number}.', section, count=1, flags=re.MULTILINE)
+
+
 class WriterAgent:
     """Araştırma raporu yazan ajan"""
     
-    def __init__(self, model_name='gemini-2.5-flash'):
+    def __init__(self, model_name='gemini-2.5-flash', parallel_sections: Optional[bool] = None):
+        """
+        Args:
+            model_name: Gemini model adı
+            parallel_sections: Bölümleri eşzamanlı üret (None → config: report.parallel_sections)
+        """
         self.model_name = model_name
+        self.parallel_sections = (
+            get_config('report.parallel_sections', True)
+            if parallel_sections is None else parallel_sections
+        )
+        self.max_workers = get_config('performance.max_concurrent_requests', 5)
         
         system_instruction = """Sen bir profesyonel rapor yazarısısın.
 
@@ -61,14 +84,18 @@ FORMAT:
 Markdown (.md) formatında profesyonel rapor.
 """
         
-        self.model = genai.GenerativeModel(
+        self.model = get_llm_gateway().create_model(
             model_name=self.model_name,
             system_instruction=system_instruction,
             generation_config={
                 "temperature": 0.7,  # Akıcı yazım için
                 "max_output_tokens": 8000  # Uzun rapor için
-            }
+            },
+            agent="writer"
         )
+        
+        # Rapor başına yeniden kurulmaz
+        self.perspective_analyzer = PerspectiveAnalyzer()
     
     def write_report(
         self,
@@ -76,7 +103,8 @@ Markdown (.md) formatında profesyonel rapor.
         plan: Dict,
         research_results: List[Dict],
         style: str = "professional",
-        include_perspectives: bool = True
+        include_perspectives: bool = True,
+        checkpoint=None
     ) -> Dict:
         """
         Tam rapor yaz (perspective analysis ile)
@@ -87,6 +115,8 @@ Markdown (.md) formatında profesyonel rapor.
             research_results: Her subtopic için research sonuçları
             style: "professional", "academic", "casual"
             include_perspectives: Perspektif analizi dahil et mi?
+            checkpoint: RunCheckpoint (opsiyonel) - tamamlanan parçalar kaydedilir,
+                        kayıtlı parçalar yeniden üretilmez
         
         Returns:
             dict: {
@@ -100,48 +130,38 @@ Markdown (.md) formatında profesyonel rapor.
         
         log_agent_action("WriterAgent", "write_report_start", {"topic": topic[:50]})
         
-        # 1. Perspektif analizi yap (varsa)
-        perspectives = None
-        if include_perspectives:
-            try:
-                print("   🔍 Perspektif analizi yapılıyor...")
-                analyzer = PerspectiveAnalyzer()
-                perspectives = analyzer.analyze_perspectives(topic, research_results)
-                print(f"   ✅ {len(perspectives.get('perspectives', []))} perspektif bulundu")
-            except Exception as e:
-                logger.warning(f"Perspektif analizi başarısız: {e}")
-                perspectives = None
-        
-        # 2. Ana raporu bölümler halinde yaz
-        print("   🤖 LLM rapor yazıyor (bölümler halinde)...")
-        
-        # Giriş ve özet
-        intro_prompt = self._build_intro_prompt(topic, plan, research_results, perspectives)
-        intro_response = self.model.generate_content(intro_prompt)
-        time.sleep(13)
-        intro_section = intro_response.text
-        
-        # Her alt başlık için bölüm yaz
-        sections = []
-        for i, result in enumerate(research_results):
-            print(f"   📝 Bölüm {i+1}/{len(research_results)} yazılıyor...")
-            section_prompt = self._build_section_prompt(
-                topic=topic,
-                subtopic=result.get('subtopic', f'Bölüm {i+1}'),
-                research_data=result,
-                section_number=i+1
+        # 1-2. Perspektif analizi + bölümler
+        if self.parallel_sections:
+            print("   🤖 LLM rapor yazıyor (bölümler paralel)...")
+            perspectives, intro_section, sections, conclusion_section = self._write_parts_parallel(
+                topic, plan, research_results, include_perspectives, checkpoint
+            )
+        else:
+            print("   🤖 LLM rapor yazıyor (bölümler halinde)...")
+            perspectives, intro_section, sections, conclusion_section = self._write_parts_sequential(
+                topic, plan, research_results, include_perspectives, checkpoint
             )
-            section_response = self.model.generate_content(section_prompt)
-            time.sleep(13)
-            sections.append(section_response.text)
         
-        # Sonuç bölümü
-        conclusion_prompt = self._build_conclusion_prompt(topic, research_results, perspectives)
-        conclusion_response = self.model.generate_content(conclusion_prompt)
-        time.sleep(13)
-        conclusion_section = conclusion_response.text
+        return self.assemble_report(
+            topic, research_results, perspectives, intro_section, sections, conclusion_section
+        )
+    
+    def assemble_report(
+        self,
+        topic: str,
+        research_results: List[Dict],
+        perspectives: Optional[Dict],
+        intro_section: str,
+        sections: List[str],
+        conclusion_section: str
+    ) -> Dict:
+        """
+        Yazılmış parçaları rapora birleştir ve kalite metriklerini hesapla
         
-        # Tüm bölümleri birleştir
+        Returns:
+            dict: write_report ile aynı yapı
+        """
+        # Tüm bölümleri birleştir (plan sırasıyla)
         report = intro_section + "\n\n" + "\n\n".join(sections) + "\n\n" + conclusion_section
         
         # Metadata ekle
@@ -178,38 +198,227 @@ Markdown (.md) formatında profesyonel rapor.
             'quality_metrics': quality_metrics
         }
     
+    def _write_parts_sequential(
+        self,
+        topic: str,
+        plan: Dict,
+        research_results: List[Dict],
+        include_perspectives: bool,
+        checkpoint=None
+    ) -> Tuple[Optional[Dict], str, List[str], str]:
+        """Perspektif, giriş, bölümler ve sonucu sırayla üret"""
+        
+        perspectives = resumable(
+            checkpoint, results_key('perspectives', research_results), self.analyze_perspectives,
+            topic, research_results
+        ) if include_perspectives else None
+        
+        intro_section = resumable(
+            checkpoint, results_key('intro', research_results), self.write_intro,
+            topic, plan, research_results, perspectives
+        )
+        
+        sections = []
+        for i, result in enumerate(research_results):
+            print(f"   📝 Bölüm {i+1}/{len(research_results)} yazılıyor...")
+            sections.append(renumber_section(resumable(
+                checkpoint, result_section_key(result), self.write_section, topic, result, i + 1
+            ), i + 1))
+        
+        conclusion_section = resumable(
+            checkpoint, results_key('conclusion', research_results), self.write_conclusion,
+            topic, research_results, perspectives
+        )
+        
+        return perspectives, intro_section, sections, conclusion_section
+    
+    def _write_parts_parallel(
+        self,
+        topic: str,
+        plan: Dict,
+        research_results: List[Dict],
+        include_perspectives: bool,
+        checkpoint=None
+    ) -> Tuple[Optional[Dict], str, List[str], str]:
+        """
+        Bölümleri eşzamanlı üret (paylaşılan rate limiter altında)
+        
+        Bölüm prompt'ları yalnızca kendi araştırma sonucuna bağlı olduğundan
+        hemen başlatılır; giriş ve sonuç perspektif analizini bekler.
+        """
+        print(f"   📝 {len(research_results)} bölüm paralel yazılıyor...")
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="writer") as pool:
+            section_futures = [
+                pool.submit(
+                    resumable, checkpoint, result_section_key(result), self.write_section, topic, result, i + 1
+                )
+                for i, result in enumerate(research_results)
+            ]
+            
+            perspectives = resumable(
+                checkpoint, results_key('perspectives', research_results), self.analyze_perspectives,
+                topic, research_results
+            ) if include_perspectives else None
+            
+            intro_future = pool.submit(
+                resumable, checkpoint, results_key('intro', research_results), self.write_intro,
+                topic, plan, research_results, perspectives
+            )
+            conclusion_future = pool.submit(
+                resumable, checkpoint, results_key('conclusion', research_results), self.write_conclusion,
+                topic, research_results, perspectives
+            )
+            
+            sections = [
+                renumber_section(future.result(), number)
+                for number, future in enumerate(section_futures, 1)
+            ]
+            
+            return perspectives, intro_future.result(), sections, conclusion_future.result()
+    
+    def analyze_perspectives(self, topic: str, research_results: List[Dict]) -> Optional[Dict]:
+        """Perspektif analizi (başarısızsa None)"""
+        try:
+            print("   🔍 Perspektif analizi yapılıyor...")
+            perspectives = self.perspective_analyzer.analyze_perspectives(topic, research_results)
+            print(f"   ✅ {len(perspectives.get('perspectives', []))} perspektif bulundu")
+            return perspectives
+        except Exception as e:
+            logger.warning(f"Perspektif analizi başarısız: {e}")
+            return None
+    
+    def write_intro(
+        self,
+        topic: str,
+        plan: Dict,
+        research_results: List[Dict],
+        perspectives: Optional[Dict] = None
+    ) -> str:
+        """Giriş ve yönetici özeti bölümünü yaz"""
+        intro_prompt = self._build_intro_prompt(topic, plan, research_results, perspectives)
+        return get_llm_gateway().generate_sync(self.model, intro_prompt, use_cache=True).text
+    
+    def write_section(self, topic: str, result: Dict, section_number: int) -> str:
+        """Tek bir alt başlık bölümünü yaz"""
+        section_prompt = self._build_section_prompt(
+            topic=topic,
+            subtopic=result.get('subtopic', f'Bölüm {section_number}'),
+            research_data=result,
+            section_number=section_number
+        )
+        return get_llm_gateway().generate_sync(self.model, section_prompt, use_cache=True).text
+    
+    def write_conclusion(
+        self,
+        topic: str,
+        research_results: List[Dict],
+        perspectives: Optional[Dict] = None
+    ) -> str:
+        """Sonuç bölümünü yaz"""
+        conclusion_prompt = self._build_conclusion_prompt(topic, research_results, perspectives)
+        return get_llm_gateway().generate_sync(self.model, conclusion_prompt, use_cache=True).text
+    
     def write_report_streaming(
         self,
         topic: str,
         plan: Dict,
         research_results: List[Dict],
         style: str = "professional",
-        include_perspectives: bool = True
+        include_perspectives: bool = True,
+        checkpoint=None
     ) -> Generator[Dict, None, None]:
         """
         Streaming rapor yaz - her chunk'ı anında döndür
         
+        parallel_sections modunda tüm bölümler aynı anda üretilmeye başlar;
+        sıradaki bölüm canlı akarken sonraki bölümlerin chunk'ları tamponlanır
+        ve sıraları geldiğinde hemen aktarılır. Chunk sırası ve şeması seri
+        modla aynıdır.
+        
         Args:
             topic: Ana konu
             plan: Planner'dan gelen plan
             research_results: Araştırma sonuçları
             style: Yazım stili
             include_perspectives: Perspektif analizi dahil et
+            checkpoint: RunCheckpoint (opsiyonel) - akışı biten parçalar
+                kaydedilir, kayıtlı parçalar yeniden üretilmeden tek chunk
+                olarak döner
             
         Yields:
             dict: {
                 'type': 'metadata' | 'intro' | 'section' | 'conclusion' | 'quality',
-                'content': str (metin chunk'ı),
+                'content': str (metin chunk'ı) | dict (kalite metrikleri),
                 'section_number': int (optional),
-                'section_title': str (optional)
+                'section_title': str (optional),
+                'partial': bool ('quality' için; her bölüm sonunda ara skor,
+                                 en sonda partial=False ile tam skor)
             }
         """
         log_agent_action("WriterAgent", "write_report_streaming_start", {"topic": topic[:50]})
         
+        # Paralel modda bölümler arka planda üretilir; tüketici erken
+        # ayrılırsa (iptal, hata) stop ile üreticiler chunk aralarında durur
+        pool = None
+        stop = threading.Event()
+        if self.parallel_sections:
+            pool = ThreadPoolExecutor(
+                max_workers=len(research_results) + 2,
+                thread_name_prefix="writer-stream"
+            )
+        
+        try:
+            yield from self._stream_report(
+                topic, plan, research_results, include_perspectives, pool, checkpoint, stop
+            )
+        finally:
+            stop.set()
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _stream_report(
+        self,
+        topic: str,
+        plan: Dict,
+        research_results: List[Dict],
+        include_perspectives: bool,
+        pool: Optional[ThreadPoolExecutor],
+        checkpoint=None,
+        stop: Optional[threading.Event] = None
+    ) -> Generator[Dict, None, None]:
+        """write_report_streaming gövdesi (pool varsa bölümler eşzamanlı)"""
+        
+        # Bölüm üretimini hemen başlat (perspektif analizine bağlı değil)
+        section_titles = []
+        section_streams = []
+        for i, result in enumerate(research_results):
+            section_title = result.get('subtopic', f'Bölüm {i+1}')
+            section_prompt = self._build_section_prompt(
+                topic=topic,
+                subtopic=section_title,
+                research_data=result,
+                section_number=i+1
+            )
+            section_titles.append(section_title)
+            section_streams.append(self._open_part(
+                pool, checkpoint, result_section_key(result), section_prompt, stop, section_number=i+1
+            ))
+        
+        # Kalite metrikleri rapor aktıkça artımlı hesaplanır
+        all_sources = []
+        for result in research_results:
+            if 'scored_sources' in result:
+                all_sources.extend(result['scored_sources'])
+        
+        quality = QualityMetrics().accumulator(all_sources, research_results, topic)
+        
         # 1. Metadata yield et
+        metadata = f"# {topic}\n\n*Oluşturulma Tarihi: {datetime.now().strftime('%d.%m.%Y %H:%M')}*\n\n"
+        quality.feed(metadata)
         yield {
             'type': 'metadata',
-            'content': f"# {topic}\n\n*Oluşturulma Tarihi: {datetime.now().strftime('%d.%m.%Y %H:%M')}*\n\n",
+            'content': metadata,
             'timestamp': time.time()
         }
         
@@ -222,8 +431,10 @@ Markdown (.md) formatında profesyonel rapor.
                     'content': '🔍 Perspektif analizi yapılıyor...',
                     'timestamp': time.time()
                 }
-                analyzer = PerspectiveAnalyzer()
-                perspectives = analyzer.analyze_perspectives(topic, research_results)
+                perspectives = resumable(
+                    checkpoint, results_key('perspectives', research_results),
+                    self.perspective_analyzer.analyze_perspectives, topic, research_results
+                )
                 yield {
                     'type': 'status',
                     'content': f'✅ {len(perspectives.get("perspectives", []))} perspektif bulundu',
@@ -241,54 +452,46 @@ Markdown (.md) formatında profesyonel rapor.
         }
         
         intro_prompt = self._build_intro_prompt(topic, plan, research_results, perspectives)
-        intro_chunks = self.model.generate_content(intro_prompt, stream=True)
+        conclusion_prompt = self._build_conclusion_prompt(topic, research_results, perspectives)
+        intro_stream = self._open_part(pool, checkpoint, results_key('intro', research_results), intro_prompt, stop)
+        conclusion_stream = self._open_part(
+            pool, checkpoint, results_key('conclusion', research_results), conclusion_prompt, stop
+        )
         
-        for chunk in intro_chunks:
-            if chunk.text:
-                yield {
-                    'type': 'intro',
-                    'content': chunk.text,
-                    'timestamp': time.time()
-                }
+        for text in intro_stream:
+            quality.feed(text)
+            yield {
+                'type': 'intro',
+                'content': text,
+                'timestamp': time.time()
+            }
         
+        quality.feed('\n\n')
         yield {
             'type': 'intro',
             'content': '\n\n',
             'timestamp': time.time()
         }
         
-        # Rate limit delay
-        time.sleep(13)
-        
-        # 4. Her bölüm için - STREAMING
-        for i, result in enumerate(research_results):
-            section_title = result.get('subtopic', f'Bölüm {i+1}')
-            
+        # 4. Her bölüm için - STREAMING (plan sırasıyla)
+        for i, (section_title, section_stream) in enumerate(zip(section_titles, section_streams)):
             yield {
                 'type': 'status',
                 'content': f'📝 Bölüm {i+1}/{len(research_results)}: {section_title}',
                 'timestamp': time.time()
             }
             
-            section_prompt = self._build_section_prompt(
-                topic=topic,
-                subtopic=section_title,
-                research_data=result,
-                section_number=i+1
-            )
-            
-            section_chunks = self.model.generate_content(section_prompt, stream=True)
-            
-            for chunk in section_chunks:
-                if chunk.text:
-                    yield {
-                        'type': 'section',
-                        'content': chunk.text,
-                        'section_number': i+1,
-                        'section_title': section_title,
-                        'timestamp': time.time()
-                    }
+            for text in section_stream:
+                quality.feed(text)
+                yield {
+                    'type': 'section',
+                    'content': text,
+                    'section_number': i+1,
+                    'section_title': section_title,
+                    'timestamp': time.time()
+                }
             
+            quality.feed('\n\n')
             yield {
                 'type': 'section',
                 'content': '\n\n',
@@ -297,8 +500,13 @@ Markdown (.md) formatında profesyonel rapor.
                 'timestamp': time.time()
             }
             
-            # Rate limit delay
-            time.sleep(13)
+            # Canlı kalite skoru (şu ana kadar yazılan rapor için)
+            yield {
+                'type': 'quality',
+                'content': quality.snapshot(),
+                'partial': True,
+                'timestamp': time.time()
+            }
         
         # 5. Sonuç bölümü - STREAMING
         yield {
@@ -307,41 +515,21 @@ Markdown (.md) formatında profesyonel rapor.
             'timestamp': time.time()
         }
         
-        conclusion_prompt = self._build_conclusion_prompt(topic, research_results, perspectives)
-        conclusion_chunks = self.model.generate_content(conclusion_prompt, stream=True)
+        for text in conclusion_stream:
+            quality.feed(text)
+            yield {
+                'type': 'conclusion',
+                'content': text,
+                'timestamp': time.time()
+            }
         
-        for chunk in conclusion_chunks:
-            if chunk.text:
-                yield {
-                    'type': 'conclusion',
-                    'content': chunk.text,
-                    'timestamp': time.time()
-                }
-        
-        # 6. Kalite metrikleri hesapla
-        yield {
-            'type': 'status',
-            'content': '📊 Kalite metrikleri hesaplanıyor...',
-            'timestamp': time.time()
-        }
-        
-        quality_calculator = QualityMetrics()
-        all_sources = []
-        for result in research_results:
-            if 'scored_sources' in result:
-                all_sources.extend(result['scored_sources'])
-        
-        # Not: Full report text'e ihtiyacımız var, bu yüzden kalite metriği basitleştirilmiş
-        quality_metrics = quality_calculator.calculate_report_quality(
-            sources=all_sources,
-            research_results=research_results,
-            report="",  # Streaming sırasında tam rapor yok
-            topic=topic
-        )
+        # 6. Kalite metrikleri (tüm rapor beslendi → tam skor, ikinci geçiş yok)
+        quality_metrics = quality.snapshot()
         
         yield {
             'type': 'quality',
             'content': quality_metrics,
+            'partial': False,
             'timestamp': time.time()
         }
         
@@ -350,6 +538,87 @@ Markdown (.md) formatında profesyonel rapor.
         })
     
     
+    def _open_part(
+        self,
+        pool: Optional[ThreadPoolExecutor],
+        checkpoint,
+        key: str,
+        prompt: str,
+        stop: Optional[threading.Event] = None,
+        section_number: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Rapor parçasının akışı: checkpoint'te kayıtlıysa kayıtlı metin,
+        yoksa canlı akış (tamamı tüketilince checkpoint'e yazılır)
+        
+        section_number verilirse kayıtlı bölümün başlığı bu numaraya
+        çevrilir (başka bir yazım yolunda farklı sırayla yazılmış olabilir).
+        """
+        saved = checkpoint.get_writer_part(key) if checkpoint else None
+        if saved is not None:
+            if section_number is not None:
+                saved = renumber_section(saved, section_number)
+            return iter([saved])
+        
+        stream = self._open_stream(pool, prompt, stop)
+        if checkpoint is None:
+            return stream
+        return self._record_stream(stream, checkpoint, key)
+    
+    @staticmethod
+    def _record_stream(stream: Iterator[str], checkpoint, key: str) -> Iterator[str]:
+        """Akışı aynen aktar, bitince birleşik metni checkpoint'e kaydet"""
+        parts = []
+        for text in stream:
+            parts.append(text)
+            yield text
+        checkpoint.save_writer_part(key, ''.join(parts))
+    
+    def _open_stream(
+        self,
+        pool: Optional[ThreadPoolExecutor],
+        prompt: str,
+        stop: Optional[threading.Event] = None
+    ) -> Iterator[str]:
+        """
+        Bir bölüm için metin akışı aç (rapor parçaları LLM cache'ine yazılır)
+        
+        pool yoksa akış tüketildiği anda (tembel) başlar. pool varsa üretim
+        hemen arka planda başlar, chunk'lar kuyrukta tamponlanır; stop
+        set edilince üretici sıradaki chunk'ta Gemini akışını kapatıp çıkar.
+        """
+        if pool is None:
+            return get_llm_gateway().stream_sync(self.model, prompt, use_cache=True)
+        
+        chunks = queue.Queue()
+        
+        def produce():
+            try:
+                with closing(get_llm_gateway().stream_sync(self.model, prompt, use_cache=True)) as stream:
+                    for text in stream:
+                        if stop is not None and stop.is_set():
+                            return
+                        chunks.put(('chunk', text))
+                chunks.put(('done', None))
+            except Exception as e:
+                chunks.put(('error', e))
+        
+        pool.submit(produce)
+        return self._drain_stream(chunks)
+    
+    @staticmethod
+    def _drain_stream(chunks: queue.Queue) -> Iterator[str]:
+        """Kuyruktaki chunk'ları üretim bitene kadar sırayla döndür"""
+        while True:
+            kind, value = chunks.get()
+            if kind == 'chunk':
+                yield value
+            elif kind == 'done':
+                return
+            else:
+                raise value
+    
+    
     def _build_intro_prompt(self, topic: str, plan: Dict, research_results: List[Dict], perspectives: Dict = None) -> str:
         """Giriş ve özet bölümü için prompt"""
         
@@ -589,7 +858,7 @@ Rapor:
 Sadece özeti yaz, başka açıklama ekleme.
 """
         
-        response = self.model.generate_content(prompt)
+        response = get_llm_gateway().generate_sync(self.model, prompt)
         return response.text
     
     def improve_section(self, section: str, feedback: str) -> str:
@@ -606,7 +875,8 @@ Geri Bildirim:
 İyileştirilmiş bölümü yaz (sadece bölüm, başka açıklama yok).
 """
         
-        response = self.model.generate_content(prompt)
+        # Her istekte yeni bir varyant beklenir → cache kullanma
+        response = get_llm_gateway().generate_sync(self.model, prompt, use_cache=False)
         return response.text
 
 
@@ -0,0 +1,215 @@
+"""
+Crawler Pool - Paylaşılan Tarayıcı Havuzu
+=========================================
+
+Kademeli (tiered) ve eşzamanlı sayfa indirme:
+
+1. Hızlı yol: havuzlu aiohttp GET + ana içerik çıkarımı (HttpFetcher)
+2. Yalnızca JS ile render edilen sayfalar için tek bir uzun ömürlü
+   AsyncWebCrawler (Crawl4AI) - tarayıcı ilk ihtiyaçta açılır
+
+- Global eşzamanlılık limiti (research.max_concurrent_scrapes)
+- Domain başına limit (research.max_scrapes_per_domain); önce domain
+  slotu alınır, aynı domain'i bekleyen istek global slotu boşa tutmaz.
+  Bekleyeni kalmayan domain'in semaphore'u silinir
+- URL başına timeout (research.scrape_timeout_seconds)
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from src.tools.http_fetcher import HttpFetcher
+
+
+class CrawlerPool:
+    """Orchestrator'ın sahip olduğu paylaşılan crawler havuzu"""
+
+    def __init__(
+        self,
+        max_concurrent: int = 3,
+        max_per_domain: int = 2,
+        timeout_seconds: float = 30,
+        max_content_chars: int = 3000,
+        http_fast_path: bool = True,
+        min_content_chars: int = 500
+    ):
+        """
+        Args:
+            max_concurrent: Aynı anda taranan maksimum URL
+            max_per_domain: Aynı domain'e aynı anda maksimum istek
+            timeout_seconds: URL başına timeout
+            max_content_chars: Saklanacak maksimum içerik uzunluğu
+            http_fast_path: Önce tarayıcısız HTTP indirmeyi dene
+            min_content_chars: Hızlı yolda bundan kısa içerik → tarayıcı
+        """
+        self.max_concurrent = max_concurrent
+        self.max_per_domain = max_per_domain
+        self.timeout_seconds = timeout_seconds
+        self.max_content_chars = max_content_chars
+
+        self.http_fetcher: Optional[HttpFetcher] = None
+        if http_fast_path:
+            self.http_fetcher = HttpFetcher(
+                timeout_seconds=min(timeout_seconds, 15),
+                min_content_chars=min_content_chars,
+                max_content_chars=max_content_chars
+            )
+
+        # Event loop'a bağlı nesneler ilk kullanımda oluşturulur
+        self._crawler = None
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._domain_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._domain_users: Dict[str, int] = {}
+
+    @classmethod
+    def from_config(cls) -> "CrawlerPool":
+        """config.yaml'daki research ayarlarıyla oluştur"""
+        from src.utils.config_loader import get_config
+
+        return cls(
+            max_concurrent=get_config('research.max_concurrent_scrapes', 3),
+            max_per_domain=get_config('research.max_scrapes_per_domain', 2),
+            timeout_seconds=get_config('research.scrape_timeout_seconds', 30),
+            max_content_chars=get_config('research.max_content_chars', 3000),
+            http_fast_path=get_config('research.http_fast_path', True),
+            min_content_chars=get_config('research.min_content_chars', 500)
+        )
+
+    async def start(self):
+        """Limitleri hazırla (tarayıcı ilk ihtiyaçta açılır)"""
+        if self._semaphore is None:
+            self._start_lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._domain_semaphores = {}
+            self._domain_users = {}
+
+    async def _ensure_browser(self):
+        """Tarayıcıyı başlat (zaten açıksa bir şey yapmaz)"""
+        await self.start()
+
+        async with self._start_lock:
+            if self._crawler is not None:
+                return
+
+            from crawl4ai import AsyncWebCrawler
+
+            crawler = AsyncWebCrawler(verbose=False)
+            await crawler.__aenter__()
+
+            self._crawler = crawler
+            logger.info(f"Crawler pool tarayıcısı başlatıldı (max_concurrent={self.max_concurrent})")
+
+    async def close(self):
+        """HTTP oturumunu ve tarayıcıyı kapat"""
+        if self.http_fetcher is not None:
+            await self.http_fetcher.close()
+
+        self._start_lock = None
+        self._semaphore = None
+        self._domain_semaphores = {}
+        self._domain_users = {}
+
+        if self._crawler is None:
+            return
+
+        crawler, self._crawler = self._crawler, None
+
+        try:
+            await crawler.__aexit__(None, None, None)
+        except Exception as e:
+            logger.warning(f"Crawler kapatılamadı: {e}")
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def fetch_many(self, urls: List[str]) -> List[Dict]:
+        """URL'leri eşzamanlı tara (sonuç sırası URL sırasıyla aynı)"""
+        if not urls:
+            return []
+
+        await self.start()
+        return list(await asyncio.gather(*(self.fetch(url) for url in urls)))
+
+    async def fetch(self, url: str) -> Dict:
+        """
+        Tek URL tara (önce HTTP hızlı yolu, gerekirse tarayıcı)
+
+        Returns:
+            {'url', 'content', 'success': True} veya {'url', 'error', 'success': False}
+        """
+        await self.start()
+
+        domain = urlparse(url).netloc.lower()
+        domain_semaphore = self._domain_semaphores.get(domain)
+        if domain_semaphore is None:
+            domain_semaphore = self._domain_semaphores[domain] = asyncio.Semaphore(self.max_per_domain)
+        self._domain_users[domain] = self._domain_users.get(domain, 0) + 1
+
+        try:
+            # Önce domain slotu: domain'i sırası gelmemiş istek global slot tutmaz
+            async with domain_semaphore, self._semaphore:
+                return await self._fetch_tiered(url)
+        finally:
+            users = self._domain_users.get(domain, 1) - 1
+            if users:
+                self._domain_users[domain] = users
+            else:
+                self._domain_users.pop(domain, None)
+                self._domain_semaphores.pop(domain, None)
+
+    async def _fetch_tiered(self, url: str) -> Dict:
+        """Önce HTTP hızlı yolu, gerekirse tarayıcı (slotlar alınmış olarak)"""
+        if self.http_fetcher is not None:
+            result = await self.http_fetcher.fetch(url)
+            needs_browser = result.pop('needs_browser', False)
+
+            if result['success'] or not needs_browser:
+                return result
+
+            logger.debug(f"Tarayıcıya yükseltiliyor: {url} ({result.get('error')})")
+
+        return await self._fetch_with_browser(url)
+
+    async def _fetch_with_browser(self, url: str) -> Dict:
+        """Crawl4AI ile tara (JS render gerektiren sayfalar)"""
+        try:
+            await self._ensure_browser()
+
+            result = await asyncio.wait_for(
+                self._crawler.arun(url=url),
+                timeout=self.timeout_seconds
+            )
+
+            if result.success:
+                return {
+                    'url': url,
+                    'content': (result.markdown or '')[:self.max_content_chars],
+                    'success': True
+                }
+
+            return {
+                'url': url,
+                'error': result.error_message,
+                'success': False
+            }
+
+        except asyncio.TimeoutError:
+            return {
+                'url': url,
+                'error': f"Timeout ({self.timeout_seconds}s)",
+                'success': False
+            }
+        except Exception as e:
+            return {
+                'url': url,
+                'error': str(e),
+                'success': False
+            }
@@ -0,0 +1,265 @@
+"""
+HTTP Fetcher - Hafif Sayfa İndirme (Hızlı Yol)
+==============================================
+
+Statik HTML sayfalar için tarayıcı açmadan içerik çıkarır:
+
+1. Havuzlu aiohttp GET (tek ClientSession, keep-alive)
+2. Readability tarzı ana içerik tespiti (lxml + BeautifulSoup)
+3. Markdown'a dönüştürme
+
+İçerik çok kısaysa, sayfa JS ile render ediliyorsa (SPA kabuğu), sunucu
+botu engelliyorsa (403/429) veya istek zaman aşımına uğrarsa sonuç
+needs_browser=True döner; CrawlerPool bu durumda Crawl4AI'ye geçer.
+Ulaşılamayan host ve geçersiz URL gibi bağlantı hataları tarayıcıya
+yükseltilmez.
+"""
+
+import asyncio
+import re
+from typing import Dict, Optional, Tuple
+from urllib.parse import urljoin
+
+# Ana içerik olamayacak etiketler
+NOISE_TAGS = [
+    'script', 'style', 'noscript', 'nav', 'footer', 'header', 'aside',
+    'form', 'iframe', 'svg', 'button', 'template'
+]
+
+# class/id'de tam parça olarak geçerse (-, _ ile ayrılmış) gürültü sayılan
+# kelimeler: "site-nav", "comments_list" eşleşir; "canvas", "shared" eşleşmez
+NOISE_PATTERN = re.compile(
+    r'(?:^|[\s_-])'
+    r'(?:comments?|sidebar|footer|header|menu|nav|navbar|navigation|cookies?|banner|advert'
+    r'|promo|share|social|related)'
+    r'(?=$|[\s_-])',
+    re.IGNORECASE
+)
+
+# Bot koruması / rate limit: tarayıcıyla tekrar denenmeye değer
+BROWSER_RETRY_STATUSES = {403, 429}
+
+# Client-side render işaretleri (React/Vue/Next/Nuxt kabukları)
+JS_SHELL_PATTERN = re.compile(
+    r'id=["\'](?:root|app|__next|__nuxt)["\']|enable javascript|javascript (?:is )?required',
+    re.IGNORECASE
+)
+
+BLOCK_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'li', 'pre', 'blockquote', 'table']
+
+
+class HttpFetcher:
+    """Havuzlu aiohttp istemcisi + ana içerik çıkarımı"""
+
+    def __init__(
+        self,
+        timeout_seconds: float = 15,
+        max_connections: int = 20,
+        min_content_chars: int = 500,
+        max_content_chars: int = 3000,
+        user_agent: str = "Mozilla/5.0 (compatible; DeepResearchAgent/1.0)"
+    ):
+        """
+        Args:
+            timeout_seconds: İstek başına toplam timeout
+            max_connections: Havuzdaki maksimum bağlantı
+            min_content_chars: Bundan kısa içerik → tarayıcıya yükselt
+            max_content_chars: Saklanacak maksimum içerik uzunluğu
+            user_agent: İsteklerde kullanılacak User-Agent
+        """
+        self.timeout_seconds = timeout_seconds
+        self.max_connections = max_connections
+        self.min_content_chars = min_content_chars
+        self.max_content_chars = max_content_chars
+        self.user_agent = user_agent
+
+        self._session = None
+
+    async def _get_session(self):
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+                headers={'User-Agent': self.user_agent}
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def fetch(self, url: str) -> Dict:
+        """
+        URL'i indir ve ana içeriği Markdown olarak çıkar
+
+        Returns:
+            {
+                'url': str,
+                'success': bool,
+                'content': str (başarılıysa),
+                'needs_browser': bool (JS render gerekiyor mu),
+                'error': str (başarısızsa)
+            }
+        """
+        try:
+            session = await self._get_session()
+
+            async with session.get(url, allow_redirects=True) as response:
+                if response.status >= 400:
+                    return self._failure(
+                        url,
+                        f"HTTP {response.status}",
+                        needs_browser=response.status in BROWSER_RETRY_STATUSES
+                    )
+
+                content_type = response.headers.get('Content-Type', '')
+                if 'html' not in content_type and 'xml' not in content_type:
+                    return self._failure(url, f"HTML değil ({content_type})", needs_browser=False)
+
+                html = await response.text(errors='replace')
+                final_url = str(response.url)
+
+        except asyncio.TimeoutError:
+            return self._failure(url, f"Timeout ({self.timeout_seconds}s)", needs_browser=True)
+        except Exception as e:
+            # Bağlantı hataları (ClientConnectorError, InvalidURL, DNS, ...) tarayıcıda da
+            # aynı kalır: yalnız timeout ve 403/429 Crawl4AI'ye yükseltilir
+            return self._failure(url, f"{type(e).__name__}: {e}", needs_browser=False)
+
+        # Ayrıştırma CPU-yoğun: event loop'u bloklamasın
+        content, js_shell = await asyncio.to_thread(extract_main_content, html, final_url)
+
+        if js_shell or len(content) < self.min_content_chars:
+            return self._failure(
+                url,
+                f"Yetersiz statik içerik ({len(content)} karakter)",
+                needs_browser=True
+            )
+
+        return {
+            'url': url,
+            'content': content[:self.max_content_chars],
+            'success': True,
+            'needs_browser': False
+        }
+
+    @staticmethod
+    def _failure(url: str, error: str, needs_browser: bool) -> Dict:
+        return {
+            'url': url,
+            'error': error,
+            'success': False,
+            'needs_browser': needs_browser
+        }
+
+
+# =============================================================================
+# İÇERİK ÇIKARIMI
+# =============================================================================
+
+def extract_main_content(html: str, base_url: Optional[str] = None) -> Tuple[str, bool]:
+    """
+    HTML'den ana içeriği Markdown olarak çıkar
+
+    Returns:
+        (markdown, js_shell): js_shell=True ise sayfa büyük ihtimalle
+        client-side render ediliyor
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'lxml')
+
+    for tag in soup(NOISE_TAGS):
+        tag.decompose()
+
+    for tag in soup.find_all(attrs={'class': NOISE_PATTERN}) + soup.find_all(id=NOISE_PATTERN):
+        if tag.name not in ('body', 'html', 'main', 'article'):
+            tag.decompose()
+
+    root = _find_main_element(soup)
+    markdown = _to_markdown(root, base_url) if root is not None else ""
+
+    js_shell = len(markdown) < 200 and bool(JS_SHELL_PATTERN.search(html))
+    return markdown, js_shell
+
+
+def _find_main_element(soup):
+    """<article>/<main> varsa onu, yoksa paragraf metni en yoğun bloğu seç"""
+
+    for selector in ('article', 'main', '[role=main]'):
+        candidates = soup.select(selector)
+        if candidates:
+            return max(candidates, key=lambda el: len(el.get_text(" ", strip=True)))
+
+    body = soup.body or soup
+    best, best_score = body, 0.0
+
+    for element in body.find_all(['div', 'section']):
+        paragraphs = element.find_all('p', recursive=False)
+        if not paragraphs:
+            continue
+
+        text_length = sum(len(p.get_text(" ", strip=True)) for p in paragraphs)
+        link_length = sum(len(a.get_text(" ", strip=True)) for a in element.find_all('a'))
+        total_length = len(element.get_text(" ", strip=True)) or 1
+
+        # Link yoğunluğu yüksek bloklar (menü, liste sayfaları) cezalandırılır
+        score = text_length * (1 - link_length / total_length)
+        if score > best_score:
+            best, best_score = element, score
+
+    return best
+
+
+def _to_markdown(root, base_url: Optional[str]) -> str:
+    """Blok elemanlarını sırayla Markdown satırlarına çevir"""
+
+    lines = []
+
+    for element in root.find_all(BLOCK_TAGS):
+        # İç içe bloklar (li içinde p vb.) bir kez yazılsın
+        if element.find_parent(BLOCK_TAGS):
+            continue
+
+        name = element.name
+
+        if name == 'pre':
+            lines.append("```\n" + element.get_text().strip("\n") + "\n```")
+            continue
+
+        text = _inline_text(element, base_url)
+        if not text:
+            continue
+
+        if name[0] == 'h' and name[1:].isdigit():
+            lines.append("#" * int(name[1:]) + " " + text)
+        elif name == 'li':
+            lines.append("- " + text)
+        elif name == 'blockquote':
+            lines.append("> " + text)
+        else:
+            lines.append(text)
+
+    return "\n\n".join(lines)
+
+
+def _inline_text(element, base_url: Optional[str]) -> str:
+    """Satır içi metin (linkler [metin](url) olarak)"""
+
+    for link in element.find_all('a', href=True):
+        label = link.get_text(" ", strip=True)
+        href = urljoin(base_url, link['href']) if base_url else link['href']
+        if label and href.startswith('http'):
+            link.replace_with(f"[{label}]({href})")
+
+    return " ".join(element.get_text(" ", strip=True).split())
+
@@ -0,0 +1,79 @@
+"""
+Search Cache - Web Arama Sonuç Cache'i
+======================================
+
+Tavily sonuçlarını diskte saklar; tekrarlanan/örtüşen araştırma konuları
+aynı sorgu için tekrar API gecikmesi ödemez.
+
+Anahtar: normalize edilmiş sorgu + max_results + search_depth
+Ayarlar: config.yaml → cache (enabled, ttl_hours, max_cache_size_mb)
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+from src.utils.disk_cache import DiskCache, get_cache_dir
+
+
+def normalize_query(query: str) -> str:
+    """Büyük/küçük harf ve boşluk farklarını yok say"""
+    return " ".join(query.lower().split())
+
+
+class SearchCache:
+    """Arama sonuçları için disk cache"""
+
+    def __init__(self, disk_cache: DiskCache):
+        self.disk_cache = disk_cache
+
+    @staticmethod
+    def make_key(query: str, max_results: int, search_depth: str) -> str:
+        return f"{normalize_query(query)}|{int(max_results)}|{search_depth}"
+
+    def get(
+        self,
+        query: str,
+        max_results: int,
+        search_depth: str
+    ) -> Optional[List[Dict[str, str]]]:
+        """Cache'teki sonuçları döndür (yoksa None)"""
+        return self.disk_cache.get(self.make_key(query, max_results, search_depth))
+
+    def set(
+        self,
+        query: str,
+        max_results: int,
+        search_depth: str,
+        results: List[Dict[str, str]]
+    ):
+        """Sonuçları cache'e yaz"""
+        self.disk_cache.set(self.make_key(query, max_results, search_depth), results)
+
+    def stats(self) -> Dict:
+        return self.disk_cache.stats()
+
+
+# Süreç genelinde tek instance
+_search_cache: Optional[SearchCache] = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> Optional[SearchCache]:
+    """Paylaşılan arama cache'ini döndür (cache.enabled false ise None)"""
+    global _search_cache
+
+    from src.utils.config_loader import get_config
+
+    if not get_config('cache.enabled', False):
+        return None
+
+    if _search_cache is None:
+        with _search_cache_lock:
+            if _search_cache is None:
+                _search_cache = SearchCache(DiskCache(
+                    path=get_cache_dir() / "search_cache.sqlite",
+                    ttl_seconds=get_config('cache.ttl_hours', 24) * 3600,
+                    max_size_bytes=int(get_config('cache.max_cache_size_mb', 100) * 1024 * 1024)
+                ))
+
+    return _search_cache
@@ -4,16 +4,67 @@ Web Araçları - Web search ve scraping
 Bu modülde ajanların kullanabileceği web tool'ları var.
 
 - Tavily API ile gerçek web search
+- Geçici Tavily hataları retry_helper ile tekrar denenir ("tavily" devre kesicisi)
+- Aramalar "tavily" rate limiter'ından slot alır; yavaş aramalar p90
+  gecikmede hedge'lenir (config: hedging.agents.search)
+- Süreç genelinde tek TavilyClient (havuzlu requests.Session, keep-alive):
+  her sorguda yeni istemci ve TLS el sıkışması yok
 - Mock data fallback
+- Arama sonuç toplayıcısı (LLM tool çağrılarının sonuçlarını yakalar)
+- Disk cache (config: cache.enabled)
+- Kademeli sayfa indirme (HTTP hızlı yol → Crawl4AI)
 """
 
 import os
-from typing import List, Dict
+import asyncio
+import functools
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Dict, Iterator, Optional
 import time
 from dotenv import load_dotenv
 
+from src.tools.search_cache import get_search_cache
+from src.utils.hedging import get_hedger, hedge_acquirer
+from src.utils.rate_limiter import get_rate_limiter
+from src.utils.retry_helper import retry_sync
+
 load_dotenv()
 
+# Tavily arama derinliği ("basic" veya "advanced")
+SEARCH_DEPTH = "basic"
+
+# API anahtarı -> paylaşılan TavilyClient
+_tavily_clients: Dict[str, "TavilyClient"] = {}
+_tavily_clients_lock = threading.Lock()
+
+# Aktif istek için arama sonuçlarını biriktiren liste (yoksa None)
+_search_collector: ContextVar[Optional[List[Dict[str, str]]]] = ContextVar(
+    'search_collector', default=None
+)
+
+
+@contextmanager
+def collect_search_results() -> Iterator[List[Dict[str, str]]]:
+    """
+    Bu blok içinde yapılan tüm search_web_simple sonuçlarını topla
+
+    Gemini automatic function calling ile tool'u çağırdığında sonuçlar
+    buradaki listeye de eklenir; aynı sorgu için ikinci bir arama gerekmez.
+
+    Kullanım:
+        with collect_search_results() as collected:
+            response = await gateway.send_message(chat, prompt)
+        # collected: tool çağrılarından dönen sonuçlar
+    """
+    collected: List[Dict[str, str]] = []
+    token = _search_collector.set(collected)
+    try:
+        yield collected
+    finally:
+        _search_collector.reset(token)
+
 
 def search_web_simple(query: str, max_results: int = 5) -> List[Dict[str, str]]:
     """
@@ -35,23 +86,47 @@ def search_web_simple(query: str, max_results: int = 5) -> List[Dict[str, str]]:
     # Tip dönüşümü (Gemini bazen string gönderebilir)
     max_results = int(max_results)
     
+    results = _search(query, max_results)
+    
+    # Aktif toplayıcı varsa sonuçları ona da bildir
+    collector = _search_collector.get()
+    if collector is not None:
+        collector.extend(results)
+    
+    return results
+
+
+def _search(query: str, max_results: int) -> List[Dict[str, str]]:
+    """Tavily araması (önce cache, yoksa mock data)"""
+    
     print(f"  🔍 Web'de aranıyor: '{query}'")
     
     # Tavily API key kontrolü
     tavily_api_key = os.getenv('TAVILY_API_KEY')
     
     if tavily_api_key and tavily_api_key != 'your_tavily_api_key_here':
+        # Önce cache
+        cache = get_search_cache()
+        if cache:
+            cached = cache.get(query, max_results, SEARCH_DEPTH)
+            if cached is not None:
+                print(f"  ✅ {len(cached)} sonuç bulundu (cache)")
+                return cached
+        
         # Gerçek Tavily API kullan
         try:
-            from tavily import TavilyClient
-            
-            client = TavilyClient(api_key=tavily_api_key)
+            client = get_tavily_client(tavily_api_key)
             
-            # Arama yap
-            response = client.search(
-                query=query,
-                max_results=max_results,
-                search_depth="basic"  # "basic" veya "advanced"
+            # Arama yap (429/timeout tekrar denenir, devre açıksa hemen mock'a düşer)
+            response = retry_sync(
+                _tavily_search,
+                functools.partial(
+                    client.search,
+                    query=query,
+                    max_results=max_results,
+                    search_depth=SEARCH_DEPTH
+                ),
+                endpoint="tavily"
             )
             
             # Sonuçları formatla
@@ -63,6 +138,9 @@ def search_web_simple(query: str, max_results: int = 5) -> List[Dict[str, str]]:
                     'snippet': item.get('content', '')[:200]  # İlk 200 karakter
                 })
             
+            if cache:
+                cache.set(query, max_results, SEARCH_DEPTH, results)
+            
             print(f"  ✅ {len(results)} sonuç bulundu (Tavily API)")
             return results
             
@@ -78,6 +156,48 @@ def search_web_simple(query: str, max_results: int = 5) -> List[Dict[str, str]]:
         return _mock_search_results(query, max_results)
 
 
+def get_tavily_client(api_key: str) -> "TavilyClient":
+    """
+    API anahtarı için paylaşılan TavilyClient
+    
+    İstemci havuzlu bir requests.Session kullanır (research.search_pool_size
+    bağlantı); paralel alt başlıkların aramaları bağlantıları yeniden kullanır.
+    """
+    client = _tavily_clients.get(api_key)
+    if client is not None:
+        return client
+    
+    with _tavily_clients_lock:
+        client = _tavily_clients.get(api_key)
+        if client is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from tavily import TavilyClient
+            
+            from src.utils.config_loader import get_config
+            
+            pool_size = get_config('research.search_pool_size', 10)
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+            
+            client = TavilyClient(api_key=api_key, session=session)
+            _tavily_clients[api_key] = client
+    
+    return client
+
+
+def _tavily_search(search):
+    """Tek arama denemesi: rate limiter slotu al, hedge açıksa hedge'li çalıştır"""
+    limiter = get_rate_limiter("tavily")
+    limiter.acquire_sync()
+
+    hedger = get_hedger("tavily", "search")
+    if hedger is None:
+        return search()
+
+    return hedger.run_sync(search, try_acquire=hedge_acquirer(limiter))
+
+
 def _mock_search_results(query: str, max_results: int) -> List[Dict[str, str]]:
     """Mock search results (Tavily API olmadığında)"""
     time.sleep(0.5)  # Gerçekçi olsun diye
@@ -117,34 +237,33 @@ def _mock_search_results(query: str, max_results: int) -> List[Dict[str, str]]:
 
 def fetch_url_content_simple(url: str) -> str:
     """
-    Bir URL'in içeriğini getirir (şimdilik mock data)
+    Bir URL'in içeriğini getirir
+    
+    Önce tarayıcısız HTTP indirme denenir; sayfa JS ile render ediliyorsa
+    Crawl4AI tarayıcısına geçilir.
     
     Args:
         url: İndirilecek URL
         
     Returns:
-        Sayfa içeriği (metin)
+        Sayfa içeriği (Markdown metin)
     """
+    from src.tools.crawler_pool import CrawlerPool
     
     print(f"  🌐 Sayfa indiriliyor: {url}")
-    time.sleep(0.5)
     
-    # Mock içerik - Crawl4AI ekleyince gerçek içerik gelecek
-    mock_content = f"""
-    Bu sayfa {url} adresinden mock (sahte) içeriktir.
+    async def _fetch() -> Dict:
+        async with CrawlerPool.from_config() as pool:
+            return await pool.fetch(url)
     
-    Gerçek implementasyonda burada sayfanın tam içeriği olacak.
-    Şimdilik ajanın tool'ları nasıl kullandığını görmek için
-    bu mock data'yı kullanıyoruz.
+    result = asyncio.run(_fetch())
     
-    İleride:
-    - Crawl4AI ile gerçek sayfalar taranacak
-    - HTML temizlenip Markdown'a çevrilecek
-    - Sadece önemli içerik gelecek
-    """
+    if not result['success']:
+        print(f"  ⚠️  İçerik alınamadı: {result.get('error')}\n")
+        return f"İçerik alınamadı ({url}): {result.get('error')}"
     
-    print(f"  ✅ İçerik indirildi ({len(mock_content)} karakter)\n")
-    return mock_content.strip()
+    print(f"  ✅ İçerik indirildi ({len(result['content'])} karakter)\n")
+    return result['content']
 
 # Test fonksiyonu
 if __name__ == "__main__":
@@ -10,15 +10,16 @@ Kullanıcı dostu arayüz:
 """
 
 import streamlit as st
-import asyncio
 import sys
 import os
+import time
 from datetime import datetime
 
 # Proje root
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.workflow.orchestrator import ResearchOrchestrator
+from src.workflow.job_runner import get_job_runner
+from src.ui.stream_renderer import StreamRenderScheduler
 
 
 # =============================================================================
@@ -227,8 +228,12 @@ st.markdown("""
 # SESSION STATE
 # =============================================================================
 
-if 'orchestrator' not in st.session_state:
-    st.session_state.orchestrator = ResearchOrchestrator()
+# Arka plandaki araştırma işi (rerun'lar arasında korunur)
+if 'job_id' not in st.session_state:
+    st.session_state.job_id = None
+
+if 'job_events' not in st.session_state:
+    st.session_state.job_events = []
 
 if 'results' not in st.session_state:
     st.session_state.results = None
@@ -324,6 +329,8 @@ def main():
         if start_button:
             st.session_state.running = True
             st.session_state.results = None
+            st.session_state.job_id = None
+            st.session_state.job_events = []
             st.rerun()
     
     # Main content area
@@ -390,6 +397,7 @@ def show_research_progress(topic, context):
     # Config'den streaming ayarını al
     config = st.session_state.get('config', {})
     use_streaming = config.get('performance', {}).get('streaming_enabled', True)
+    stream_update_interval = config.get('performance', {}).get('stream_update_interval', 0.05)
     
     # Rapor container (her zaman tanımlı)
     st.markdown("---")
@@ -422,137 +430,136 @@ def show_research_progress(topic, context):
     </div>
     """, unsafe_allow_html=True)
     
-    # Run research
-    async def run_async():
-        logs = []
+    # Araştırma arka plandaki job runner'da çalışır; bu oturum yalnızca
+    # job_id'yi tutar ve ilerleme olaylarını poll eder (rerun işi yeniden başlatmaz)
+    runner = get_job_runner()
+    job = runner.get(st.session_state.job_id) if st.session_state.job_id else None
+    
+    if job is None:
+        st.session_state.job_id = runner.submit(topic, context, streaming=use_streaming)
+        st.session_state.job_events = []
+        job = runner.get(st.session_state.job_id)
+    
+    logs = []
+    outcome = {'results': None, 'error': None}
+    
+    # Stage badges
+    stage_badges = {
+        'planning': '<span class="stage-badge stage-planning">PLANLAMA</span>',
+        'researching': '<span class="stage-badge stage-researching">ARAŞTIRMA</span>',
+        'writing': '<span class="stage-badge stage-writing">RAPOR YAZIMI</span>',
+        'done': '<span class="stage-badge stage-done">TAMAMLANDI</span>'
+    }
+    
+    # Chunk'lar bölüm bazında ve stream_update_interval aralığıyla render edilir
+    report_renderer = StreamRenderScheduler(report_container, update_interval=stream_update_interval)
+    
+    def handle_update(update):
+        stage = update.get('stage')
+        update_type = update.get('type')
+        data = update.get('data', {})
         
-        def progress_callback(stage, progress):
-            progress_bar.progress(progress / 100)
-            
-            # Stage badge
-            stage_badges = {
-                'planning': '<span class="stage-badge stage-planning">PLANLAMA</span>',
-                'researching': '<span class="stage-badge stage-researching">ARAŞTIRMA</span>',
-                'writing': '<span class="stage-badge stage-writing">RAPOR YAZIMI</span>',
-                'done': '<span class="stage-badge stage-done">TAMAMLANDI</span>'
-            }
-            
-            stage_container.markdown(stage_badges.get(stage, ''), unsafe_allow_html=True)
-            status_text.text(f"{progress}% tamamlandı")
-            
-            logs.append(f"[{stage.upper()}] {progress}%")
+        # Update stage badge
+        if stage in stage_badges:
+            stage_container.markdown(stage_badges[stage], unsafe_allow_html=True)
+        
+        # Progress updates
+        if update_type == 'status':
+            message = data.get('message') or f"[{str(stage).upper()}] {data.get('progress', 0)}%"
+            logs.append(message)
             log_text.code("\n".join(logs[-20:]))  # Son 20 log
+            
+            if 'progress' in data:
+                progress_bar.progress(data['progress'] / 100)
+                concurrency = data.get('concurrency')
+                suffix = f" · eşzamanlılık {concurrency['in_flight']}/{concurrency['limit']}" if concurrency else ""
+                status_text.text(f"{data['progress']}% tamamlandı{suffix}")
         
-        # Streaming veya normal mode
-        if use_streaming:
-            # STREAMING MODE
-            full_report = ""
-            final_results = None
+        # Plan ready
+        elif update_type == 'plan':
+            logs.append(data.get('message', ''))
+            log_text.code("\n".join(logs[-20:]))
+        
+        # Research complete
+        elif update_type == 'research':
+            logs.append(data.get('message', ''))
+            log_text.code("\n".join(logs[-20:]))
+            # Araştırma tamamlandı, yazım başlıyor
+            report_container.markdown("""
+            <div style="background: linear-gradient(135deg, #ecfdf5 0%, #d1fae5 100%); border: 2px solid #6ee7b7; border-radius: 12px; padding: 32px; text-align: center;">
+                <div style="font-size: 1.2rem; font-weight: 700; color: #065f46; margin-bottom: 8px;">
+                    Araştırma Aşaması Tamamlandı
+                </div>
+                <div style="color: #047857; font-size: 0.95rem; line-height: 1.6;">
+                    Veri analizi sonuçlandı. Kapsamlı rapor oluşturuluyor...
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Report chunks (STREAMING!)
+        elif update_type == 'report_chunk':
+            chunk = data
             
-            # Stage badges
-            stage_badges = {
-                'planning': '<span class="stage-badge stage-planning">PLANLAMA</span>',
-                'researching': '<span class="stage-badge stage-researching">ARAŞTIRMA</span>',
-                'writing': '<span class="stage-badge stage-writing">RAPOR YAZIMI</span>',
-                'done': '<span class="stage-badge stage-done">TAMAMLANDI</span>'
-            }
+            # Metin chunk'ları - REAL-TIME RENDER (throttled)
+            if chunk['type'] in ['metadata', 'intro', 'section', 'conclusion']:
+                report_renderer.add(chunk)
             
-            async for update in st.session_state.orchestrator.run_research_streaming(
-                topic=topic,
-                context=context,
-                progress_callback=progress_callback
-            ):
-                stage = update.get('stage')
-                update_type = update.get('type')
-                data = update.get('data', {})
-                
-                # Update stage badge
-                if stage in stage_badges:
-                    stage_container.markdown(stage_badges[stage], unsafe_allow_html=True)
-                
-                # Progress updates
-                if update_type == 'status':
-                    message = data.get('message', '')
-                    logs.append(message)
-                    log_text.code("\n".join(logs[-20:]))
-                    
-                    if 'progress' in data:
-                        progress_bar.progress(data['progress'] / 100)
-                        status_text.text(f"{data['progress']}% tamamlandı")
-                
-                # Plan ready
-                elif update_type == 'plan':
-                    logs.append(data.get('message', ''))
-                    log_text.code("\n".join(logs[-20:]))
-                
-                # Research complete
-                elif update_type == 'research':
-                    logs.append(data.get('message', ''))
-                    log_text.code("\n".join(logs[-20:]))
-                    # Araştırma tamamlandı, yazım başlıyor
-                    report_container.markdown("""
-                    <div style="background: linear-gradient(135deg, #ecfdf5 0%, #d1fae5 100%); border: 2px solid #6ee7b7; border-radius: 12px; padding: 32px; text-align: center;">
-                        <div style="font-size: 1.2rem; font-weight: 700; color: #065f46; margin-bottom: 8px;">
-                            Araştırma Aşaması Tamamlandı
-                        </div>
-                        <div style="color: #047857; font-size: 0.95rem; line-height: 1.6;">
-                            Veri analizi sonuçlandı. Kapsamlı rapor oluşturuluyor...
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                # Report chunks (STREAMING!)
-                elif update_type == 'report_chunk':
-                    chunk = data
-                    
-                    # Metin chunk'ları - REAL-TIME RENDER
-                    if chunk['type'] in ['metadata', 'intro', 'section', 'conclusion']:
-                        full_report += chunk['content']
-                        # Update UI in real-time
-                        report_container.markdown(full_report)
-                    
-                    # Status updates from writer
-                    elif chunk['type'] == 'status':
-                        logs.append(chunk['content'])
-                        log_text.code("\n".join(logs[-20:]))
-                
-                # Final result
-                elif update_type == 'final':
-                    final_results = data
-                    logs.append(data.get('message', '✅ Tamamlandı!'))
-                    log_text.code("\n".join(logs[-20:]))
-                
-                # Error
-                elif update_type == 'error':
-                    raise Exception(data.get('error', 'Unknown error'))
+            # Status updates from writer
+            elif chunk['type'] == 'status':
+                report_renderer.flush()
+                logs.append(chunk['content'])
+                log_text.code("\n".join(logs[-20:]))
             
-            return final_results
+            # Canlı kalite skoru (bölüm sonlarında)
+            elif chunk['type'] == 'quality':
+                quality = chunk['content']
+                status_text.text(f"Kalite skoru: {quality['overall_score']}/100 ({quality['grade']})")
         
-        else:
-            # NORMAL MODE (non-streaming)
-            results = await st.session_state.orchestrator.run_research(
-                topic=topic,
-                context=context,
-                progress_callback=progress_callback
-            )
-            
-            return results
-    
-    # Asyncio event loop
-    try:
-        results = asyncio.run(run_async())
+        # Final result
+        elif update_type == 'final':
+            report_renderer.finish()
+            outcome['results'] = data
+            logs.append(data.get('message', '✅ Tamamlandı!'))
+            log_text.code("\n".join(logs[-20:]))
         
-        st.session_state.results = results
-        st.session_state.running = False
+        # Error
+        elif update_type == 'error':
+            outcome['error'] = data.get('error', 'Unknown error')
+    
+    # Rerun sonrası: bu işin önceki olaylarını yeniden uygula
+    for update in st.session_state.job_events:
+        handle_update(update)
+    
+    poll_interval = max(stream_update_interval, 0.05)
+    
+    while True:
+        # Bitiş durumu poll'dan önce okunur: son olaylar kaçırılmaz
+        finished = job.finished
         
-        st.success("Araştırma tamamlandı!")
+        updates = runner.poll(job.job_id)
+        st.session_state.job_events.extend(updates)
+        for update in updates:
+            handle_update(update)
         
-        # Auto rerun to show results
-        st.rerun()
+        if finished:
+            break
         
-    except Exception as e:
-        st.error(f"Hata: {e}")
-        st.session_state.running = False
+        time.sleep(poll_interval)
+    
+    st.session_state.job_id = None
+    st.session_state.job_events = []
+    st.session_state.running = False
+    
+    if outcome['error'] or job.status != 'done':
+        st.error(f"Hata: {outcome['error'] or job.error or job.status}")
+        return
+    
+    st.session_state.results = outcome['results'] or job.result
+    
+    st.success("Araştırma tamamlandı!")
+    
+    # Auto rerun to show results
+    st.rerun()
 
 
 def show_results(results):
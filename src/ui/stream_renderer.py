@@ -0,0 +1,153 @@
+"""
+Stream Renderer - Streaming Rapor için Throttled Render
+======================================================
+
+Writer'ın metin chunk'larını Streamlit'e verimli aktarır:
+
+- Rapor bölümlere (metadata, giriş, her bölüm, sonuç) ayrılır; her bölüm
+  kendi placeholder'ında render edilir
+- Tamamlanan bölüm son kez render edilip dondurulur, bir daha gönderilmez
+- Yalnızca yazılmakta olan bölüm yeniden render edilir, o da en fazla
+  update_interval'de bir (aradaki chunk'lar birleştirilir)
+
+Böylece her chunk'ta tüm raporu yeniden göndermenin O(n²) maliyeti yerine
+toplam render boyutu rapor uzunluğuyla doğrusal kalır.
+
+Ayar: config.yaml → performance.stream_update_interval
+"""
+
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Metin içeren writer chunk tipleri
+TEXT_CHUNK_TYPES = ('metadata', 'intro', 'section', 'conclusion')
+
+
+class StreamRenderScheduler:
+    """Bölüm bazlı, zaman aralığıyla birleştirilmiş rapor render'ı"""
+
+    def __init__(
+        self,
+        container,
+        update_interval: float = 0.05,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            container: Raporun yazılacağı Streamlit placeholder'ı (st.empty())
+            update_interval: Canlı bölümün iki render'ı arasındaki minimum süre (saniye)
+            clock: Zaman kaynağı (test için değiştirilebilir)
+        """
+        self.container = container
+        self.update_interval = update_interval
+        self.clock = clock
+
+        self._area = None
+        self._frozen: List[str] = []
+
+        self._live_key: Optional[Tuple] = None
+        self._live_placeholder = None
+        self._live_parts: List[str] = []
+        self._dirty = False
+        self._last_render = float('-inf')
+
+        # İstatistik (render sayısı ve gönderilen toplam karakter)
+        self.render_count = 0
+        self.rendered_chars = 0
+
+    def add(self, chunk: Dict):
+        """Writer metin chunk'ını ekle (diğer tipler yok sayılır)"""
+        if chunk.get('type') not in TEXT_CHUNK_TYPES:
+            return
+
+        key = (chunk['type'], chunk.get('section_number'))
+        if key != self._live_key:
+            self._freeze_live()
+            self._start_segment(key)
+
+        self._live_parts.append(chunk['content'])
+        self._dirty = True
+
+        if self.clock() - self._last_render >= self.update_interval:
+            self._render_live()
+
+    def flush(self):
+        """Bekleyen chunk'ları hemen render et"""
+        if self._dirty:
+            self._render_live()
+
+    def finish(self) -> str:
+        """Son bölümü dondur ve tam rapor metnini döndür"""
+        self._freeze_live()
+        return "".join(self._frozen)
+
+    def _start_segment(self, key: Tuple):
+        if self._area is None:
+            # Bekleme mesajının yerine bölüm placeholder'larını tutan alan
+            self._area = self.container.container()
+
+        self._live_key = key
+        self._live_placeholder = self._area.empty()
+        self._live_parts = []
+        self._dirty = False
+
+    def _freeze_live(self):
+        """Canlı bölümü son haliyle render et ve dondur"""
+        if self._live_key is None:
+            return
+
+        self.flush()
+        self._frozen.append("".join(self._live_parts))
+
+        self._live_key = None
+        self._live_placeholder = None
+        self._live_parts = []
+
+    def _render_live(self):
+        text = "".join(self._live_parts)
+        self._live_placeholder.markdown(text)
+
+        self._dirty = False
+        self._last_render = self.clock()
+        self.render_count += 1
+        self.rendered_chars += len(text)
+
+
+# Test (Streamlit olmadan, sahte placeholder ile)
+if __name__ == "__main__":
+
+    class FakePlaceholder:
+        def container(self):
+            return self
+
+        def empty(self):
+            return FakePlaceholder()
+
+        def markdown(self, text):
+            pass
+
+    # 20k kelimelik rapor: 10 bölüm × 2000 kelime, her chunk ~5 kelime, chunk arası 10ms
+    fake_time = [0.0]
+    chunks = [{'type': 'metadata', 'content': "# Test Raporu\n\n"}]
+    for section in range(1, 11):
+        for _ in range(400):
+            chunks.append({'type': 'section', 'section_number': section, 'content': "kelime " * 5})
+        chunks.append({'type': 'section', 'section_number': section, 'content': "\n\n"})
+
+    naive_chars = 0
+    full_report = ""
+    for chunk in chunks:
+        full_report += chunk['content']
+        naive_chars += len(full_report)
+
+    renderer = StreamRenderScheduler(FakePlaceholder(), update_interval=0.05, clock=lambda: fake_time[0])
+    for chunk in chunks:
+        fake_time[0] += 0.01
+        renderer.add(chunk)
+    report = renderer.finish()
+
+    print(f"Chunk sayısı: {len(chunks)}, rapor: {len(report.split()):,} kelime")
+    print(f"Her chunk'ta tüm rapor: {len(chunks):,} render, {naive_chars / 1e6:,.1f}M karakter")
+    print(f"StreamRenderScheduler:  {renderer.render_count:,} render, "
+          f"{renderer.rendered_chars / 1e6:,.1f}M karakter")
+    print(f"Rapor metni aynı: {report == full_report}")
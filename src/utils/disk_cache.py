@@ -0,0 +1,212 @@
+"""
+Disk Cache - SQLite Tabanlı Kalıcı Cache
+========================================
+
+Arama ve LLM cache'lerinin ortak disk backend'i.
+
+- JSON serileştirilebilir değerler
+- TTL (süresi dolan kayıtlar okunmaz ve silinir)
+- Boyut limiti aşılınca LRU eviction (en eski erişilen kayıt önce)
+- Hit/miss sayaçları
+- Thread-safe (tek bağlantı + lock), WAL modu (çoklu süreç)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+# Cache dizini (config: cache.dir, proje köküne göre)
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+def get_cache_dir() -> Path:
+    """config.yaml'daki cache dizini (yoksa oluşturur)"""
+    from src.utils.config_loader import get_config
+
+    cache_dir = Path(get_config('cache.dir', 'cache'))
+    if not cache_dir.is_absolute():
+        cache_dir = PROJECT_ROOT / cache_dir
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+class DiskCache:
+    """TTL + LRU + boyut limitli SQLite cache"""
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float = 24 * 3600,
+        max_size_bytes: int = 100 * 1024 * 1024
+    ):
+        """
+        Args:
+            path: SQLite dosya yolu
+            ttl_seconds: Kayıt ömrü (saniye)
+            max_size_bytes: Maksimum toplam değer boyutu
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_bytes
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path),
+            check_same_thread=False,
+            isolation_level=None  # autocommit
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at)"
+        )
+
+        # Toplam boyut tahmini (her set'te SUM sorgusu yapmamak için)
+        self._size_bytes = self._query_total_size()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Kayıt varsa ve süresi dolmadıysa değeri döndür"""
+
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, size, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, size, created_at = row
+
+            if now - created_at > self.ttl_seconds:
+                # Süresi dolmuş
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._size_bytes -= size
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+
+        return json.loads(value)
+
+    def set(self, key: str, value: Any):
+        """Değeri kaydet (gerekirse eski kayıtları çıkar)"""
+
+        payload = json.dumps(value, ensure_ascii=False)
+        size = len(payload.encode('utf-8'))
+
+        if size > self.max_size_bytes:
+            logger.debug(f"Cache kaydı limitten büyük, atlanıyor ({size} byte)")
+            return
+
+        now = time.time()
+
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, payload, size, now, now)
+            )
+            self._size_bytes += size - (old[0] if old else 0)
+
+            if self._size_bytes > self.max_size_bytes:
+                self._evict(now)
+
+    def _evict(self, now: float):
+        """Önce süresi dolanları, sonra LRU sırasıyla limit altına inene kadar sil"""
+
+        self._conn.execute(
+            "DELETE FROM entries WHERE created_at < ?", (now - self.ttl_seconds,)
+        )
+        self._size_bytes = self._query_total_size()
+
+        # Limitin %90'ına in (her set'te tekrar eviction olmasın)
+        target = int(self.max_size_bytes * 0.9)
+        evicted = 0
+
+        while self._size_bytes > target:
+            rows = self._conn.execute(
+                "SELECT key, size FROM entries ORDER BY accessed_at LIMIT 100"
+            ).fetchall()
+            if not rows:
+                break
+
+            for key, size in rows:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._size_bytes -= size
+                evicted += 1
+                if self._size_bytes <= target:
+                    break
+
+        if evicted:
+            logger.debug(f"Cache eviction: {evicted} kayıt silindi ({self.path.name})")
+
+    def _query_total_size(self) -> int:
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return row[0]
+
+    def clear(self):
+        """Tüm kayıtları sil"""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._size_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache istatistikleri"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0,
+            'entries': entries,
+            'size_bytes': self._size_bytes
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Test
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DiskCache(Path(tmp) / "test.sqlite", ttl_seconds=60, max_size_bytes=2000)
+
+        for i in range(30):
+            cache.set(f"key-{i}", {"i": i, "payload": "x" * 50})
+
+        print("key-0:", cache.get("key-0"))     # LRU ile silinmiş olmalı
+        print("key-29:", cache.get("key-29"))
+        print("Stats:", cache.stats())
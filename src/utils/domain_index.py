@@ -0,0 +1,111 @@
+"""
+Domain Index - Ters Etiketli Suffix Trie
+========================================
+
+Domain listelerinde (güvenilir / düşük güvenilir) hızlı ve doğru eşleşme.
+
+- Etiketler sağdan sola trie'ye eklenir: "arxiv.org" → org → arxiv
+- Eşleşme yalnızca etiket sınırında olur: "evil-arxiv.org.example"
+  arxiv.org ile EŞLEŞMEZ, "export.arxiv.org" eşleşir
+- Birden fazla suffix eşleşirse en uzun (en spesifik) olan kazanır
+- Arama O(etiket sayısı); netloc başına LRU memo
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Trie düğümünde değerin tutulduğu anahtar (etiketler asla boş string değildir)
+_VALUE = ""
+
+
+def normalize_host(netloc: str) -> str:
+    """
+    netloc'tan karşılaştırılabilir host adı çıkar
+
+    "User@WWW.Example.com:8080." → "www.example.com"
+    """
+    host = netloc.rpartition('@')[2]
+
+    if host.startswith('['):
+        # IPv6 literal
+        return host.split(']')[0].lstrip('[').lower()
+
+    return host.split(':')[0].rstrip('.').lower()
+
+
+def normalize_suffix(suffix: str) -> str:
+    """Liste girdisini normalize et (".edu" → "edu")"""
+    return suffix.strip().strip('.').lower()
+
+
+class DomainSuffixIndex:
+    """Registered-domain suffix'leri için ters etiketli trie"""
+
+    def __init__(self, entries: Optional[Dict[str, Any]] = None, memo_size: int = 4096):
+        """
+        Args:
+            entries: {suffix: değer} (örn. {"arxiv.org": 36, ".edu": 38})
+            memo_size: netloc başına LRU memo boyutu
+        """
+        self._root: Dict[str, Any] = {}
+        self._size = 0
+
+        # lookup sonuçları netloc bazında hatırlanır
+        self.lookup = lru_cache(maxsize=memo_size)(self._lookup)
+
+        for suffix, value in (entries or {}).items():
+            self.add(suffix, value)
+
+    def add(self, suffix: str, value: Any):
+        """Suffix ekle (varsa değeri güncellenir)"""
+        labels = normalize_suffix(suffix).split('.')
+        if labels == ['']:
+            raise ValueError(f"Geçersiz domain suffix: {suffix!r}")
+
+        node = self._root
+        for label in reversed(labels):
+            node = node.setdefault(label, {})
+
+        if _VALUE not in node:
+            self._size += 1
+        node[_VALUE] = value
+
+        self.lookup.cache_clear()
+
+    def _lookup(self, netloc: str) -> Optional[Any]:
+        """Host'a eşleşen en uzun suffix'in değeri (yoksa None)"""
+        match = self.match(netloc)
+        return match[1] if match else None
+
+    def match(self, netloc: str) -> Optional[Tuple[str, Any]]:
+        """En uzun eşleşen (suffix, değer) çifti (yoksa None)"""
+        host = normalize_host(netloc)
+        if not host:
+            return None
+
+        labels = host.split('.')
+        node = self._root
+        best = None
+
+        for depth, label in enumerate(reversed(labels), 1):
+            node = node.get(label)
+            if node is None:
+                break
+            if _VALUE in node:
+                best = ('.'.join(labels[-depth:]), node[_VALUE])
+
+        return best
+
+    def __len__(self) -> int:
+        return self._size
+
+
+# Test
+if __name__ == "__main__":
+    index = DomainSuffixIndex({'arxiv.org': 'arxiv', '.edu': 'edu', 'gov.tr': 'gov.tr', 'tubitak.gov.tr': 'tubitak'})
+
+    for netloc in [
+        'arxiv.org', 'export.arxiv.org', 'evil-arxiv.org.example', 'www.mit.edu',
+        'tubitak.gov.tr', 'www.meb.gov.tr', 'user@ARXIV.ORG:443', 'example.com'
+    ]:
+        print(f"{netloc:30} → {index.lookup(netloc)}")
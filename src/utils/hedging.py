@@ -0,0 +1,324 @@
+"""
+Hedging - Kuyruk Gecikmesi İçin Yedek İstek
+==========================================
+
+Bir çağrı, aynı tür çağrıların gözlenen p90 gecikmesi içinde dönmezse
+aynı isteğin bir kopyası gönderilir ve önce başarıyla dönen kullanılır.
+Tek bir yavaş Gemini/Tavily yanıtının bütün araştırma aşamasını
+bekletmesini (gather en yavaşı bekler) önler.
+
+- Gecikmeler çağrı türü başına (örn. "gemini:writer", "tavily:search")
+  kayan pencerede tutulur; yeterli örnek yoksa hedge yapılmaz
+- Yedek istek rate limiter'dan beklemeden slot alabiliyorsa gider
+  (try_acquire); kota doluysa ilk isteğin bitmesi beklenir. Günlük
+  kotanın daily_reserve_ratio kadarı asıl isteklere ayrılır
+- Yedek istek oranı max_hedge_ratio ile sınırlı (örn. çağrıların %10'u)
+- Yedek istekler ayrı, sınırlı bir thread pool'da çalışır (async asıl
+  istek çağıranın pool'unda kalır, onun eşzamanlılık sınırına tabidir);
+  kaybeden çağrı thread'inde tamamlanır (gecikmesi yine kaydedilir),
+  sonucu atılır
+
+Yalnızca yan etkisiz çağrılar hedge'lenir (generate_content, Tavily
+araması); chat.send_message oturum geçmişini değiştirdiği için hedge'lenmez.
+
+Ayarlar: config.yaml → hedging (varsayılan kapalı; agents: çağrı türü
+başına aç/kapa)
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from loguru import logger
+
+
+class RequestHedger:
+    """Bir çağrı türü için gecikme takibi ve hedge kararı (thread-safe)"""
+
+    def __init__(
+        self,
+        name: str,
+        percentile: float = 90,
+        min_samples: int = 10,
+        window: int = 200,
+        max_hedge_ratio: float = 0.1,
+        min_delay_seconds: float = 0.5
+    ):
+        """
+        Args:
+            name: Çağrı türü ("gemini:researcher", "tavily:search", ...)
+            percentile: Bu yüzdelik gecikmede dönmeyen çağrı hedge'lenir
+            min_samples: Hedge için gereken minimum gecikme örneği
+            window: Tutulan son gecikme sayısı
+            max_hedge_ratio: Yedek isteklerin çağrılara oranı üst sınırı
+            min_delay_seconds: Hedge gecikmesinin alt sınırı
+        """
+        self.name = name
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_delay_seconds = min_delay_seconds
+
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def record(self, latency: float):
+        with self._lock:
+            self._latencies.append(latency)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Yedek isteğin gönderileceği gecikme (yeterli örnek yoksa None)"""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+
+            ordered = sorted(self._latencies)
+            rank = max(math.ceil(self.percentile / 100 * len(ordered)) - 1, 0)
+            return max(ordered[rank], self.min_delay_seconds)
+
+    def _allow_hedge(self, try_acquire: Optional[Callable[[], bool]]) -> bool:
+        """Hedge bütçesi (oran) ve rate limiter müsaitse yedek isteğe izin ver"""
+        with self._lock:
+            if self.hedges + 1 > self.max_hedge_ratio * self.calls:
+                return False
+
+        if try_acquire is not None and not try_acquire():
+            return False
+
+        with self._lock:
+            self.hedges += 1
+        return True
+
+    def _timed(self, call: Callable[[], Any]) -> Any:
+        started = time.monotonic()
+        result = call()
+        self.record(time.monotonic() - started)
+        return result
+
+    async def run_async(
+        self,
+        call: Callable[[], Any],
+        try_acquire: Optional[Callable[[], bool]] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+        backup_executor: Optional[concurrent.futures.Executor] = None
+    ) -> Any:
+        """
+        call()'ı executor'da çalıştır - p90 içinde dönmezse kopyasını başlat,
+        ilk başarılıyı döndür
+
+        Asıl istek executor'da (çağıranın pool'u; eşzamanlılık sınırı
+        korunur), yedek istek backup_executor'da (varsayılan: hedge pool'u)
+        çalışır. İptal edilen asyncio future'ı thread'i durdurmaz: kaybeden
+        istek kendi pool'unda tamamlanır ve gecikmesi thread içinde
+        ölçüldüğü için bitince yine kaydedilir (yavaş çağrılar p90'dan
+        düşmez).
+
+        Args:
+            call: Her çağrıldığında yeni bir istek yapan (bloklayan) fonksiyon
+            try_acquire: Yedek istek için beklemesiz rate limiter slotu
+            executor: Asıl isteğin çalışacağı executor (None → hedge pool'u)
+            backup_executor: Yedek isteğin çalışacağı executor (None → hedge pool'u)
+        """
+        with self._lock:
+            self.calls += 1
+
+        delay = self.hedge_delay()
+        loop = asyncio.get_running_loop()
+
+        def submit(pool):
+            ctx = contextvars.copy_context()
+            return loop.run_in_executor(
+                pool or get_hedge_executor(), functools.partial(ctx.run, self._timed, call)
+            )
+
+        primary = submit(executor)
+        if delay is None:
+            return await primary
+
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not self._allow_hedge(try_acquire):
+            return await primary
+
+        logger.debug(f"Hedge ({self.name}): {delay:.1f}s içinde yanıt yok, yedek istek gönderildi")
+        backup = submit(backup_executor)
+        pending = {primary, backup}
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is backup:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    for other in pending:
+                        other.cancel()
+                    return future.result()
+
+        # İkisi de başarısız: asıl isteğin hatası (retry kararı onun üzerinden)
+        return primary.result()
+
+    def run_sync(
+        self,
+        call: Callable[[], Any],
+        try_acquire: Optional[Callable[[], bool]] = None,
+        executor: Optional[concurrent.futures.Executor] = None
+    ) -> Any:
+        """
+        run_async'in senkron karşılığı
+
+        İstekler ayrı bir executor'da (varsayılan: hedge pool'u) çalışır;
+        çağıranın kendi pool'unda çalışan kod (örn. tool çağrısındaki arama)
+        aynı pool'u beklemeye düşmez.
+        """
+        with self._lock:
+            self.calls += 1
+
+        delay = self.hedge_delay()
+        if delay is None:
+            return self._timed(call)
+
+        pool = executor or get_hedge_executor()
+
+        def submit():
+            ctx = contextvars.copy_context()
+            return pool.submit(functools.partial(ctx.run, self._timed, call))
+
+        primary = submit()
+        done, _ = concurrent.futures.wait([primary], timeout=delay)
+        if done or not self._allow_hedge(try_acquire):
+            return primary.result()
+
+        logger.debug(f"Hedge ({self.name}): {delay:.1f}s içinde yanıt yok, yedek istek gönderildi")
+        backup = submit()
+
+        for future in concurrent.futures.as_completed([primary, backup]):
+            if future.exception() is None:
+                if future is backup:
+                    with self._lock:
+                        self.hedge_wins += 1
+                return future.result()
+
+        return primary.result()
+
+    def stats(self) -> Dict:
+        hedge_delay = self.hedge_delay()
+        return {
+            'calls': self.calls,
+            'hedges': self.hedges,
+            'hedge_wins': self.hedge_wins,
+            'hedge_delay_seconds': round(hedge_delay, 2) if hedge_delay is not None else None
+        }
+
+
+# Çağrı türü başına hedger'lar ve sync yedek istekler için ortak executor
+_hedgers: Dict[str, RequestHedger] = {}
+_hedgers_lock = threading.Lock()
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+
+def get_hedger(endpoint: str, agent: Optional[str]) -> Optional[RequestHedger]:
+    """
+    endpoint/agent çağrıları için hedger (hedging kapalıysa None)
+
+    config.yaml → hedging.enabled ve hedging.agents.<agent>
+    """
+    from src.utils.config_loader import get_config
+
+    if not agent or not get_config('hedging.enabled', False):
+        return None
+    if not get_config(f'hedging.agents.{agent}', False):
+        return None
+
+    name = f"{endpoint}:{agent}"
+    hedger = _hedgers.get(name)
+    if hedger is None:
+        with _hedgers_lock:
+            hedger = _hedgers.get(name)
+            if hedger is None:
+                hedger = RequestHedger(
+                    name,
+                    percentile=get_config('hedging.percentile', 90),
+                    min_samples=get_config('hedging.min_samples', 10),
+                    max_hedge_ratio=get_config('hedging.max_hedge_ratio', 0.1),
+                    min_delay_seconds=get_config('hedging.min_delay_seconds', 0.5)
+                )
+                _hedgers[name] = hedger
+
+    return hedger
+
+
+def hedge_acquirer(limiter) -> Callable[[], bool]:
+    """
+    Yedek istekler için limiter slotu alan fonksiyon
+
+    Günlük kotası olan limiter'da kotanın hedging.daily_reserve_ratio kadarı
+    asıl isteklere ayrılır; yedek istekler günlük kotayı tüketemez.
+    """
+    from src.utils.config_loader import get_config
+
+    reserve = 0
+    if limiter.requests_per_day:
+        reserve = math.ceil(get_config('hedging.daily_reserve_ratio', 0.5) * limiter.requests_per_day)
+
+    return functools.partial(limiter.try_acquire, daily_reserve=reserve)
+
+
+def get_hedge_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Hedge'lenmiş isteklerin (sync ve async) çalıştığı paylaşılan thread pool"""
+    global _executor
+
+    if _executor is None:
+        with _hedgers_lock:
+            if _executor is None:
+                from src.utils.config_loader import get_config
+
+                _executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=get_config('hedging.max_workers', 8),
+                    thread_name_prefix="hedge"
+                )
+
+    return _executor
+
+
+def hedge_stats() -> Dict[str, Dict]:
+    """Tüm çağrı türlerinin hedge istatistikleri"""
+    return {name: hedger.stats() for name, hedger in _hedgers.items()}
+
+
+# Test (sahte gecikmelerle: %5 çağrı 2s takılıyor)
+if __name__ == "__main__":
+    import random
+
+    random.seed(7)
+    hedger = RequestHedger("demo", min_samples=20, max_hedge_ratio=0.2, min_delay_seconds=0.01)
+
+    def fake_call():
+        time.sleep(2.0 if random.random() < 0.05 else random.uniform(0.02, 0.05))
+        return "ok"
+
+    async def demo(hedged: bool):
+        latencies = []
+        for _ in range(200):
+            started = time.monotonic()
+            if hedged:
+                await hedger.run_async(fake_call)
+            else:
+                fake_call()
+            latencies.append(time.monotonic() - started)
+        latencies.sort()
+        return latencies[98], latencies[197]
+
+    baseline = asyncio.run(demo(False))
+    hedged = asyncio.run(demo(True))
+    print(f"Hedge'siz  p99: {baseline[1]:.2f}s")
+    print(f"Hedge'li   p99: {hedged[1]:.2f}s")
+    print(f"İstatistik: {hedger.stats()}")
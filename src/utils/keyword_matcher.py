@@ -0,0 +1,236 @@
+"""
+Keyword Matcher - Çoklu Anahtar Kelime Sayımı
+=============================================
+
+SourceScorer ve QualityMetrics'in gösterge listelerini (akademik, referans,
+detay göstergeleri) metin üzerinde tek geçişte sayar.
+
+- Türkçe/İngilizce harf katlama: metin bir kez küçültülür, "İ", "I", "ı"
+  hepsi "i" olur ("İSTANBUL" → "istanbul", "ANALİZ" → "analiz")
+- Tüm anahtar kelimeler için tek otomat, metin üzerinde tek lineer geçiş
+  (örtüşen eşleşmeler dahil her geçiş sayılır)
+- Akış (streaming) desteği: KeywordStream chunk sınırlarını aşan
+  eşleşmeleri de sayar
+
+Backend: pyahocorasick kuruluysa C Aho-Corasick otomatı, değilse tüm
+kelimeleri tek regex'te birleştiren lookahead alternation.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick opsiyonel: regex backend kullanılır
+    ahocorasick = None
+
+
+def fold_text(text: str) -> str:
+    """
+    Türkçe/İngilizce karşılaştırma için harf katlama
+
+    str.lower() "İ"yi "i̇" (i + birleşik nokta) yapar ve "ı"yı korur;
+    ikisi de "i"ye indirgenir.
+    """
+    return text.lower().replace('i̇', 'i').replace('ı', 'i')
+
+
+class KeywordMatcher:
+    """Anahtar kelime listesinden derlenen tek geçişli sayıcı"""
+
+    def __init__(self, keywords: Iterable[str], backend: Optional[str] = None):
+        """
+        Args:
+            keywords: Sayılacak kelimeler/ifadeler (büyük-küçük harf duyarsız)
+            backend: "pyahocorasick" veya "regex" (None = kuruluysa pyahocorasick)
+        """
+        # Katlanmış form → listedeki orijinal yazımlar
+        self._originals: Dict[str, List[str]] = {}
+        for keyword in keywords:
+            folded = fold_text(keyword)
+            if folded:
+                self._originals.setdefault(folded, []).append(keyword)
+
+        if not self._originals:
+            raise ValueError("KeywordMatcher en az bir anahtar kelime gerektirir")
+
+        self.keywords = list(self._originals)
+        self.max_length = max(len(k) for k in self.keywords)
+
+        if backend is None:
+            backend = "pyahocorasick" if ahocorasick is not None else "regex"
+
+        if backend == "pyahocorasick":
+            if ahocorasick is None:
+                raise ImportError("pyahocorasick yüklü değil")
+
+            self._automaton = ahocorasick.Automaton()
+            for folded in self.keywords:
+                self._automaton.add_word(folded, folded)
+            self._automaton.make_automaton()
+        elif backend == "regex":
+            # Her konumda en uzun eşleşme bulunur; aynı konumdan başlayan
+            # daha kısa kelimeler onun önekleridir
+            self._pattern = re.compile(
+                '(?=(' + '|'.join(
+                    re.escape(k) for k in sorted(self.keywords, key=len, reverse=True)
+                ) + '))'
+            )
+            self._prefixes = {
+                keyword: [other for other in self.keywords if keyword.startswith(other)]
+                for keyword in self.keywords
+            }
+        else:
+            raise ValueError(f"Bilinmeyen backend: {backend}")
+
+        self.backend = backend
+
+    def _scan(self, folded: str) -> Iterator[Tuple[str, int]]:
+        """Katlanmış metindeki tüm eşleşmeler: (kelime, bitiş indeksi)"""
+        if self.backend == "pyahocorasick":
+            for end, keyword in self._automaton.iter(folded):
+                yield keyword, end + 1
+            return
+
+        for match in self._pattern.finditer(folded):
+            start = match.start()
+            for keyword in self._prefixes[match.group(1)]:
+                yield keyword, start + len(keyword)
+
+    def _expand(self, folded_counts: Dict[str, int]) -> Dict[str, int]:
+        """Katlanmış sayımları listedeki orijinal yazımlara aç"""
+        return {
+            original: count
+            for folded, count in folded_counts.items()
+            for original in self._originals[folded]
+        }
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Her anahtar kelimenin metindeki geçiş sayısı (geçmeyenler 0)"""
+        counts = dict.fromkeys(self.keywords, 0)
+
+        for keyword, _ in self._scan(fold_text(text)):
+            counts[keyword] += 1
+
+        return self._expand(counts)
+
+    def present(self, text: str) -> Set[str]:
+        """Metinde en az bir kez geçen anahtar kelimeler (hepsi bulununca durur)"""
+        found = set()
+
+        for keyword, _ in self._scan(fold_text(text)):
+            found.add(keyword)
+            if len(found) == len(self.keywords):
+                break
+
+        return {original for folded in found for original in self._originals[folded]}
+
+    def contains_any(self, text: str) -> bool:
+        """Metinde herhangi bir anahtar kelime geçiyor mu (ilk eşleşmede durur)"""
+        return next(self._scan(fold_text(text)), None) is not None
+
+    def total(self, text: str) -> int:
+        """Tüm anahtar kelimelerin toplam geçiş sayısı"""
+        return sum(1 for _ in self._scan(fold_text(text)))
+
+    def stream(self) -> "KeywordStream":
+        """Chunk chunk beslenen sayaç"""
+        return KeywordStream(self)
+
+
+class KeywordStream:
+    """
+    Akış halinde gelen metin için sayım durumu
+
+    Önceki chunk'ın son (max_length - 1) karakteri saklanır; yeni chunk
+    bununla birlikte taranır, tamamı eski metinde kalan eşleşmeler atlanır.
+    """
+
+    def __init__(self, matcher: KeywordMatcher):
+        self.matcher = matcher
+        self._counts = dict.fromkeys(matcher.keywords, 0)
+        self._tail = ""
+
+    def feed(self, chunk: str):
+        """Yeni metin parçasını say"""
+        if not chunk:
+            return
+
+        window = self._tail + fold_text(chunk)
+        tail_length = len(self._tail)
+
+        for keyword, end in self.matcher._scan(window):
+            if end > tail_length:
+                self._counts[keyword] += 1
+
+        keep = self.matcher.max_length - 1
+        self._tail = window[-keep:] if keep else ""
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        return self.matcher._expand(self._counts)
+
+    @property
+    def total(self) -> int:
+        return sum(self._counts.values())
+
+
+# =============================================================================
+# BENCHMARK (100k kelimelik rapor)
+# =============================================================================
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    DETAIL_INDICATORS = [
+        'örneğin', 'specifically', 'detailed', 'analysis',
+        'bulgu', 'veri', 'data', 'research shows'
+    ]
+
+    random.seed(0)
+    filler = (
+        "yapay zeka modeli için bir ve çalışma sistemleri sonuç kapsamlı "
+        "değerlendirme the model network of and İstanbul IŞIK Öğrenme"
+    ).split()
+    indicator_spellings = ['Örneğin', 'specifically', 'detailed', 'ANALYSIS', 'bulgu', 'VERİ', 'data', 'research shows']
+
+    def make_report(indicator_ratio: float) -> str:
+        return " ".join(
+            random.choice(indicator_spellings) if random.random() < indicator_ratio else random.choice(filler)
+            for _ in range(100_000)
+        )
+
+    def timed(func, repeat=5):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start)
+        return result, best * 1000
+
+    backends = ["pyahocorasick", "regex"] if ahocorasick is not None else ["regex"]
+
+    for label, ratio in [("seyrek, kelimelerin %1'i gösterge", 0.01), ("yoğun, kelimelerin %30'u gösterge", 0.30)]:
+        report = make_report(ratio)
+
+        baseline, baseline_ms = timed(
+            lambda: sum(report.lower().count(indicator) for indicator in DETAIL_INDICATORS)
+        )
+        print(f"\nRapor: 100k kelime, {len(report):,} karakter ({label})")
+        print(f"  {'lower().count × 8 (eski)':32} {baseline:6} eşleşme  {baseline_ms:7.1f} ms")
+
+        for backend in backends:
+            matcher = KeywordMatcher(DETAIL_INDICATORS, backend=backend)
+            total, elapsed_ms = timed(lambda: matcher.total(report))
+            print(f"  {'KeywordMatcher (' + backend + ')':32} {total:6} eşleşme  {elapsed_ms:7.1f} ms"
+                  f"  ({baseline_ms / elapsed_ms:.1f}x)")
+
+    # Streaming: 40 karakterlik chunk'lar tek seferde saymayla aynı sonucu vermeli
+    for backend in backends:
+        matcher = KeywordMatcher(DETAIL_INDICATORS, backend=backend)
+        stream = matcher.stream()
+        for i in range(0, len(report), 40):
+            stream.feed(report[i:i + 40])
+        print(f"\nStreaming ({backend}, 40 karakter chunk): {stream.total} eşleşme "
+              f"({'tutarlı' if stream.counts == matcher.count(report) else 'TUTARSIZ'})")
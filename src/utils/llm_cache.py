@@ -0,0 +1,91 @@
+"""
+LLM Cache - İçerik Adresli Yanıt Cache'i
+========================================
+
+Aynı model + system instruction + generation_config + prompt için Gemini'ye
+tekrar gitmez. Çökme sonrası veya bağlam küçük değiştiğinde yeniden
+çalıştırılan raporlar değişmeyen tüm çağrıları buradan alır.
+
+Anahtar: SHA-256(model, system_instruction, generation_config, prompt)
+Ayarlar: config.yaml → cache (enabled, llm_responses, ttl_hours, max_cache_size_mb)
+"""
+
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional
+
+from src.utils.disk_cache import DiskCache, get_cache_dir
+
+
+class CachedResponse:
+    """Cache'ten dönen yanıt (GenerateContentResponse gibi .text sunar)"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def __repr__(self):
+        return f"CachedResponse({len(self.text)} karakter)"
+
+
+class LLMResponseCache:
+    """Gemini yanıtları için disk cache"""
+
+    def __init__(self, disk_cache: DiskCache):
+        self.disk_cache = disk_cache
+
+    @staticmethod
+    def make_key(
+        model_name: str,
+        system_instruction: Optional[str],
+        generation_config: Optional[Dict[str, Any]],
+        prompt: str
+    ) -> str:
+        """Çağrıyı belirleyen tüm girdilerin hash'i"""
+        material = json.dumps(
+            {
+                'model': model_name,
+                'system_instruction': system_instruction,
+                'generation_config': generation_config or {},
+                'prompt_sha256': hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+            },
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Cache'teki yanıt metni (yoksa None)"""
+        return self.disk_cache.get(key)
+
+    def set(self, key: str, text: str):
+        self.disk_cache.set(key, text)
+
+    def stats(self) -> Dict:
+        return self.disk_cache.stats()
+
+
+# Süreç genelinde tek instance
+_llm_cache: Optional[LLMResponseCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Paylaşılan LLM cache'ini döndür (kapalıysa None)"""
+    global _llm_cache
+
+    from src.utils.config_loader import get_config
+
+    if not (get_config('cache.enabled', False) and get_config('cache.llm_responses', True)):
+        return None
+
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = LLMResponseCache(DiskCache(
+                    path=get_cache_dir() / "llm_cache.sqlite",
+                    ttl_seconds=get_config('cache.ttl_hours', 24) * 3600,
+                    max_size_bytes=int(get_config('cache.max_cache_size_mb', 100) * 1024 * 1024)
+                ))
+
+    return _llm_cache
@@ -0,0 +1,350 @@
+"""
+LLM Gateway - Ortak Gemini İstemci Katmanı
+==========================================
+
+Tüm ajanların Gemini çağrılarını yaptığı tek nokta.
+
+- Async çağrılar sınırlı bir thread pool'da çalışır → event loop bloklanmaz,
+  Semaphore(max_concurrent_requests) gerçekten N çağrıyı aynı anda uçurur.
+  Adaptif eşzamanlılık açıkken pool, araştırma limitinin büyüyebileceği
+  scheduling.concurrency_max boyutuna kadar açılır
+- Her çağrıdan (ve her tekrar denemeden) önce paylaşılan rate limiter'dan
+  token alınır
+- Geçici hatalar (429, 5xx, timeout) retry_helper ile tekrar denenir;
+  "gemini" devre kesicisi açıksa çağrılar beklemeden düşer
+- Senkron kod yolları (planner, writer) için sync karşılıklar
+- create_model ile oluşturulan modellerin yanıtları LLM cache'inden
+  okunabilir (çağrı bazında use_cache=False ile kapatılır). Örneklemeli
+  (temperature > 0 ya da belirtilmemiş → Gemini varsayılanı) modellerin
+  yanıtları yalnızca use_cache=True ile cache'lenir; rapor akışının
+  tekrarlanabilir çağrıları (plan, sentez, perspektifler, rapor
+  parçaları) bunu açıkça ister
+- create_model(agent=...) ile etiketlenen modellerin generate çağrıları,
+  hedging.agents'ta açıksa p90 gecikmede yedek istekle hedge'lenir
+- create_model bir model kaydıdır: aynı (model, system_instruction,
+  generation_config, agent) için süreç boyunca tek GenerativeModel döner
+
+Not: SDK'nın *_async metodları yerine executor kullanılıyor; automatic
+function calling tool'ları (search_web_simple) senkron olduğundan async
+yolda da event loop'u bloklardı.
+"""
+
+import asyncio
+import contextvars
+import functools
+import json
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import google.generativeai as genai
+from loguru import logger
+
+from src.utils.hedging import get_hedger, hedge_acquirer
+from src.utils.llm_cache import CachedResponse, get_llm_cache
+from src.utils.rate_limiter import get_rate_limiter
+from src.utils.retry_helper import retry_async, retry_sync
+
+# Devre kesici / retry endpoint adı
+GEMINI_ENDPOINT = "gemini"
+
+
+class LLMGateway:
+    """Gemini çağrıları için paylaşılan async/sync gateway"""
+
+    def __init__(self, max_workers: int = 5):
+        """
+        Args:
+            max_workers: Aynı anda uçuşta olabilecek maksimum LLM çağrısı
+        """
+        self.max_workers = max_workers
+        self.rate_limiter = get_rate_limiter()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="llm-gateway"
+        )
+        # model -> (model_name, system_instruction, generation_config)
+        self._model_specs = weakref.WeakKeyDictionary()
+        # model -> ajan adı (hedging ayarı için)
+        self._model_agents = weakref.WeakKeyDictionary()
+        # (model_name, system_instruction, generation_config, agent) -> model
+        self._models: Dict[Tuple, Any] = {}
+        self._models_lock = threading.Lock()
+
+    def create_model(
+        self,
+        model_name: str,
+        system_instruction: Optional[str] = None,
+        generation_config: Optional[Dict[str, Any]] = None,
+        tools: Optional[List[Callable]] = None,
+        agent: Optional[str] = None
+    ):
+        """
+        Yapılandırılmış GenerativeModel döndür (kayıtta varsa aynı nesne)
+
+        Aynı yapılandırma her çağrıda yeniden kurulmaz; model nesneleri
+        thread'ler arasında paylaşılabilir. Tool'lu modeller (automatic
+        function calling) kayda alınmaz ve yanıtları cache'lenmez.
+
+        Args:
+            agent: Modeli kullanan ajan (config.yaml → hedging.agents)
+        """
+        if tools:
+            return self._build_model(model_name, system_instruction, generation_config, tools, agent)
+
+        key = (
+            model_name,
+            system_instruction,
+            json.dumps(generation_config, sort_keys=True, default=str),
+            agent
+        )
+        model = self._models.get(key)
+        if model is None:
+            with self._models_lock:
+                model = self._models.get(key)
+                if model is None:
+                    model = self._build_model(model_name, system_instruction, generation_config, None, agent)
+                    self._models[key] = model
+
+        return model
+
+    def _build_model(
+        self,
+        model_name: str,
+        system_instruction: Optional[str],
+        generation_config: Optional[Dict[str, Any]],
+        tools: Optional[List[Callable]],
+        agent: Optional[str]
+    ):
+        """GenerativeModel kur ve cache/hedging için yapılandırmasını kaydet"""
+        model = genai.GenerativeModel(
+            model_name=model_name,
+            system_instruction=system_instruction,
+            generation_config=generation_config,
+            tools=tools
+        )
+
+        if not tools:
+            self._model_specs[model] = (model_name, system_instruction, generation_config)
+        if agent:
+            self._model_agents[model] = agent
+
+        return model
+
+    # =========================================================================
+    # ASYNC API
+    # =========================================================================
+
+    async def generate(self, model, prompt, use_cache: Optional[bool] = None, **kwargs):
+        """
+        model.generate_content çağrısını thread pool'da çalıştır
+
+        Args:
+            use_cache: None → yalnızca temperature'ı açıkça 0 olan modellerde
+                LLM cache'i; True → her zaman; False → hiç
+        """
+        cache_key = self._cache_key(model, prompt, use_cache, kwargs)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await retry_async(
+            self._call_async, model.generate_content, prompt,
+            endpoint=GEMINI_ENDPOINT, hedger=self._hedger(model), **kwargs
+        )
+
+        self._cache_store(cache_key, response)
+        return response
+
+    async def send_message(self, chat, message, **kwargs):
+        """chat.send_message çağrısını thread pool'da çalıştır (tool çağrıları dahil)"""
+        return await retry_async(
+            self._call_async, chat.send_message, message, endpoint=GEMINI_ENDPOINT, **kwargs
+        )
+
+    async def run_blocking(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Bloklayan bir fonksiyonu (örn. create_plan, Tavily araması) event loop
+        dışında çalıştır.
+
+        LLM pool'u yerine varsayılan executor kullanılır: fonksiyon kendi içinde
+        gateway'in sync metodlarını çağırabilir, pool'u kilitlememeli.
+        """
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(
+            None, functools.partial(ctx.run, func, *args, **kwargs)
+        )
+
+    async def iterate(self, iterable: Iterable) -> AsyncIterator:
+        """Senkron bir generator'ı (örn. write_report_streaming) async olarak tüket"""
+        iterator = iter(iterable)
+        sentinel = object()
+
+        while True:
+            item = await self.run_blocking(next, iterator, sentinel)
+            if item is sentinel:
+                break
+            yield item
+
+    async def _call_async(self, func: Callable, *args, hedger=None, **kwargs) -> Any:
+        """Tek deneme: rate limiter token'ı al, çağrıyı pool'da çalıştır (hedger varsa hedge'li)"""
+        await self.rate_limiter.acquire()
+        if hedger is None:
+            return await self._run_in_pool(func, *args, **kwargs)
+
+        # Asıl istek gateway pool'unda (max_workers sınırı), yalnız yedek hedge pool'unda
+        return await hedger.run_async(
+            functools.partial(func, *args, **kwargs),
+            try_acquire=hedge_acquirer(self.rate_limiter),
+            executor=self._executor
+        )
+
+    async def _run_in_pool(self, func: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        # ContextVar'lar (örn. arama sonuç toplayıcıları) thread'e taşınır
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(ctx.run, func, *args, **kwargs)
+        )
+
+    # =========================================================================
+    # SYNC API
+    # =========================================================================
+
+    def generate_sync(self, model, prompt, use_cache: Optional[bool] = None, **kwargs):
+        """model.generate_content (sync, rate limiter korumalı)"""
+        cache_key = self._cache_key(model, prompt, use_cache, kwargs)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            return cached
+
+        response = retry_sync(
+            self._call_sync, model.generate_content, prompt,
+            endpoint=GEMINI_ENDPOINT, hedger=self._hedger(model), **kwargs
+        )
+
+        self._cache_store(cache_key, response)
+        return response
+
+    def stream_sync(self, model, prompt, use_cache: Optional[bool] = None, **kwargs) -> Iterator[str]:
+        """
+        Streaming generate_content - metin chunk'larını sırayla döndür
+
+        Cache'te varsa tüm metin tek chunk olarak döner; yoksa stream
+        tamamlandığında birleşik metin cache'e yazılır.
+        """
+        cache_key = self._cache_key(model, prompt, use_cache, kwargs)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            yield cached.text
+            return
+
+        # Yalnızca stream'in açılması tekrar denenir (ilk chunk burada gelir);
+        # kullanıcıya yazılmaya başlanmış bir stream yeniden başlatılmaz
+        stream = retry_sync(
+            self._call_sync, model.generate_content, prompt,
+            endpoint=GEMINI_ENDPOINT, stream=True, **kwargs
+        )
+
+        parts = []
+        for chunk in stream:
+            if chunk.text:
+                parts.append(chunk.text)
+                yield chunk.text
+
+        self._cache_store(cache_key, CachedResponse("".join(parts)))
+
+    def _call_sync(self, func: Callable, *args, hedger=None, **kwargs) -> Any:
+        """Tek deneme (sync): rate limiter token'ı al ve çağır (hedger varsa hedge'li)"""
+        self.rate_limiter.acquire_sync()
+        if hedger is None:
+            return func(*args, **kwargs)
+
+        return hedger.run_sync(
+            functools.partial(func, *args, **kwargs),
+            try_acquire=hedge_acquirer(self.rate_limiter)
+        )
+
+    def _hedger(self, model):
+        """Modelin ajanı için hedger (hedging kapalıysa None)"""
+        return get_hedger(GEMINI_ENDPOINT, self._model_agents.get(model))
+
+    # =========================================================================
+    # CACHE
+    # =========================================================================
+
+    def _cache_key(self, model, prompt, use_cache: Optional[bool], kwargs: Dict) -> Optional[str]:
+        """Cache'lenebilir çağrı için anahtar (değilse None)"""
+        cache = get_llm_cache()
+        spec = self._model_specs.get(model)
+
+        # Ek parametreli (örn. çağrı bazlı generation_config) veya metin dışı
+        # prompt'lar cache'lenmez
+        if use_cache is False or not (cache and spec) or kwargs or not isinstance(prompt, str):
+            return None
+
+        model_name, system_instruction, generation_config = spec
+
+        # Örneklemeli yanıt her çağrıda farklı olabilir: açıkça istenmedikçe
+        # cache yok. temperature verilmemişse Gemini varsayılanı (> 0) geçerli
+        temperature = (generation_config or {}).get('temperature')
+        if use_cache is None and (temperature is None or temperature > 0):
+            return None
+
+        return cache.make_key(model_name, system_instruction, generation_config, prompt)
+
+    def _cache_lookup(self, cache_key: Optional[str]) -> Optional[CachedResponse]:
+        if cache_key is None:
+            return None
+
+        text = get_llm_cache().get(cache_key)
+        if text is None:
+            return None
+
+        logger.debug(f"LLM cache hit ({cache_key[:12]})")
+        return CachedResponse(text)
+
+    def _cache_store(self, cache_key: Optional[str], response):
+        if cache_key is None:
+            return
+
+        try:
+            text = response.text
+        except ValueError:
+            # Güvenlik filtresi vb. nedeniyle metin yok → cache'leme
+            return
+
+        if text:
+            get_llm_cache().set(cache_key, text)
+
+    def cache_stats(self) -> Optional[Dict]:
+        """LLM cache hit/miss istatistikleri (cache kapalıysa None)"""
+        cache = get_llm_cache()
+        return cache.stats() if cache else None
+
+
+# Süreç genelinde tek instance
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Paylaşılan LLM gateway'i döndür (config.yaml'dan)"""
+    global _gateway
+
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                from src.utils.config_loader import get_config
+
+                max_workers = get_config('performance.max_concurrent_requests', 5)
+                # Adaptif araştırma limiti max_concurrent_requests'ten başlayıp
+                # concurrency_max'a kadar çıkabilir: pool o kadar çağrıyı taşımalı
+                if get_config('scheduling.adaptive_concurrency', True):
+                    max_workers = max(max_workers, get_config('scheduling.concurrency_max', 16))
+                _gateway = LLMGateway(max_workers=max_workers)
+                logger.info(f"LLM gateway başlatıldı (max_workers={max_workers})")
+
+    return _gateway
@@ -13,7 +13,7 @@ from dotenv import load_dotenv
 import google.generativeai as genai
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from src.utils.retry_helper import retry_with_exponential_backoff
+from src.utils.llm_gateway import get_llm_gateway
 from src.utils.logger import logger
 
 load_dotenv()
@@ -44,16 +44,16 @@ YETENEKLERİN:
 - Hangi görüş daha yaygın/güçlü ise belirt
 """
         
-        self.model = genai.GenerativeModel(
+        self.model = get_llm_gateway().create_model(
             model_name=self.model_name,
             system_instruction=system_instruction,
             generation_config={
                 "temperature": 0.3,  # Objektiflik için düşük
                 "response_mime_type": "application/json"
-            }
+            },
+            agent="perspective"
         )
     
-    @retry_with_exponential_backoff(max_retries=3)
     def analyze_perspectives(
         self,
         topic: str,
@@ -139,11 +139,9 @@ Bu bulguları analiz et ve şu JSON formatında döndür:
 Eğer çelişki yoksa conflicts boş array dön.
 """
         
-        response = self.model.generate_content(prompt)
+        response = get_llm_gateway().generate_sync(self.model, prompt, use_cache=True)
         
         import json
-        import time
-        time.sleep(13)  # Rate limit
         
         analysis = json.loads(response.text)
         analysis['topic'] = topic
@@ -183,11 +181,9 @@ Eğer çelişki yoksa conflicts boş array dön.
 }}
 """
         
-        response = self.model.generate_content(prompt)
+        response = get_llm_gateway().generate_sync(self.model, prompt)
         
         import json
-        import time
-        time.sleep(13)
         
         return json.loads(response.text)
     
@@ -214,11 +210,9 @@ JSON döndür:
 }}
 """
         
-        response = self.model.generate_content(prompt)
+        response = get_llm_gateway().generate_sync(self.model, prompt)
         
         import json
-        import time
-        time.sleep(13)
         
         return json.loads(response.text)
 
@@ -3,16 +3,34 @@ Quality Metrics - Rapor Kalite Değerlendirme
 ===========================================
 
 Araştırma raporunun kalitesini çok boyutlu olarak değerlendirir.
+
+Streaming rapor için ReportQualityAccumulator: chunk'lar geldikçe kelime ve
+gösterge sayımlarını günceller, snapshot() her an (sonda tam) skoru verir.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 import re
 
+from src.utils.keyword_matcher import KeywordMatcher
+
 
 class QualityMetrics:
     """Rapor kalite metrikleri hesaplayıcı"""
     
+    # Detay seviyesi göstergeleri (bulgular, örnekler, açıklamalar)
+    DETAIL_INDICATORS = [
+        'örneğin', 'specifically', 'detailed', 'analysis',
+        'bulgu', 'veri', 'data', 'research shows'
+    ]
+    
+    def __init__(self, detail_indicators: Optional[List[str]] = None):
+        """
+        Args:
+            detail_indicators: Detay göstergeleri (None = DETAIL_INDICATORS)
+        """
+        self.detail_matcher = KeywordMatcher(detail_indicators or self.DETAIL_INDICATORS)
+    
     def calculate_report_quality(
         self,
         sources: List[Dict],
@@ -46,6 +64,30 @@ class QualityMetrics:
             }
         """
         
+        metrics = self._score_report_independent(sources, research_results, topic)
+        
+        # 4. İçerik Derinliği (0-20)
+        metrics['content_depth'] = self._score_content_depth(report, research_results)
+        
+        return self._build_result(metrics)
+    
+    def accumulator(
+        self,
+        sources: List[Dict],
+        research_results: List[Dict],
+        topic: str
+    ) -> "ReportQualityAccumulator":
+        """Streaming rapor için artımlı kalite hesaplayıcı"""
+        return ReportQualityAccumulator(self, sources, research_results, topic)
+    
+    def _score_report_independent(
+        self,
+        sources: List[Dict],
+        research_results: List[Dict],
+        topic: str
+    ) -> Dict[str, int]:
+        """Rapor metnine bağlı olmayan metrikler (content_depth hariç)"""
+        
         metrics = {}
         
         # 1. Kaynak Sayısı (0-15)
@@ -57,15 +99,23 @@ class QualityMetrics:
         # 3. Kaynak Güvenilirliği (0-20)
         metrics['source_reliability'] = self._score_source_reliability(sources)
         
-        # 4. İçerik Derinliği (0-20)
-        metrics['content_depth'] = self._score_content_depth(report, research_results)
-        
         # 5. Güncellik (0-15)
         metrics['recency'] = self._score_recency(sources)
         
         # 6. Kapsam (0-15)
         metrics['coverage'] = self._score_coverage(research_results, topic)
         
+        return metrics
+    
+    def _build_result(self, metrics: Dict[str, int]) -> Dict:
+        """Metriklerden toplam skor, not ve yorumları üret"""
+        
+        metrics = {
+            key: metrics[key]
+            for key in ('source_count', 'source_diversity', 'source_reliability',
+                        'content_depth', 'recency', 'coverage')
+        }
+        
         # Toplam skor
         overall_score = sum(metrics.values())
         
@@ -142,11 +192,24 @@ class QualityMetrics:
     def _score_content_depth(self, report: str, research_results: List[Dict]) -> int:
         """İçerik derinliği skoru (0-20)"""
         
+        return self._score_content_depth_from_counts(
+            word_count=len(report.split()),
+            # Tüm göstergeler rapor üzerinde tek geçişte sayılır
+            detail_count=self.detail_matcher.total(report),
+            research_results=research_results
+        )
+    
+    def _score_content_depth_from_counts(
+        self,
+        word_count: int,
+        detail_count: int,
+        research_results: List[Dict]
+    ) -> int:
+        """İçerik derinliği skoru (0-20), önceden sayılmış değerlerden"""
+        
         score = 0
         
         # 1. Rapor uzunluğu (0-8)
-        word_count = len(report.split())
-        
         if word_count >= 3000:
             score += 8
         elif word_count >= 2000:
@@ -170,16 +233,6 @@ class QualityMetrics:
         
         # 3. Detay seviyesi (0-6)
         # Bulgular, örnekler, açıklamalar
-        detail_indicators = [
-            'örneğin', 'specifically', 'detailed', 'analysis',
-            'bulgu', 'veri', 'data', 'research shows'
-        ]
-        
-        detail_count = sum(
-            report.lower().count(indicator)
-            for indicator in detail_indicators
-        )
-        
         if detail_count >= 20:
             score += 6
         elif detail_count >= 10:
@@ -313,6 +366,64 @@ class QualityMetrics:
         return strengths, improvements
 
 
+class ReportQualityAccumulator:
+    """
+    Streaming rapor için artımlı kalite metrikleri
+    
+    Kaynak/kapsam metrikleri bir kez hesaplanır; rapor metni chunk chunk
+    beslenir. Kelime sayımı ve gösterge eşleşmeleri chunk sınırlarını aşar,
+    tüm rapor beslendiğinde snapshot() calculate_report_quality ile aynıdır.
+    """
+    
+    def __init__(
+        self,
+        quality_metrics: QualityMetrics,
+        sources: List[Dict],
+        research_results: List[Dict],
+        topic: str
+    ):
+        self.quality_metrics = quality_metrics
+        self.research_results = research_results
+        
+        self._base_metrics = quality_metrics._score_report_independent(sources, research_results, topic)
+        self._detail_stream = quality_metrics.detail_matcher.stream()
+        
+        self.word_count = 0
+        self._in_word = False  # Önceki chunk kelime ortasında mı bitti
+    
+    def feed(self, chunk: str):
+        """Rapora eklenen metin parçasını işle"""
+        
+        if not chunk:
+            return
+        
+        words = chunk.split()
+        self.word_count += len(words)
+        
+        # Chunk sınırında bölünen kelime iki kez sayılmasın
+        if words and self._in_word and not chunk[0].isspace():
+            self.word_count -= 1
+        
+        if words:
+            self._in_word = not chunk[-1].isspace()
+        elif chunk:
+            self._in_word = False
+        
+        self._detail_stream.feed(chunk)
+    
+    def snapshot(self) -> Dict:
+        """Şu ana kadar beslenen rapor için kalite metrikleri"""
+        
+        metrics = dict(self._base_metrics)
+        metrics['content_depth'] = self.quality_metrics._score_content_depth_from_counts(
+            word_count=self.word_count,
+            detail_count=self._detail_stream.total,
+            research_results=self.research_results
+        )
+        
+        return self.quality_metrics._build_result(metrics)
+
+
 # Test
 if __name__ == "__main__":
     print("\n" + "="*70)
@@ -374,3 +485,12 @@ if __name__ == "__main__":
     print(f"\n📈 İyileştirme Alanları ({len(result['improvements'])}):")
     for improvement in result['improvements']:
         print(f"  {improvement}")
+    
+    # Streaming: chunk chunk beslenen rapor aynı skoru vermeli
+    accumulator = qm.accumulator(mock_sources, mock_research, "Yapay zeka etiği")
+    for i in range(0, len(mock_report), 37):
+        accumulator.feed(mock_report[i:i + 37])
+    
+    snapshot = accumulator.snapshot()
+    print(f"\n🔁 Streaming snapshot: {snapshot['overall_score']}/100 "
+          f"({'tutarlı' if snapshot == result else 'TUTARSIZ'})")
@@ -0,0 +1,290 @@
+"""
+Rate Limiter - Paylaşılan Sliding Window Limiter'ları
+=====================================================
+
+Süreç genelinde isimli rate limiter kaydı. Her isim (API anahtarı / model)
+tek bir pencereye sahiptir; aynı ismi isteyen herkes aynı kotadan harcar.
+Tüm ajanların (planner, researcher, writer, perspective) Gemini çağrıları
+gateway üzerinden "gemini" limiter'ından token alır.
+
+- Dakikalık limit: sliding window (deque'da son 60 saniyenin istek zamanları)
+- Günlük limit: sayaç (rate_limits.requests_per_day)
+- Async (acquire) ve sync (acquire_sync) kullanım
+- remaining() / wait_time(): kalan kota ve şu anki bekleme süresi
+- Thread-safe (Streamlit + paralel araştırma)
+
+Ayarlar: config.yaml → rate_limits (varsayılan "gemini" limiter'ı),
+rate_limits.limiters.<isim> (diğer isimli limiter'lar)
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from collections import deque
+from datetime import date
+from typing import Callable, Deque, Dict, Optional
+
+from loguru import logger
+
+# Gateway'in kullandığı varsayılan limiter
+DEFAULT_LIMITER = "gemini"
+
+
+class DailyQuotaExceeded(RuntimeError):
+    """Günlük istek kotası doldu"""
+
+
+class SlidingWindowRateLimiter:
+    """
+    Sliding window rate limiter
+
+    Son window_seconds içindeki istek zamanları deque'da tutulur. Pencere
+    doluysa istek, pencereden çıkacak ilk zaman damgasına rezerve edilir
+    (gelecekteki zaman damgası olarak eklenir); eşzamanlı çağıranlar böylece
+    sıraya girer, kimse aynı slotu iki kez almaz.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: int = 5,
+        requests_per_day: Optional[int] = None,
+        window_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            name: Limiter adı (API anahtarı / model)
+            requests_per_minute: Pencere başına maksimum istek
+            requests_per_day: Günde maksimum istek (None/0 = sınırsız)
+            window_seconds: Pencere uzunluğu
+            clock: Zaman kaynağı (test için değiştirilebilir)
+        """
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.requests_per_day = requests_per_day or None
+        self.window_seconds = window_seconds
+        self.clock = clock
+
+        # Rezerve edilmiş istek zamanları (artan sırada, gelecekte olabilir)
+        self._calls: Deque[float] = deque()
+        self._day = date.today()
+        self._day_count = 0
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float):
+        """Pencereden çıkmış zaman damgalarını at (kilit altında çağrılır)"""
+        while self._calls and self._calls[0] <= now - self.window_seconds:
+            self._calls.popleft()
+
+    def _next_slot(self, now: float) -> float:
+        """Sıradaki isteğin gidebileceği an (kilit altında çağrılır)"""
+        if len(self._calls) < self.requests_per_minute:
+            return now
+        # Pencerede requests_per_minute istek var: en eskisinin çıkmasını bekle
+        return max(now, self._calls[-self.requests_per_minute] + self.window_seconds)
+
+    def _reserve(self, wait: bool = True, daily_reserve: int = 0) -> Optional[float]:
+        """
+        Bir slot rezerve et, slota kadar beklenecek süreyi döndür
+
+        wait=False ise slot hemen müsait değilse ya da günlük kotadan
+        daily_reserve veya daha az istek kalmışsa rezerve etmeden None döner.
+        """
+
+        with self._lock:
+            # Gün değiştiyse günlük sayacı sıfırla
+            today = date.today()
+            if today != self._day:
+                self._day = today
+                self._day_count = 0
+
+            if self.requests_per_day and self._day_count >= self.requests_per_day:
+                raise DailyQuotaExceeded(
+                    f"{self.name}: günlük istek kotası doldu ({self.requests_per_day}/gün)"
+                )
+
+            if (not wait and self.requests_per_day
+                    and self.requests_per_day - self._day_count <= daily_reserve):
+                return None
+
+            now = self.clock()
+            self._prune(now)
+
+            slot = self._next_slot(now)
+            if not wait and slot > now:
+                return None
+
+            self._calls.append(slot)
+            self._day_count += 1
+
+            return slot - now
+
+    async def acquire(self):
+        """Slot al (async) - kota müsaitse hemen döner"""
+        wait_time = self._reserve()
+
+        if wait_time > 0:
+            logger.debug(f"Rate limit ({self.name}): {wait_time:.1f}s bekleniyor (async)")
+            await asyncio.sleep(wait_time)
+
+    def acquire_sync(self):
+        """Slot al (sync) - senkron kod yolları için"""
+        wait_time = self._reserve()
+
+        if wait_time > 0:
+            logger.debug(f"Rate limit ({self.name}): {wait_time:.1f}s bekleniyor")
+            time.sleep(wait_time)
+
+    def try_acquire(self, daily_reserve: int = 0) -> bool:
+        """
+        Slot beklemeden müsaitse al (hedge gibi ertelenebilir istekler için)
+
+        Args:
+            daily_reserve: Günlük kotadan asıl isteklere bırakılacak istek
+                sayısı; kalan kota bunu aşmıyorsa slot alınmaz
+        """
+        try:
+            return self._reserve(wait=False, daily_reserve=daily_reserve) is not None
+        except DailyQuotaExceeded:
+            return False
+
+    def remaining(self) -> int:
+        """Şu anki pencerede beklemeden gidebilecek istek sayısı"""
+        with self._lock:
+            now = self.clock()
+            self._prune(now)
+            # Gelecekteki rezervasyonlar da pencereden yer tutar
+            remaining = max(self.requests_per_minute - len(self._calls), 0)
+            if self.requests_per_day:
+                remaining = min(remaining, max(self.requests_per_day - self._day_count, 0))
+            return remaining
+
+    def wait_time(self) -> float:
+        """Şimdi acquire edilse beklenecek süre (rezerve etmeden)"""
+        with self._lock:
+            now = self.clock()
+            self._prune(now)
+            return self._next_slot(now) - now
+
+    @property
+    def requests_today(self) -> int:
+        """Bugün yapılan istek sayısı"""
+        return self._day_count
+
+
+# Süreç genelinde isimli limiter'lar
+_limiters: Dict[str, SlidingWindowRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    name: str = DEFAULT_LIMITER,
+    requests_per_minute: Optional[int] = None,
+    requests_per_day: Optional[int] = None
+) -> SlidingWindowRateLimiter:
+    """
+    İsimli paylaşılan limiter'ı döndür (yoksa oluştur)
+
+    Limitler sırasıyla config.yaml → rate_limits.limiters.<name>, verilen
+    argümanlar ve ("gemini" için) rate_limits'ten okunur. İlk oluşturmadan
+    sonra argümanlar yok sayılır: aynı isim her zaman aynı pencere.
+    """
+    limiter = _limiters.get(name)
+    if limiter is not None:
+        return limiter
+
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            from src.utils.config_loader import get_config
+
+            defaults = get_config('rate_limits', {}) if name == DEFAULT_LIMITER else {}
+            settings = get_config(f'rate_limits.limiters.{name}', {}) or {}
+
+            limiter = SlidingWindowRateLimiter(
+                name,
+                requests_per_minute=settings.get(
+                    'requests_per_minute',
+                    requests_per_minute or defaults.get('requests_per_minute', 5)
+                ),
+                requests_per_day=settings.get(
+                    'requests_per_day',
+                    requests_per_day or defaults.get('requests_per_day')
+                )
+            )
+            _limiters[name] = limiter
+            logger.info(
+                f"Rate limiter başlatıldı: {name} "
+                f"({limiter.requests_per_minute}/dk, "
+                f"{limiter.requests_per_day or '∞'}/gün)"
+            )
+
+    return limiter
+
+
+def smart_rate_limiter(calls_per_minute: int = 5, name: Optional[str] = None):
+    """
+    Akıllı rate limiter - dakikada N çağrı sınırı (sync ve async fonksiyonlar)
+
+    Args:
+        calls_per_minute: Dakikada maksimum çağrı sayısı (limiter ilk kez
+            oluşturuluyorsa)
+        name: Paylaşılan limiter adı (varsayılan: fonksiyonun tam adı).
+            Aynı adı kullanan tüm fonksiyonlar aynı kotadan harcar.
+
+    Kullanım:
+        @smart_rate_limiter(name="gemini")
+        def api_call():
+            ...
+    """
+    def decorator(func: Callable) -> Callable:
+        limiter_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                await get_rate_limiter(limiter_name, calls_per_minute).acquire()
+                return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            get_rate_limiter(limiter_name, calls_per_minute).acquire_sync()
+            return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+# Test
+if __name__ == "__main__":
+    limiter = SlidingWindowRateLimiter("test", requests_per_minute=3, requests_per_day=100, window_seconds=1.0)
+
+    async def _test():
+        start = time.monotonic()
+        for i in range(7):
+            await limiter.acquire()
+            print(
+                f"İstek {i + 1}: {time.monotonic() - start:.2f}s "
+                f"(kalan: {limiter.remaining()}, bekleme: {limiter.wait_time():.2f}s)"
+            )
+
+    asyncio.run(_test())
+    print(f"Bugün: {limiter.requests_today} istek")
+
+    # Aynı isimli limiter'ı kullanan iki fonksiyon tek kotayı paylaşır
+    @smart_rate_limiter(calls_per_minute=2, name="paylasilan")
+    def plan():
+        return "plan"
+
+    @smart_rate_limiter(name="paylasilan")
+    async def research():
+        return "research"
+
+    plan()
+    asyncio.run(research())
+    shared = get_rate_limiter("paylasilan")
+    print(f"Paylaşılan limiter: kalan {shared.remaining()}, bekleme {shared.wait_time():.1f}s")
@@ -0,0 +1,286 @@
+"""
+Reputation Store - Disk Tabanlı Domain İtibar Listesi
+=====================================================
+
+SourceScorer'ın büyük (~200k domain) küratörlü itibar listelerini koda
+gömmeden kullanabilmesi için SQLite deposu.
+
+- Anahtar ters çevrilmiş domain: "export.arxiv.org" → "org.arxiv.export"
+  Bir host için tüm etiket-sınırı suffix'leri tek sorguda primary key
+  üzerinden aranır, en uzun eşleşme kazanır
+- Dosya salt okunur açılır; liste RAM'e yüklenmez (SQLite sayfa cache'i
+  sınırlı), import ve açılış süresi liste boyutundan bağımsız
+- Netloc başına küçük LRU hot cache
+- Atomik yenileme: build yeni dosyayı yazıp os.replace ile değiştirir,
+  get_reputation_store() değişikliği görünce yeni store'u açıp referansı
+  değiştirir. Uçuştaki aramalar eski store ile tamamlanır.
+
+Oluşturma (CSV: domain,score; score 0-100):
+    python -m src.utils.reputation_store build ratings.csv cache/domain_reputation.sqlite
+
+Ayarlar: config.yaml → source_scoring (reputation_db, reload_check_seconds, hot_cache_size)
+"""
+
+import csv
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple
+
+from loguru import logger
+
+from src.utils.disk_cache import PROJECT_ROOT
+from src.utils.domain_index import normalize_host, normalize_suffix
+
+# Hot cache'te "listede yok" sonucu için işaret (None'dan ayırmak için)
+_MISSING = object()
+
+
+def reverse_domain(domain: str) -> str:
+    """"export.arxiv.org" → "org.arxiv.export\""""
+    return '.'.join(reversed(domain.split('.')))
+
+
+class DomainReputationStore:
+    """Salt okunur SQLite domain itibar deposu"""
+
+    def __init__(self, path: Path, hot_cache_size: int = 4096):
+        """
+        Args:
+            path: build ile oluşturulmuş SQLite dosyası
+            hot_cache_size: Netloc başına hatırlanan sonuç sayısı
+        """
+        self.path = Path(path)
+        self.hot_cache_size = hot_cache_size
+
+        self._lock = threading.Lock()
+        self._hot_cache: "OrderedDict[str, object]" = OrderedDict()
+
+        self._conn = sqlite3.connect(
+            f"file:{self.path}?mode=ro",
+            uri=True,
+            check_same_thread=False
+        )
+        # Sayfa cache'i ~2MB ile sınırlı (negatif değer = KiB)
+        self._conn.execute("PRAGMA cache_size=-2048")
+
+        stat = self.path.stat()
+        self.signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def lookup(self, netloc: str) -> Optional[int]:
+        """Host'a eşleşen en uzun suffix'in skoru (0-100, yoksa None)"""
+        host = normalize_host(netloc)
+        if not host:
+            return None
+
+        with self._lock:
+            cached = self._hot_cache.get(host)
+            if cached is not None:
+                self._hot_cache.move_to_end(host)
+                return None if cached is _MISSING else cached
+
+            score = self._query(host)
+
+            self._hot_cache[host] = _MISSING if score is None else score
+            if len(self._hot_cache) > self.hot_cache_size:
+                self._hot_cache.popitem(last=False)
+
+        return score
+
+    def _query(self, host: str) -> Optional[int]:
+        labels = host.split('.')
+        candidates = ['.'.join(reversed(labels[i:])) for i in range(len(labels))]
+
+        row = self._conn.execute(
+            f"""SELECT score FROM reputation
+                WHERE rev_domain IN ({','.join('?' * len(candidates))})
+                ORDER BY length(rev_domain) DESC LIMIT 1""",
+            candidates
+        ).fetchone()
+
+        return row[0] if row else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM reputation").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+def read_ratings_csv(csv_path: Path) -> Iterator[Tuple[str, int]]:
+    """CSV'den (domain, score) çiftleri (başlık satırı ve hatalı satırlar atlanır)"""
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        for row in csv.reader(f):
+            if len(row) < 2:
+                continue
+            try:
+                score = int(float(row[1]))
+            except ValueError:
+                continue  # başlık satırı
+
+            domain = normalize_suffix(row[0])
+            if domain:
+                yield domain, max(0, min(score, 100))
+
+
+def build_reputation_db(ratings: Iterable[Tuple[str, int]], output_path: Path) -> int:
+    """
+    İtibar deposunu oluştur ve mevcut dosyanın yerine atomik olarak koy
+
+    Returns:
+        Yazılan domain sayısı
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    conn = sqlite3.connect(str(tmp_path))
+    try:
+        conn.execute(
+            """CREATE TABLE reputation (
+                rev_domain TEXT PRIMARY KEY,
+                score INTEGER NOT NULL
+            ) WITHOUT ROWID"""
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO reputation VALUES (?, ?)",
+            ((reverse_domain(domain), score) for domain, score in ratings)
+        )
+        conn.commit()
+        count = conn.execute("SELECT COUNT(*) FROM reputation").fetchone()[0]
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, output_path)
+    return count
+
+
+# =============================================================================
+# PAYLAŞILAN STORE
+# =============================================================================
+
+_store: Optional[DomainReputationStore] = None
+_store_lock = threading.RLock()
+_last_check: Optional[float] = None
+
+
+def _configured_path() -> Optional[Path]:
+    from src.utils.config_loader import get_config
+
+    db_path = get_config('source_scoring.reputation_db', '')
+    if not db_path:
+        return None
+
+    path = Path(db_path)
+    return path if path.is_absolute() else PROJECT_ROOT / path
+
+
+def get_reputation_store() -> Optional[DomainReputationStore]:
+    """
+    Paylaşılan itibar deposu (ayarlı değilse veya dosya yoksa None)
+
+    Dosya en fazla reload_check_seconds'ta bir kontrol edilir; değişmişse
+    yeni store açılır ve referans atomik olarak değiştirilir.
+    """
+    global _store, _last_check
+
+    from src.utils.config_loader import get_config
+
+    check_interval = get_config('source_scoring.reload_check_seconds', 30)
+    if _last_check is not None and time.monotonic() - _last_check < check_interval:
+        return _store
+
+    with _store_lock:
+        if _last_check is not None and time.monotonic() - _last_check < check_interval:
+            return _store
+
+        _last_check = time.monotonic()
+        reload_reputation_store(_configured_path(), only_if_changed=True)
+
+    return _store
+
+
+def reload_reputation_store(path: Optional[Path] = None, only_if_changed: bool = False):
+    """
+    İtibar deposunu (yeniden) aç ve paylaşılan referansı değiştir
+
+    Eski store kapatılmaz; üzerindeki uçuştaki aramalar bittiğinde referansı
+    bırakılınca bağlantısı kendiliğinden kapanır.
+    """
+    path = path or _configured_path()
+
+    with _store_lock:
+        _swap_store(path, only_if_changed)
+
+
+def _swap_store(path: Optional[Path], only_if_changed: bool):
+    global _store
+
+    if path is None or not path.exists():
+        if _store is not None:
+            logger.warning(f"Domain itibar deposu bulunamadı, devre dışı: {path}")
+        _store = None
+        return
+
+    if only_if_changed and _store is not None:
+        stat = path.stat()
+        if _store.path == path and _store.signature == (stat.st_ino, stat.st_mtime_ns, stat.st_size):
+            return
+
+    try:
+        from src.utils.config_loader import get_config
+
+        new_store = DomainReputationStore(
+            path,
+            hot_cache_size=get_config('source_scoring.hot_cache_size', 4096)
+        )
+    except sqlite3.Error as e:
+        logger.error(f"Domain itibar deposu açılamadı ({path}): {e}")
+        return
+
+    _store = new_store
+    logger.info(f"Domain itibar deposu yüklendi: {path}")
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Domain itibar deposu")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="CSV'den SQLite deposu oluştur")
+    build_parser.add_argument("csv_path", help="domain,score satırları (score 0-100)")
+    build_parser.add_argument("output_path", help="Oluşturulacak .sqlite dosyası")
+
+    lookup_parser = subparsers.add_parser("lookup", help="Domain skorlarını sorgula")
+    lookup_parser.add_argument("db_path")
+    lookup_parser.add_argument("domains", nargs="+")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        start = time.perf_counter()
+        count = build_reputation_db(read_ratings_csv(Path(args.csv_path)), Path(args.output_path))
+        print(f"✅ {count} domain yazıldı → {args.output_path} ({time.perf_counter() - start:.1f}s)")
+
+    else:
+        store = DomainReputationStore(Path(args.db_path))
+        for domain in args.domains:
+            print(f"{domain:40} → {store.lookup(domain)}")
@@ -0,0 +1,55 @@
+"""
+Resumable - Checkpoint'li Parça Üretimi
+=======================================
+
+Ajanların (örn. writer) workflow katmanına bağımlı olmadan checkpoint'ten
+yararlanması için: checkpoint, get_writer_part/save_writer_part sağlayan
+herhangi bir nesne olabilir (src.workflow.checkpoint.RunCheckpoint).
+
+Parça anahtarları tüm yazım yollarında (task graph, sıralı, paralel,
+streaming) aynıdır: bölümler alt başlığa, tüm sonuçlara bağlı parçalar
+(perspektif, giriş, sonuç) tutulan alt başlık listesine göre anahtarlanır.
+Böylece atlanan bir alt başlık ne bölümlerin eşleşmesini kaydırır ne de
+eski kümeyle yazılmış giriş/sonucun yeniden kullanılmasına yol açar.
+"""
+
+import hashlib
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+def _subtopic_title(result: Dict) -> str:
+    return result.get('subtopic_title') or result.get('topic') or ''
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:12]
+
+
+def section_key(title: str) -> str:
+    """Alt başlığın bölüm parçası anahtarı ('section_<hash>')"""
+    return f"section_{_digest(title)}"
+
+
+def result_section_key(result: Dict) -> str:
+    """Araştırma sonucunun bölüm parçası anahtarı"""
+    return section_key(_subtopic_title(result))
+
+
+def results_key(name: str, research_results: Iterable[Dict]) -> str:
+    """Tüm sonuçlara bağlı parçanın anahtarı ('intro_<hash>'): tutulan küme değişince değişir"""
+    titles = '\n'.join(_subtopic_title(result) for result in research_results)
+    return f"{name}_{_digest(titles)}"
+
+
+def resumable(checkpoint: Optional[Any], key: str, func: Callable, *args):
+    """Writer parçası checkpoint'te varsa onu döndür, yoksa üret ve kaydet"""
+    if checkpoint is None:
+        return func(*args)
+
+    saved = checkpoint.get_writer_part(key)
+    if saved is not None:
+        return saved
+
+    value = func(*args)
+    checkpoint.save_writer_part(key, value)
+    return value
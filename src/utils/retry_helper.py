@@ -3,140 +3,524 @@ Retry Helper - API Çağrıları İçin Tekrar Deneme
 =============================================
 
 429 (Rate Limit) ve diğer geçici hatalar için otomatik retry.
+
+- is_retryable: hata tipine/durum koduna göre geçici mi (429, 5xx, timeout,
+  bağlantı hatası); 400/401/403 gibi hatalar tekrar denenmez
+- parse_retry_delay: sağlayıcının önerdiği bekleme süresi yapısal alanlardan
+  okunur (Gemini RetryInfo.retry_delay, Tavily retry_after_seconds,
+  HTTP Retry-After başlığı); hata metni taranmaz
+- Async (retry_async, asyncio.sleep) ve sync (retry_sync, time.sleep) yollar;
+  dekoratör ikisini de destekler
+- Endpoint başına circuit breaker: art arda geçici hatalarda devre açılır,
+  reset süresi boyunca çağrılar beklemeden CircuitOpenError ile düşer,
+  sonra tek deneme çağrısıyla (half-open) tekrar kapanır
+- report_overload_to: bloğun içindeki geçici hatalar (tekrar denenip
+  kurtarılsa bile) verilen callback'e bildirilir (adaptif eşzamanlılık)
+
+Ayarlar: config.yaml → rate_limits (retry_*, circuit_*)
 """
 
-import time
+import asyncio
 import functools
-from typing import Callable, Any
+import inspect
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterator, Optional
+
 from loguru import logger
 
+try:
+    from google.api_core import exceptions as google_exceptions
+except ImportError:  # google-api-core yoksa Gemini hataları durum kodundan tanınır
+    google_exceptions = None
+
+try:
+    from tavily import errors as tavily_errors
+except ImportError:
+    tavily_errors = None
+
+# Geçici kabul edilen HTTP durum kodları
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Aktif bağlamda geçici hataların bildirileceği callback (yoksa None).
+# Gateway çağrıları context'i thread pool'a taşıdığı için callback farklı
+# bir thread'den çağrılabilir.
+_overload_listener: ContextVar[Optional[Callable[[BaseException], None]]] = ContextVar(
+    'overload_listener', default=None
+)
+
+
+class CircuitOpenError(RuntimeError):
+    """Endpoint'in devresi açık: çağrı yapılmadan hemen düşer"""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(f"{endpoint} devresi açık, {retry_after:.0f}s sonra tekrar denenecek")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+# =============================================================================
+# HATA SINIFLANDIRMA
+# =============================================================================
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """Hatanın HTTP durum kodu (Google API hataları, requests/httpx yanıtları)"""
+    code = getattr(error, 'code', None)
+    if isinstance(code, int):
+        return code
+
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Hata geçici mi (tekrar denemeye değer mi)?"""
+    if isinstance(error, CircuitOpenError):
+        return False
+
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+
+    if tavily_errors is not None:
+        if isinstance(error, (tavily_errors.UsageLimitExceededError, tavily_errors.TimeoutError)):
+            return True
+        if isinstance(error, (
+            tavily_errors.BadRequestError,
+            tavily_errors.ForbiddenError,
+            tavily_errors.InvalidAPIKeyError,
+            tavily_errors.MissingAPIKeyError
+        )):
+            return False
+
+    if google_exceptions is not None and isinstance(error, (
+        google_exceptions.DeadlineExceeded,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.Aborted
+    )):
+        return True
+
+    # requests bağlantı/timeout hataları (requests'i import etmeden)
+    if type(error).__name__ in ('ConnectionError', 'Timeout', 'ReadTimeout', 'ConnectTimeout'):
+        return True
+
+    return _status_code(error) in RETRYABLE_STATUS_CODES
+
+
+def _is_provider_response(error: BaseException) -> bool:
+    """Kalıcı hata sağlayıcıdan mı geldi (endpoint ayakta ve yanıt veriyor)?"""
+    if isinstance(error, CircuitOpenError) or is_retryable(error):
+        return False
+
+    if tavily_errors is not None and isinstance(error, (
+        tavily_errors.BadRequestError,
+        tavily_errors.ForbiddenError,
+        tavily_errors.InvalidAPIKeyError
+    )):
+        return True
+
+    return _status_code(error) is not None
+
+
+def parse_retry_delay(error: BaseException) -> Optional[float]:
+    """
+    Sağlayıcının önerdiği bekleme süresi (saniye, yoksa None)
+
+    - Gemini (google-api-core): details içindeki google.rpc.RetryInfo
+    - Tavily: retry_after_seconds
+    - HTTP: Retry-After başlığı (saniye veya tarih)
+    """
+    retry_after = getattr(error, 'retry_after_seconds', None)
+    if isinstance(retry_after, (int, float)):
+        return float(retry_after)
+
+    for detail in getattr(error, 'details', None) or ():
+        delay = getattr(detail, 'retry_delay', None)
+        if delay is not None and hasattr(delay, 'seconds'):
+            return delay.seconds + getattr(delay, 'nanos', 0) / 1e9
+
+        # REST yanıtı: {"@type": ".../google.rpc.RetryInfo", "retryDelay": "17s"}
+        if isinstance(detail, dict) and str(detail.get('@type', '')).endswith('RetryInfo'):
+            try:
+                return float(str(detail.get('retryDelay', '')).rstrip('s'))
+            except ValueError:
+                pass
+
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    header = headers.get('Retry-After') if headers is not None else None
+    if header:
+        try:
+            return max(float(header), 0.0)
+        except ValueError:
+            try:
+                return max(parsedate_to_datetime(header).timestamp() - time.time(), 0.0)
+            except (TypeError, ValueError):
+                pass
+
+    return None
+
+
+@contextmanager
+def report_overload_to(callback: Callable[[BaseException], None]) -> Iterator[None]:
+    """Bu blokta retry_async/retry_sync'in gördüğü geçici hataları callback'e bildir"""
+    token = _overload_listener.set(callback)
+    try:
+        yield
+    finally:
+        _overload_listener.reset(token)
+
+
+def _notify_overload(error: BaseException):
+    listener = _overload_listener.get()
+    if listener is not None:
+        try:
+            listener(error)
+        except Exception as e:
+            logger.debug(f"Overload bildirimi başarısız: {e}")
+
+
+# =============================================================================
+# CIRCUIT BREAKER
+# =============================================================================
+
+class CircuitBreaker:
+    """
+    Endpoint başına devre kesici (thread-safe)
+
+    closed → (failure_threshold art arda geçici hata) → open
+    open → (reset_timeout geçti) → half-open: tek deneme çağrısı
+    half-open → başarı: closed / hata: tekrar open
+
+    Deneme çağrısı her sonuçta (iptal dahil) release_probe ile serbest
+    bırakılır; aksi halde devre süreç boyunca açık kalırdı.
+    """
+
+    def __init__(self, endpoint: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def before_call(self) -> bool:
+        """
+        Çağrıya izin ver ya da CircuitOpenError yükselt
+
+        Returns:
+            Çağrı half-open deneme çağrısıysa True (release_probe gerekir)
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return False
+
+            remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+            if remaining > 0 or self._probe_in_flight:
+                raise CircuitOpenError(self.endpoint, max(remaining, 0.0))
+
+            # Half-open: yalnızca bir deneme çağrısı geçer
+            self._probe_in_flight = True
+            return True
+
+    def release_probe(self):
+        """Deneme çağrısı bitti (sonuç record_* ile ayrıca bildirilir)"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self):
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"{self.endpoint} devresi kapandı")
+            self._failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """Geçici hatayı say (kalıcı hatalar sağlayıcının sağlığını göstermez)"""
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.warning(
+                        f"{self.endpoint} devresi açıldı ({self._failures} art arda hata), "
+                        f"{self.reset_timeout:.0f}s boyunca çağrılar hemen düşecek"
+                    )
+                self._opened_at = time.monotonic()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(endpoint: str) -> CircuitBreaker:
+    """Endpoint'in paylaşılan devre kesicisi (config.yaml'dan)"""
+    breaker = _breakers.get(endpoint)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(endpoint)
+            if breaker is None:
+                from src.utils.config_loader import get_config
+
+                breaker = CircuitBreaker(
+                    endpoint,
+                    failure_threshold=get_config('rate_limits.circuit_failure_threshold', 5),
+                    reset_timeout=get_config('rate_limits.circuit_reset_seconds', 30)
+                )
+                _breakers[endpoint] = breaker
+
+    return breaker
+
+
+# =============================================================================
+# RETRY
+# =============================================================================
+
+def _retry_settings(max_retries: Optional[int], initial_delay: Optional[float]) -> Dict[str, float]:
+    from src.utils.config_loader import get_config
+
+    if max_retries is None:
+        max_retries = get_config('rate_limits.retry_max_attempts', 3)
+
+    return {
+        # max_retries=0 → tek deneme, tekrar yok
+        'max_retries': max(int(max_retries), 1),
+        'initial_delay': initial_delay if initial_delay is not None else get_config('rate_limits.retry_initial_delay', 1.0),
+        'max_delay': get_config('rate_limits.retry_max_delay', 60),
+        'honor_retry_after': get_config('rate_limits.auto_wait_on_429', True)
+    }
+
+
+def _next_delay(
+    error: BaseException,
+    attempt: int,
+    name: str,
+    max_retries: int,
+    initial_delay: float,
+    max_delay: float,
+    honor_retry_after: bool = True,
+    exponential_base: float = 2.0,
+    jitter: bool = True
+) -> Optional[float]:
+    """Sonraki denemeden önceki bekleme (tekrar denenmeyecekse None)"""
+    if attempt >= max_retries - 1 or not is_retryable(error):
+        return None
+
+    suggested = parse_retry_delay(error) if honor_retry_after else None
+    if suggested is not None:
+        if suggested > max_delay:
+            logger.warning(f"{name}: sağlayıcı {suggested:.0f}s bekleme istiyor (> {max_delay}s), vazgeçiliyor")
+            return None
+        delay = suggested
+    else:
+        delay = initial_delay * exponential_base ** attempt
+        if jitter:
+            delay *= 0.5 + random.random()
+        delay = min(delay, max_delay)
+
+    logger.info(
+        f"{name} başarısız (deneme {attempt + 1}/{max_retries}). "
+        f"{delay:.1f}s bekleniyor... Hata: {str(error)[:100]}"
+    )
+    return delay
+
+
+def _record_error(breaker: Optional[CircuitBreaker], error: BaseException):
+    """Hatayı devre kesiciye ve overload dinleyicisine yansıt"""
+    if is_retryable(error):
+        _notify_overload(error)
+        if breaker:
+            breaker.record_failure()
+    elif breaker and _is_provider_response(error):
+        # 400/403 gibi yanıtlar endpoint'in ayakta olduğunu gösterir
+        breaker.record_success()
+
+
+async def retry_async(
+    func: Callable,
+    *args,
+    endpoint: Optional[str] = None,
+    max_retries: Optional[int] = None,
+    initial_delay: Optional[float] = None,
+    **kwargs
+) -> Any:
+    """
+    await func(*args, **kwargs) - geçici hatalarda asyncio.sleep ile tekrar dene
+
+    Args:
+        endpoint: Devre kesici adı ("gemini", "tavily"; None = devre kesici yok)
+        max_retries, initial_delay: None ise config.yaml → rate_limits
+    """
+    settings = _retry_settings(max_retries, initial_delay)
+    breaker = get_circuit_breaker(endpoint) if endpoint else None
+    name = endpoint or getattr(func, '__name__', 'çağrı')
+
+    for attempt in range(settings['max_retries']):
+        probe = breaker.before_call() if breaker else False
+
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            _record_error(breaker, e)
+            if breaker and is_retryable(e) and breaker.state == "open":
+                raise
+
+            delay = _next_delay(e, attempt, name, **settings)
+            if delay is None:
+                raise
+        else:
+            if breaker:
+                breaker.record_success()
+            return result
+        finally:
+            # Hata, iptal (wait_for, kaybeden hedge) dahil her sonuçta
+            if probe:
+                breaker.release_probe()
+
+        await asyncio.sleep(delay)
+
+
+def retry_sync(
+    func: Callable,
+    *args,
+    endpoint: Optional[str] = None,
+    max_retries: Optional[int] = None,
+    initial_delay: Optional[float] = None,
+    **kwargs
+) -> Any:
+    """retry_async'in senkron karşılığı (thread pool'daki çağrılar için)"""
+    settings = _retry_settings(max_retries, initial_delay)
+    breaker = get_circuit_breaker(endpoint) if endpoint else None
+    name = endpoint or getattr(func, '__name__', 'çağrı')
+
+    for attempt in range(settings['max_retries']):
+        probe = breaker.before_call() if breaker else False
+
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            _record_error(breaker, e)
+            if breaker and is_retryable(e) and breaker.state == "open":
+                raise
+
+            delay = _next_delay(e, attempt, name, **settings)
+            if delay is None:
+                raise
+        else:
+            if breaker:
+                breaker.record_success()
+            return result
+        finally:
+            if probe:
+                breaker.release_probe()
+
+        time.sleep(delay)
+
 
 def retry_with_exponential_backoff(
     max_retries: int = 3,
     initial_delay: float = 1.0,
-    exponential_base: float = 2.0,
-    jitter: bool = True,
-    retry_on_exceptions: tuple = (Exception,)
+    endpoint: Optional[str] = None
 ):
     """
-    Exponential backoff ile retry decorator
-    
+    Exponential backoff ile retry decorator (sync ve async fonksiyonlar)
+
     Args:
         max_retries: Maksimum deneme sayısı
         initial_delay: İlk bekleme süresi (saniye)
-        exponential_base: Her denemede çarpan
-        jitter: Rastgele gecikme ekle (aynı anda birçok istek varsa)
-        retry_on_exceptions: Hangi hatalarda retry yapılacak
-    
+        endpoint: Devre kesici adı (opsiyonel)
+
     Kullanım:
         @retry_with_exponential_backoff(max_retries=3)
         def api_call():
             ...
     """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> Any:
-            delay = initial_delay
-            
-            for attempt in range(max_retries):
-                try:
-                    return func(*args, **kwargs)
-                
-                except retry_on_exceptions as e:
-                    # 429 Rate Limit hatası - API'den gelen retry süresi varsa kullan
-                    if "429" in str(e) and "retry" in str(e).lower():
-                        # API'den önerilen süreyi çıkar
-                        import re
-                        match = re.search(r'retry.*?(\d+)', str(e), re.IGNORECASE)
-                        if match:
-                            api_suggested_delay = int(match.group(1))
-                            delay = api_suggested_delay
-                            logger.warning(
-                                f"Rate limit! API {api_suggested_delay}s beklememi öneriyor."
-                            )
-                    
-                    # Son deneme ise hatayı fırlat
-                    if attempt == max_retries - 1:
-                        logger.error(
-                            f"{func.__name__} başarısız oldu ({max_retries} deneme sonrası): {e}"
-                        )
-                        raise
-                    
-                    # Bekle ve tekrar dene
-                    wait_time = delay
-                    if jitter:
-                        import random
-                        wait_time = delay * (0.5 + random.random())
-                    
-                    logger.info(
-                        f"{func.__name__} başarısız (deneme {attempt + 1}/{max_retries}). "
-                        f"{wait_time:.1f}s bekleniyor... Hata: {str(e)[:100]}"
-                    )
-                    
-                    time.sleep(wait_time)
-                    delay *= exponential_base
-        
-        return wrapper
-    return decorator
-
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                return await retry_async(
+                    func, *args, endpoint=endpoint, max_retries=max_retries,
+                    initial_delay=initial_delay, **kwargs
+                )
+            return async_wrapper
 
-def smart_rate_limiter(calls_per_minute: int = 5):
-    """
-    Akıllı rate limiter - dakikada N çağrı sınırı
-    
-    Args:
-        calls_per_minute: Dakikada maksimum çağrı sayısı
-    
-    Kullanım:
-        @smart_rate_limiter(calls_per_minute=5)
-        def api_call():
-            ...
-    """
-    def decorator(func: Callable) -> Callable:
-        calls = []  # (timestamp, ) listesi
-        
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            nonlocal calls
-            
-            now = time.time()
-            
-            # 1 dakikadan eski çağrıları temizle
-            calls = [t for t in calls if now - t < 60]
-            
-            # Limit aşıldıysa bekle
-            if len(calls) >= calls_per_minute:
-                oldest_call = min(calls)
-                wait_time = 60 - (now - oldest_call)
-                
-                if wait_time > 0:
-                    logger.warning(
-                        f"Rate limit: {calls_per_minute}/dakika doldu. "
-                        f"{wait_time:.1f}s bekleniyor..."
-                    )
-                    time.sleep(wait_time)
-            
-            # Çağrıyı kaydet
-            calls.append(time.time())
-            
-            return func(*args, **kwargs)
-        
+            return retry_sync(
+                func, *args, endpoint=endpoint, max_retries=max_retries,
+                initial_delay=initial_delay, **kwargs
+            )
         return wrapper
+
     return decorator
 
 
 # Test
 if __name__ == "__main__":
-    @retry_with_exponential_backoff(max_retries=3, initial_delay=1.0)
-    def flaky_api_call(fail_count: int = 2):
-        """Bazen başarısız olan mock API"""
-        import random
-        
-        if random.random() < 0.7:  # %70 hata şansı
-            raise Exception("API geçici olarak kullanılamıyor")
-        
+    from google.api_core.exceptions import InvalidArgument, ResourceExhausted
+    from google.rpc import error_details_pb2
+
+    # Gemini 429: RetryInfo içeren yapısal hata
+    retry_info = error_details_pb2.RetryInfo()
+    retry_info.retry_delay.seconds = 2
+    retry_info.retry_delay.nanos = 500_000_000
+    quota_error = ResourceExhausted("Quota exceeded", details=[retry_info])
+
+    print(f"429 retryable: {is_retryable(quota_error)}, önerilen bekleme: {parse_retry_delay(quota_error)}s")
+    print(f"400 retryable: {is_retryable(InvalidArgument('bad prompt'))}")
+
+    # Devre kesici: 3 hatada açılır, açıkken çağrı yapılmaz
+    breaker = CircuitBreaker("demo", failure_threshold=3, reset_timeout=0.2)
+    for _ in range(3):
+        breaker.record_failure()
+    try:
+        breaker.before_call()
+    except CircuitOpenError as e:
+        print(f"Devre: {breaker.state} → {e}")
+    time.sleep(0.25)
+    breaker.before_call()
+    breaker.record_success()
+    print(f"Deneme çağrısı sonrası devre: {breaker.state}")
+
+    # Async retry: 2 geçici hata, sonra başarı (event loop bloklanmaz)
+    attempts = []
+
+    async def flaky():
+        attempts.append(time.monotonic())
+        if len(attempts) < 3:
+            raise ConnectionError("bağlantı koptu")
         return "Başarılı!"
-    
-    print("Test ediliyor...")
-    result = flaky_api_call()
-    print(f"Sonuç: {result}")
+
+    async def ticker(stop):
+        ticks = 0
+        while not stop.is_set():
+            ticks += 1
+            await asyncio.sleep(0.01)
+        return ticks
+
+    async def demo():
+        stop = asyncio.Event()
+        tick_task = asyncio.ensure_future(ticker(stop))
+        result = await retry_async(flaky, max_retries=3, initial_delay=0.1)
+        stop.set()
+        return result, await tick_task
+
+    result, ticks = asyncio.run(demo())
+    print(f"Async retry: {result} ({len(attempts)} deneme, bu sırada loop {ticks} kez çalıştı)")
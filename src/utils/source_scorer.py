@@ -9,13 +9,56 @@ Skorlama Kriterleri:
 - Güncellik (ne kadar yeni)
 - İçerik kalitesi (uzunluk, derinlik)
 - Cite edilme (kaç kez referans gösterilmiş)
+
+Toplu skorlama (score_batch): her doküman tek geçişte taranır; aynı
+yayın tarihinin güncellik skoru batch içinde bir kez hesaplanır.
 """
 
 from datetime import datetime
-from typing import Dict, List
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 import re
 
+from src.utils.domain_index import DomainSuffixIndex
+from src.utils.keyword_matcher import KeywordMatcher
+from src.utils.reputation_store import get_reputation_store
+
+# İçerik kalitesi göstergeleri
+STRUCTURE_INDICATORS = [
+    r'#{1,3}\s',          # Markdown başlıklar
+    r'-\s',               # Liste
+    r'\d+\.',             # Numaralı liste
+    r'\*\s',              # Yıldızlı liste
+]
+
+ACADEMIC_INDICATORS = [
+    'research', 'study', 'analysis', 'data',
+    'methodology', 'conclusion', 'findings',
+    'abstract', 'introduction', 'references'
+]
+
+CITATION_INDICATORS = [
+    'http://', 'https://', '[', ']',
+    'source:', 'reference:', 'cite:'
+]
+
+# Bu sayıdan sonra kelime saymaya gerek yok (en yüksek uzunluk eşiği)
+WORD_COUNT_CAP = 2000
+
+# Tüm yapı göstergeleri satır başında tek regex'te (ilk karakterleri farklı,
+# aynı konumda birden fazla alternatif eşleşemez)
+_STRUCTURE_PATTERN = re.compile(
+    r'\n(?:' + '|'.join(f'(?P<s{i}>{p})' for i, p in enumerate(STRUCTURE_INDICATORS)) + ')'
+)
+
+# Gösterge otomatları (ikisi de erken durur: tüm akademik göstergeler
+# bulununca / ilk referans göstergesinde)
+_ACADEMIC_MATCHER = KeywordMatcher(ACADEMIC_INDICATORS)
+_CITATION_MATCHER = KeywordMatcher(CITATION_INDICATORS)
+
+_WORD_PATTERN = re.compile(r'\S+')
+
 
 class SourceScorer:
     """Kaynak güvenilirliği skorlama sistemi"""
@@ -25,7 +68,7 @@ class SourceScorer:
         # Akademik
         '.edu': 95,
         '.ac.uk': 95,
-        'scholar.google': 95,
+        'scholar.google.com': 95,
         'arxiv.org': 90,
         'researchgate.net': 85,
         'sciencedirect.com': 90,
@@ -66,6 +109,29 @@ class SourceScorer:
         'tumblr.com',
     ]
     
+    # Düşük güvenilir domain skoru (0-40)
+    LOW_TRUST_SCORE = 10
+    
+    # Yukarıdaki listelerden derlenen suffix index (sınıf başına, ilk kullanımda)
+    _domain_index: Optional[DomainSuffixIndex] = None
+    
+    @classmethod
+    def _get_domain_index(cls) -> DomainSuffixIndex:
+        """Domain listelerini ters etiketli suffix trie'ye derle"""
+        
+        if cls.__dict__.get('_domain_index') is None:
+            index = DomainSuffixIndex()
+            
+            for low_trust in cls.LOW_TRUST_INDICATORS:
+                index.add(low_trust, cls.LOW_TRUST_SCORE)
+            
+            for trusted_domain, score in cls.TRUSTED_DOMAINS.items():
+                index.add(trusted_domain, int(score * 0.4))  # 40 puan üzerinden
+            
+            cls._domain_index = index
+        
+        return cls._domain_index
+    
     def score_source(
         self,
         url: str,
@@ -96,33 +162,28 @@ class SourceScorer:
             }
         """
         
-        score = 0
-        breakdown = {}
-        badges = []
+        return self._combine(
+            url,
+            self._score_domain(url),                     # 1. Domain Authority (40 puan)
+            self._score_recency(publish_date),           # 2. Güncellik (20 puan)
+            self._score_content_quality(content, title)  # 3. İçerik Kalitesi (40 puan)
+        )
+    
+    @staticmethod
+    def _combine(url: str, domain_score: int, recency_score: int, quality_score: int) -> Dict:
+        """Bileşen skorlarından toplam skor, güven seviyesi ve rozetler"""
         
-        # 1. Domain Authority (40 puan)
-        domain_score = self._score_domain(url)
-        breakdown['domain'] = domain_score
-        score += domain_score
+        score = domain_score + recency_score + quality_score
+        badges = []
         
         if domain_score >= 90:
             badges.append("🎓 Akademik")
         elif domain_score >= 85:
             badges.append("✅ Güvenilir")
         
-        # 2. Güncellik (20 puan)
-        recency_score = self._score_recency(publish_date)
-        breakdown['recency'] = recency_score
-        score += recency_score
-        
         if recency_score >= 18:
             badges.append("🆕 Güncel")
         
-        # 3. İçerik Kalitesi (40 puan)
-        quality_score = self._score_content_quality(content, title)
-        breakdown['content_quality'] = quality_score
-        score += quality_score
-        
         if quality_score >= 35:
             badges.append("📊 Detaylı")
         
@@ -137,7 +198,11 @@ class SourceScorer:
         return {
             'url': url,
             'score': min(score, 100),
-            'breakdown': breakdown,
+            'breakdown': {
+                'domain': domain_score,
+                'recency': recency_score,
+                'content_quality': quality_score
+            },
             'trust_level': trust_level,
             'badges': badges
         }
@@ -147,17 +212,18 @@ class SourceScorer:
         
         try:
             parsed = urlparse(url)
-            domain = parsed.netloc.lower()
             
-            # Tam eşleşme kontrolü
-            for trusted_domain, score in self.TRUSTED_DOMAINS.items():
-                if trusted_domain in domain:
-                    return int(score * 0.4)  # 40 puan üzerinden
+            # Küratörlü itibar deposu (config: source_scoring.reputation_db) önce
+            reputation_store = get_reputation_store()
+            if reputation_store is not None:
+                reputation = reputation_store.lookup(parsed.netloc)
+                if reputation is not None:
+                    return int(reputation * 0.4)  # 40 puan üzerinden
             
-            # Düşük güvenilirlik kontrolü
-            for low_trust in self.LOW_TRUST_INDICATORS:
-                if low_trust in domain:
-                    return 10
+            # Etiket sınırında en uzun suffix eşleşmesi (güvenilir veya düşük)
+            listed_score = self._get_domain_index().lookup(parsed.netloc)
+            if listed_score is not None:
+                return listed_score
             
             # HTTPS bonus
             base_score = 25
@@ -203,10 +269,11 @@ class SourceScorer:
         if not content:
             return 15
         
+        word_count, structure_count, academic_count, has_citations = self._content_features(content)
+        
         score = 0
         
         # 1. Uzunluk (0-15)
-        word_count = len(content.split())
         if word_count >= 2000:
             score += 15
         elif word_count >= 1000:
@@ -220,63 +287,75 @@ class SourceScorer:
         
         # 2. Yapılandırılmış içerik (0-10)
         # Başlıklar, listeler, bölümler var mı?
-        structure_indicators = [
-            r'\n#{1,3}\s',          # Markdown başlıklar
-            r'\n-\s',               # Liste
-            r'\n\d+\.',             # Numaralı liste
-            r'\n\*\s',              # Yıldızlı liste
-        ]
-        
-        structure_count = sum(
-            1 for pattern in structure_indicators
-            if re.search(pattern, content)
-        )
         score += min(structure_count * 2, 10)
         
         # 3. Akademik göstergeler (0-10)
-        academic_indicators = [
-            'research', 'study', 'analysis', 'data',
-            'methodology', 'conclusion', 'findings',
-            'abstract', 'introduction', 'references'
-        ]
-        
-        academic_count = sum(
-            1 for indicator in academic_indicators
-            if indicator.lower() in content.lower()
-        )
         score += min(academic_count, 10)
         
         # 4. Referans/Kaynak var mı? (0-5)
-        citation_indicators = [
-            'http://', 'https://', '[', ']',
-            'source:', 'reference:', 'cite:'
-        ]
-        
-        has_citations = any(
-            indicator in content.lower()
-            for indicator in citation_indicators
-        )
         if has_citations:
             score += 5
         
         return min(score, 40)
     
-    def score_multiple_sources(self, sources: List[Dict]) -> List[Dict]:
-        """Birden fazla kaynağı skorla"""
+    @staticmethod
+    def _content_features(content: str) -> Tuple[int, int, int, bool]:
+        """
+        İçeriği tek geçişte tara
+        
+        Returns:
+            (kelime sayısı (WORD_COUNT_CAP ile sınırlı), yapı göstergesi sayısı,
+             akademik gösterge sayısı, referans var mı)
+        """
+        
+        word_count = sum(1 for _ in islice(_WORD_PATTERN.finditer(content), WORD_COUNT_CAP))
         
-        scored = []
+        structures = set()
+        for match in _STRUCTURE_PATTERN.finditer(content):
+            structures.add(match.lastgroup)
+            if len(structures) == len(STRUCTURE_INDICATORS):
+                break
+        
+        academic_count = len(_ACADEMIC_MATCHER.present(content))
+        has_citations = _CITATION_MATCHER.contains_any(content)
+        
+        return word_count, len(structures), academic_count, has_citations
+    
+    def score_batch(self, sources: List[Dict]) -> List[Dict]:
+        """
+        Kaynakları toplu skorla (score_source ile aynı sonuçlar, aynı sıra)
+        
+        Bileşenler kaynak başına bir kez hesaplanır; aynı yayın tarihinin
+        güncellik skoru batch içinde tekrar hesaplanmaz.
+        """
+        
+        recency_memo: Dict[Optional[str], int] = {}
+        results = []
         
         for source in sources:
-            score_data = self.score_source(
-                url=source.get('url', ''),
-                title=source.get('title', ''),
-                content=source.get('content', ''),
-                publish_date=source.get('published_date')
-            )
+            url = source.get('url', '')
+            publish_date = source.get('published_date')
             
-            # Orijinal source data ile birleştir
-            scored_source = {**source, **score_data}
-            scored.append(scored_source)
+            if publish_date not in recency_memo:
+                recency_memo[publish_date] = self._score_recency(publish_date)
+            
+            results.append(self._combine(
+                url,
+                self._score_domain(url),
+                recency_memo[publish_date],
+                self._score_content_quality(source.get('content', ''), source.get('title', ''))
+            ))
+        
+        return results
+    
+    def score_multiple_sources(self, sources: List[Dict]) -> List[Dict]:
+        """Birden fazla kaynağı skorla"""
+        
+        # Orijinal source data ile birleştir
+        scored = [
+            {**source, **score_data}
+            for source, score_data in zip(sources, self.score_batch(sources))
+        ]
         
         # Skora göre sırala
         scored.sort(key=lambda x: x.get('score', 0), reverse=True)
@@ -0,0 +1,231 @@
+"""
+Checkpoint - Yarıda Kalan Araştırmaya Devam
+===========================================
+
+run_research her aşamadan ve her tamamlanan alt başlıktan sonra durumunu
+run_id ile anahtarlanmış bir JSON dosyasına yazar:
+
+- plan
+- alt başlık bazında araştırma sonuçları (başarısız olanlar yazılmaz)
+- tamamlanan writer parçaları (perspektifler, giriş, bölümler, sonuç)
+
+Yazım atomiktir (geçici dosya + os.replace); çökme anında dosya ya eski
+ya yeni haliyle kalır. Yazma metodları dosyayı fsync'ler (bloklar):
+async koddan gateway.run_blocking ile çağrılmalı. resume(run_id) kaldığı
+yerden devam eder.
+
+Ayarlar: config.yaml → checkpoint (enabled, dir, keep_completed)
+"""
+
+import json
+import os
+import re
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.utils.disk_cache import PROJECT_ROOT
+from src.utils.resumable import section_key
+
+# Tüm araştırma sonuçlarına bağlı writer parçaları (anahtar: '<ad>_<hash>')
+AGGREGATE_PARTS = ('perspectives', 'intro', 'conclusion')
+
+# create() ile üretilen run_id biçimi: YYYYmmdd_HHMMSS_<6 hex>
+RUN_ID_PATTERN = re.compile(r'^\d{8}_\d{6}_[0-9a-f]{6}$')
+
+
+def get_checkpoint_dir() -> Path:
+    """config.yaml'daki checkpoint dizini (yoksa oluşturur)"""
+    from src.utils.config_loader import get_config
+
+    checkpoint_dir = Path(get_config('checkpoint.dir', 'checkpoints'))
+    if not checkpoint_dir.is_absolute():
+        checkpoint_dir = PROJECT_ROOT / checkpoint_dir
+
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    return checkpoint_dir
+
+
+def checkpoints_enabled() -> bool:
+    from src.utils.config_loader import get_config
+
+    return get_config('checkpoint.enabled', True)
+
+
+class RunCheckpoint:
+    """Tek bir araştırma çalıştırmasının kalıcı durumu"""
+
+    def __init__(self, path: Path, data: Dict[str, Any]):
+        self.path = Path(path)
+        self._data = data
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, topic: str, context: Optional[str] = None, checkpoint_dir: Optional[Path] = None) -> "RunCheckpoint":
+        """Yeni çalıştırma için checkpoint oluştur"""
+        run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else get_checkpoint_dir()
+
+        checkpoint = cls(checkpoint_dir / f"{run_id}.json", {
+            'run_id': run_id,
+            'topic': topic,
+            'context': context,
+            'stage': 'planning',
+            'created_at': datetime.now().isoformat(),
+            'updated_at': None,
+            'plan': None,
+            'research': {},
+            'writer': {},
+            'completed': False
+        })
+        checkpoint._flush()
+        return checkpoint
+
+    @classmethod
+    def load(cls, run_id: str, checkpoint_dir: Optional[Path] = None) -> "RunCheckpoint":
+        """
+        Kayıtlı checkpoint'i yükle
+
+        Raises:
+            ValueError: run_id biçimi geçersizse (dizin dışına çıkan yollar dahil)
+            FileNotFoundError: run_id için checkpoint yoksa
+        """
+        if not RUN_ID_PATTERN.match(run_id):
+            raise ValueError(f"Geçersiz run_id: {run_id!r}")
+
+        checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else get_checkpoint_dir()
+        path = checkpoint_dir / f"{run_id}.json"
+
+        if not path.exists():
+            raise FileNotFoundError(f"Checkpoint bulunamadı: {run_id}")
+
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(path, json.load(f))
+
+    # =========================================================================
+    # OKUMA
+    # =========================================================================
+
+    @property
+    def run_id(self) -> str:
+        return self._data['run_id']
+
+    @property
+    def topic(self) -> str:
+        return self._data['topic']
+
+    @property
+    def context(self) -> Optional[str]:
+        return self._data.get('context')
+
+    @property
+    def stage(self) -> str:
+        return self._data['stage']
+
+    @property
+    def plan(self) -> Optional[Dict]:
+        return self._data.get('plan')
+
+    def get_research(self, index: int) -> Optional[Dict]:
+        """index'teki (0 tabanlı) alt başlığın kayıtlı sonucu"""
+        with self._lock:
+            return self._data['research'].get(str(index))
+
+    def get_writer_part(self, key: str) -> Optional[Any]:
+        """Tamamlanmış writer parçası (resumable.section_key / results_key anahtarıyla)"""
+        with self._lock:
+            return self._data['writer'].get(key)
+
+    def completed_subtopics(self) -> List[int]:
+        with self._lock:
+            return sorted(int(index) for index in self._data['research'])
+
+    # =========================================================================
+    # YAZMA (her çağrı dosyayı atomik olarak günceller)
+    # =========================================================================
+
+    def set_stage(self, stage: str):
+        with self._lock:
+            self._data['stage'] = stage
+            self._flush()
+
+    def save_plan(self, plan: Dict):
+        with self._lock:
+            self._data['plan'] = plan
+            self._data['stage'] = 'researching'
+            self._flush()
+
+    def save_research(self, index: int, result: Dict):
+        """
+        Alt başlık sonucunu kaydet
+
+        Önceki run'da başarısız sonuçtan yazılmış bölüm ile tüm sonuçlara
+        bağlı parçalar (perspektif, giriş, sonuç) geçersiz olur.
+        """
+        with self._lock:
+            self._data['research'][str(index)] = result
+            stale = section_key(self._data['plan']['subtopics'][index]['title'])
+            writer = self._data['writer']
+            for key in list(writer):
+                if key == stale or key.rsplit('_', 1)[0] in AGGREGATE_PARTS:
+                    del writer[key]
+            self._flush()
+
+    def save_writer_part(self, key: str, value: Any):
+        if value is None:
+            return
+
+        with self._lock:
+            self._data['writer'][key] = value
+            self._flush()
+
+    def mark_completed(self):
+        """Çalıştırma bitti: dosyayı sil (checkpoint.keep_completed ile korunur)"""
+        from src.utils.config_loader import get_config
+
+        with self._lock:
+            self._data['stage'] = 'done'
+            self._data['completed'] = True
+
+            if get_config('checkpoint.keep_completed', False):
+                self._flush()
+            elif self.path.exists():
+                self.path.unlink()
+
+    def _flush(self):
+        self._data['updated_at'] = datetime.now().isoformat()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, self.path)
+
+
+def list_checkpoints(checkpoint_dir: Optional[Path] = None) -> List[Dict]:
+    """Devam ettirilebilecek çalıştırmalar (en yeni önce)"""
+    checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else get_checkpoint_dir()
+
+    runs = []
+    for path in checkpoint_dir.glob("*.json"):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+
+        if not data.get('completed'):
+            runs.append({
+                'run_id': data['run_id'],
+                'topic': data['topic'],
+                'stage': data['stage'],
+                'completed_subtopics': len(data.get('research', {})),
+                'updated_at': data.get('updated_at')
+            })
+
+    return sorted(runs, key=lambda run: run['updated_at'] or '', reverse=True)
@@ -0,0 +1,199 @@
+"""
+Task DAG - Bağımlılık Tabanlı Async Zamanlayıcı
+===============================================
+
+Workflow'u küçük bir görev grafiği olarak çalıştırır: her düğüm tüm
+girdileri hazır olduğu anda başlar, aşama sınırı beklemez.
+
+    research_i ──▶ section_i ─────────────────────┐
+         └──────▶ perspectives ──▶ intro ──────────┼──▶ rapor
+                              └──▶ conclusion ─────┘
+
+Böylece bölüm 1 yazılırken bölüm 4 hâlâ araştırılabilir; toplam süre
+"en yavaş araştırma + tüm yazım" yerine en yavaş tek zincire iner.
+
+Kullanım:
+    graph = TaskGraph()
+    graph.add('research_1', research, args=(subtopic,))
+    graph.add('section_1', write_section, deps=['research_1'])
+    results = await graph.run()
+
+Düğüm fonksiyonu async'tir; önce `args`, ardından bağımlılıkların
+sonuçları (deps sırasıyla) pozisyonel argüman olarak verilir.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class TaskNode:
+    """Graf düğümü"""
+
+    def __init__(self, name: str, func: Callable[..., Awaitable[Any]], deps: Tuple[str, ...], args: Tuple):
+        self.name = name
+        self.func = func
+        self.deps = deps
+        self.args = args
+
+        # Çalışma zamanı (graph.run başlangıcına göre saniye)
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+
+class TaskGraph:
+    """Bağımlılıkları hazır olan düğümü hemen çalıştıran async DAG"""
+
+    def __init__(self):
+        self.nodes: Dict[str, TaskNode] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Awaitable[Any]],
+        deps: Iterable[str] = (),
+        args: Tuple = ()
+    ) -> "TaskGraph":
+        """Düğüm ekle (bağımlılıklar daha sonra eklenebilir, run'da doğrulanır)"""
+        if name in self.nodes:
+            raise ValueError(f"Düğüm zaten var: {name}")
+
+        self.nodes[name] = TaskNode(name, func, tuple(deps), tuple(args))
+        return self
+
+    def order(self) -> List[str]:
+        """Topolojik sıra (bilinmeyen bağımlılık veya döngüde ValueError)"""
+        for node in self.nodes.values():
+            for dep in node.deps:
+                if dep not in self.nodes:
+                    raise ValueError(f"{node.name}: bilinmeyen bağımlılık {dep}")
+
+        remaining = {name: len(node.deps) for name, node in self.nodes.items()}
+        dependents: Dict[str, List[str]] = {name: [] for name in self.nodes}
+        for node in self.nodes.values():
+            for dep in node.deps:
+                dependents[dep].append(node.name)
+
+        ready = [name for name, count in remaining.items() if count == 0]
+        order = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for dependent in dependents[name]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(self.nodes):
+            cycle = sorted(name for name, count in remaining.items() if count)
+            raise ValueError(f"Grafta döngü var: {cycle}")
+
+        return order
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Tüm düğümleri çalıştır
+
+        Bir düğüm hata verirse kalan düğümler iptal edilir ve hata yükseltilir
+        (düğüm içinde tolere edilecek hatalar düğüm fonksiyonunda yakalanmalı).
+
+        Returns:
+            {düğüm adı: sonuç}
+        """
+        order = self.order()
+        start = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_node(node: TaskNode):
+            inputs = [await tasks[dep] for dep in node.deps]
+
+            node.started_at = time.perf_counter() - start
+            try:
+                return await node.func(*node.args, *inputs)
+            finally:
+                node.finished_at = time.perf_counter() - start
+
+        # Topolojik sırayla oluşturulur: her düğüm bağımlılıklarının task'ını bulur
+        for name in order:
+            tasks[name] = asyncio.ensure_future(run_node(self.nodes[name]))
+
+        try:
+            done, pending = await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        return {name: task.result() for name, task in tasks.items()}
+
+    def critical_path(self) -> Tuple[List[str], float]:
+        """
+        Son run'daki kritik yol (bitişi en geç olan düğüm zinciri) ve süresi
+
+        Her adımda bağımlılıklardan en geç biteni izlenir.
+        """
+        finished = [node for node in self.nodes.values() if node.finished_at is not None]
+        if not finished:
+            return [], 0.0
+
+        node = max(finished, key=lambda n: n.finished_at)
+        total = node.finished_at
+        path = [node.name]
+
+        while node.deps:
+            node = max((self.nodes[dep] for dep in node.deps), key=lambda n: n.finished_at or 0)
+            path.append(node.name)
+
+        return list(reversed(path)), total
+
+
+# Test (sahte gecikmelerle: aşamalı akış vs DAG)
+if __name__ == "__main__":
+    import random
+
+    random.seed(1)
+    research_times = [random.uniform(2, 10) for _ in range(6)]
+    section_times = [random.uniform(2, 4) for _ in range(6)]
+    SCALE = 0.02  # 1 birim = 20ms
+
+    async def fake(duration: float, *_inputs):
+        await asyncio.sleep(duration * SCALE)
+        return duration
+
+    async def staged() -> float:
+        start = time.perf_counter()
+        await asyncio.gather(*(fake(t) for t in research_times))
+        await fake(1)  # perspektifler
+        await asyncio.gather(*(fake(t) for t in section_times), fake(2), fake(2))
+        return time.perf_counter() - start
+
+    async def dag() -> Tuple[float, TaskGraph]:
+        graph = TaskGraph()
+        for i, (research_time, section_time) in enumerate(zip(research_times, section_times)):
+            graph.add(f'research_{i}', fake, args=(research_time,))
+            graph.add(f'section_{i}', fake, deps=[f'research_{i}'], args=(section_time,))
+        graph.add('perspectives', fake, deps=[f'research_{i}' for i in range(6)], args=(1,))
+        graph.add('intro', fake, deps=['perspectives'], args=(2,))
+        graph.add('conclusion', fake, deps=['perspectives'], args=(2,))
+
+        start = time.perf_counter()
+        await graph.run()
+        return time.perf_counter() - start, graph
+
+    staged_time = asyncio.run(staged())
+    dag_time, graph = asyncio.run(dag())
+    path, _ = graph.critical_path()
+
+    print(f"Aşamalı (gather → yaz): {staged_time / SCALE:5.1f} birim")
+    print(f"DAG:                    {dag_time / SCALE:5.1f} birim")
+    print(f"Kritik yol: {' → '.join(path)}")
+
+    # Döngü tespiti
+    cyclic = TaskGraph().add('a', fake, deps=['b']).add('b', fake, deps=['a'])
+    try:
+        cyclic.order()
+    except ValueError as e:
+        print(f"Döngü yakalandı: {e}")
@@ -0,0 +1,274 @@
+"""
+Job Runner - Arka Plan Araştırma İşleri
+=======================================
+
+Araştırma pipeline'ını Streamlit script thread'i yerine süreç genelinde
+tek bir arka plan event loop'unda çalıştırır.
+
+- Kalıcı event loop thread'i (ilk submit'te başlar)
+- Her iş kendi ResearchOrchestrator'ına sahip
+- İlerleme olayları iş başına thread-safe kuyruğa yazılır; UI poll eder
+- Aynı anda çalışan iş sayısı sınırlı (performance.max_concurrent_jobs)
+- Biten işler job_ttl_seconds sonra unutulur
+
+Streamlit rerun'ı veya ikinci bir sekme işi yeniden başlatmaz: session
+yalnızca job_id'yi tutar, işin durumuna ve olaylarına tekrar bağlanır.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+# İş durumları
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATUSES = (DONE, FAILED, CANCELLED)
+
+
+class ResearchJob:
+    """Tek bir araştırma işi"""
+
+    def __init__(self, job_id: str, topic: str, context: Optional[str] = None, streaming: bool = True):
+        self.job_id = job_id
+        self.topic = topic
+        self.context = context
+        self.streaming = streaming
+
+        self.status = QUEUED
+        self.result: Optional[Dict] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+
+        # Orchestrator olayları (UI poll eder)
+        self.events: "queue.Queue[Dict]" = queue.Queue()
+        self.future: Optional[Future] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+
+class JobRunner:
+    """Araştırma işlerini arka plan event loop'unda çalıştırır"""
+
+    def __init__(self, max_concurrent_jobs: int = 2, job_ttl_seconds: float = 3600):
+        """
+        Args:
+            max_concurrent_jobs: Aynı anda çalışan maksimum iş
+            job_ttl_seconds: Biten işin durumunun tutulduğu süre
+        """
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.job_ttl_seconds = job_ttl_seconds
+
+        self._jobs: Dict[str, ResearchJob] = {}
+        self._lock = threading.Lock()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._job_semaphore: Optional[asyncio.Semaphore] = None
+
+    # =========================================================================
+    # PUBLIC API (herhangi bir thread'den çağrılabilir)
+    # =========================================================================
+
+    def submit(self, topic: str, context: Optional[str] = None, streaming: bool = True) -> str:
+        """
+        Yeni araştırma işi başlat
+
+        Returns:
+            job_id
+        """
+        loop = self._ensure_loop()
+        self._prune()
+
+        job = ResearchJob(job_id=uuid.uuid4().hex[:12], topic=topic, context=context, streaming=streaming)
+
+        with self._lock:
+            self._jobs[job.job_id] = job
+
+        job.future = asyncio.run_coroutine_threadsafe(self._run_job(job), loop)
+        job.future.add_done_callback(lambda future: self._on_job_done(job, future))
+        logger.info(f"Araştırma işi kuyruğa alındı: {job.job_id} ({topic[:50]})")
+
+        return job.job_id
+
+    def get(self, job_id: str) -> Optional[ResearchJob]:
+        """İşi döndür (bilinmiyorsa veya süresi dolduysa None)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def poll(self, job_id: str, max_events: Optional[int] = None) -> List[Dict]:
+        """İşin yeni ilerleme olaylarını al (bloklamaz)"""
+        job = self.get(job_id)
+        if job is None:
+            return []
+
+        events = []
+        while max_events is None or len(events) < max_events:
+            try:
+                events.append(job.events.get_nowait())
+            except queue.Empty:
+                break
+
+        return events
+
+    def cancel(self, job_id: str) -> bool:
+        """İşi iptal et"""
+        job = self.get(job_id)
+        if job is None or job.finished or job.future is None:
+            return False
+
+        return job.future.cancel()
+
+    def active_jobs(self) -> List[ResearchJob]:
+        """Kuyrukta veya çalışmakta olan işler"""
+        with self._lock:
+            return [job for job in self._jobs.values() if not job.finished]
+
+    # =========================================================================
+    # EVENT LOOP
+    # =========================================================================
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run():
+                    asyncio.set_event_loop(loop)
+                    self._job_semaphore = asyncio.Semaphore(self.max_concurrent_jobs)
+                    ready.set()
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=run, name="research-jobs", daemon=True)
+                self._thread.start()
+                ready.wait()
+
+                self._loop = loop
+                logger.info(f"Job runner başlatıldı (max_concurrent_jobs={self.max_concurrent_jobs})")
+
+        return self._loop
+
+    async def _run_job(self, job: ResearchJob):
+        try:
+            async with self._job_semaphore:
+                job.status = RUNNING
+                job.events.put({
+                    'stage': 'planning',
+                    'type': 'status',
+                    'data': {'message': '🚀 Araştırma başlatıldı', 'progress': 0}
+                })
+
+                from src.workflow.orchestrator import ResearchOrchestrator
+
+                # Ajan/model kurulumu bloklayıcı olabilir → loop dışında
+                orchestrator = await asyncio.get_running_loop().run_in_executor(None, ResearchOrchestrator)
+
+                if job.streaming:
+                    await self._run_streaming(job, orchestrator)
+                else:
+                    await self._run_blocking(job, orchestrator)
+
+        except Exception as e:
+            logger.error(f"Araştırma işi başarısız ({job.job_id}): {e}")
+            job.error = str(e)
+            job.events.put({'stage': 'error', 'type': 'error', 'data': {'error': str(e)}})
+            self._finish(job, FAILED)
+
+    async def _run_streaming(self, job: ResearchJob, orchestrator):
+        status = DONE
+
+        async for update in orchestrator.run_research_streaming(topic=job.topic, context=job.context):
+            if update.get('type') == 'final':
+                job.result = update['data']
+            elif update.get('type') == 'error':
+                job.error = update.get('data', {}).get('error', 'Bilinmeyen hata')
+                status = FAILED
+
+            job.events.put(update)
+
+        self._finish(job, status)
+
+    async def _run_blocking(self, job: ResearchJob, orchestrator):
+        def progress_callback(stage: str, progress: int):
+            job.events.put({
+                'stage': stage,
+                'type': 'status',
+                'data': {
+                    'progress': progress,
+                    'concurrency': orchestrator.current_state.get('concurrency')
+                }
+            })
+
+        result = await orchestrator.run_research(
+            topic=job.topic,
+            context=job.context,
+            progress_callback=progress_callback
+        )
+
+        job.result = result
+        if result.get('success', True):
+            job.events.put({'stage': 'done', 'type': 'final', 'data': result})
+            self._finish(job, DONE)
+        else:
+            job.error = result.get('error', 'Bilinmeyen hata')
+            job.events.put({'stage': 'error', 'type': 'error', 'data': {'error': job.error}})
+            self._finish(job, FAILED)
+
+    @staticmethod
+    def _finish(job: ResearchJob, status: str):
+        """İşi bitmiş olarak işaretle (son olay kuyruğa yazıldıktan sonra)"""
+        job.finished_at = time.time()
+        job.status = status
+
+    def _on_job_done(self, job: ResearchJob, future: Future):
+        # Başlamadan veya çalışırken iptal edilen işler
+        if future.cancelled() and not job.finished:
+            job.events.put({'stage': 'error', 'type': 'error', 'data': {'error': 'İş iptal edildi'}})
+            self._finish(job, CANCELLED)
+
+    def _prune(self):
+        """Süresi dolan bitmiş işleri unut"""
+        cutoff = time.time() - self.job_ttl_seconds
+
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished and job.finished_at and job.finished_at < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+
+# Süreç genelinde tek instance (tüm Streamlit oturumları paylaşır)
+_job_runner: Optional[JobRunner] = None
+_job_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> JobRunner:
+    """Paylaşılan job runner'ı döndür (config.yaml'dan)"""
+    global _job_runner
+
+    if _job_runner is None:
+        with _job_runner_lock:
+            if _job_runner is None:
+                from src.utils.config_loader import get_config
+
+                _job_runner = JobRunner(
+                    max_concurrent_jobs=get_config('performance.max_concurrent_jobs', 2),
+                    job_ttl_seconds=get_config('performance.job_ttl_seconds', 3600)
+                )
+
+    return _job_runner
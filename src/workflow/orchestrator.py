@@ -5,7 +5,9 @@ Research Orchestrator - Ana Koordinatör
 Tüm research workflow'unu yöneten ana sistem:
 1. Planner ile plan oluştur
 2. Her alt başlık için Researcher çalıştır (PARALEL)
-3. Tüm bulguları Writer'a gönder (STREAMING)
+3. Bulguları Writer'a gönder - run_research'te görev grafiği (DAG) ile
+   her bölüm kendi araştırması biter bitmez yazılır; streaming modda
+   tüm araştırma bitince (STREAMING)
 4. Final raporu üret
 
 Ayrıca:
@@ -15,12 +17,14 @@ Ayrıca:
 - Results caching
 - Paralel araştırma (asyncio)
 - Streaming report generation
+- Checkpoint + resume (run_research, plan/alt başlık/writer parçası bazında)
+- Öncelikli dağıtım + süre bütçesi (deadline_seconds, kademeli hafifletme)
 """
 
 import os
 import sys
 import asyncio
-from typing import Dict, List, Optional, AsyncGenerator
+from typing import Dict, List, Optional, AsyncGenerator, Tuple
 from datetime import datetime
 import json
 import time
@@ -30,8 +34,15 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 from src.agents.planner_agent import PlannerAgent
 from src.agents.researcher_agent import ResearcherAgent
-from src.agents.writer_agent import WriterAgent
-from src.utils.config_loader import config as config_loader
+from src.agents.writer_agent import WriterAgent, renumber_section
+from src.tools.crawler_pool import CrawlerPool
+from src.utils.config_loader import config as config_loader, should_enable_scraping
+from src.utils.hedging import hedge_stats
+from src.utils.llm_gateway import get_llm_gateway
+from src.utils.resumable import result_section_key, resumable, results_key
+from src.workflow.checkpoint import RunCheckpoint, checkpoints_enabled
+from src.workflow.dag import TaskGraph
+from src.workflow.scheduling import PrioritySemaphore, RunBudget, get_research_limiter
 
 # Config instance
 config = config_loader.get_all()
@@ -40,15 +51,35 @@ config = config_loader.get_all()
 class ResearchOrchestrator:
     """Tüm research sürecini koordine eder - Paralel + Streaming destekli"""
     
-    def __init__(self):
-        self.planner = PlannerAgent()
-        self.researcher = ResearcherAgent()
-        self.writer = WriterAgent()
+    def __init__(
+        self,
+        planner: Optional[PlannerAgent] = None,
+        researcher: Optional[ResearcherAgent] = None,
+        writer: Optional[WriterAgent] = None,
+        crawler_pool: Optional[CrawlerPool] = None,
+        semaphore: Optional[PrioritySemaphore] = None
+    ):
+        """
+        Args:
+            planner, researcher, writer: Paylaşılan ajanlar (None = yeni oluştur)
+            crawler_pool: Paylaşılan tarayıcı havuzu (verilirse run sonunda kapatılmaz)
+            semaphore: Araştırma limiti (None = süreç genelinde paylaşılan limit)
+        """
+        self.planner = planner or PlannerAgent()
+        self.researcher = researcher or ResearcherAgent()
+        self.writer = writer or WriterAgent()
+        self.gateway = get_llm_gateway()
         self.config = config
         
-        # Paralel request limiti (rate limit koruması)
-        max_concurrent = config.get('performance', {}).get('max_concurrent_requests', 5)
-        self.semaphore = asyncio.Semaphore(max_concurrent)
+        # Uzun ömürlü tarayıcı havuzu (ilk scrape'te açılır, run sonunda kapanır)
+        self.owns_crawler_pool = crawler_pool is None
+        self.crawler_pool = crawler_pool or CrawlerPool.from_config()
+        
+        # Paralel request limiti (rate limit koruması); boşalan slotu en
+        # yüksek öncelikli bekleyen alt başlık alır. Limit max_concurrent_requests
+        # ile başlar, AIMD ile gecikme/429'lara göre ayarlanır; tüm run'lar
+        # aynı limiti paylaşır (öğrenilen limit bir sonraki run'a taşınır)
+        self.semaphore = semaphore or get_research_limiter()
         
         self.current_state = {
             'stage': 'idle',  # idle, planning, researching, writing, done
@@ -63,18 +94,25 @@ class ResearchOrchestrator:
         self,
         topic: str,
         context: Optional[str] = None,
-        progress_callback=None
+        progress_callback=None,
+        checkpoint: Optional[RunCheckpoint] = None,
+        deadline_seconds: Optional[float] = None
     ) -> Dict:
         """
         Tam research workflow'unu çalıştır
         
+        Her aşamadan ve her tamamlanan alt başlıktan sonra checkpoint yazılır;
+        başarısız run resume(run_id) ile kaldığı yerden devam eder.
+        
         Args:
             topic: Araştırma konusu
             context: Ek bağlam (opsiyonel)
             progress_callback: Progress güncellemeleri için callback
+            checkpoint: Devam edilecek checkpoint (None = yeni run, checkpoint.enabled ise)
+            deadline_seconds: Süre bütçesi (None = scheduling.deadline_seconds, 0 = sınırsız)
         
         Returns:
-            dict: {plan, research_results, report, metadata}
+            dict: {run_id, plan, research_results, report, metadata}
         """
         print("\n" + "="*70)
         print("🚀 DEEP RESEARCH BAŞLATILIYOR")
@@ -82,64 +120,100 @@ class ResearchOrchestrator:
         print(f"📋 Konu: {topic}\n")
         
         start_time = datetime.now()
+        budget = RunBudget.from_config(deadline_seconds)
+        
+        if budget:
+            print(f"⏱️  Süre bütçesi: {budget.deadline_seconds:.0f} saniye\n")
         
         try:
+            if checkpoint is None and checkpoints_enabled():
+                checkpoint = await self.gateway.run_blocking(RunCheckpoint.create, topic, context)
+            
+            if checkpoint:
+                print(f"💾 Run ID: {checkpoint.run_id}\n")
+            
             # =================================================================
             # STAGE 1: PLANNING
             # =================================================================
             self._update_stage('planning', 10, progress_callback)
             print("📋 STAGE 1/3: Planlama...")
             
-            plan = self.planner.create_plan(topic, context)
-            self.current_state['plan'] = plan
-            
-            print(f"   ✅ Plan hazır: {len(plan['subtopics'])} alt başlık\n")
-            
-            # Planı validate et
-            validation = self.planner.validate_plan(plan)
-            if not validation['is_valid']:
-                raise ValueError(f"Plan geçersiz: {validation['issues']}")
+            if checkpoint and checkpoint.plan:
+                plan = checkpoint.plan
+                print(f"   ♻️  Plan checkpoint'ten yüklendi: {len(plan['subtopics'])} alt başlık\n")
+            else:
+                plan = await self.gateway.run_blocking(self.planner.create_plan, topic, context)
+                print(f"   ✅ Plan hazır: {len(plan['subtopics'])} alt başlık\n")
+                
+                # Planı validate et
+                validation = self.planner.validate_plan(plan)
+                if not validation['is_valid']:
+                    raise ValueError(f"Plan geçersiz: {validation['issues']}")
+                
+                if checkpoint:
+                    await self.gateway.run_blocking(checkpoint.save_plan, plan)
             
-            # =================================================================
-            # STAGE 2: RESEARCH (PARALEL)
-            # =================================================================
-            self._update_stage('researching', 20, progress_callback)
-            print("🔍 STAGE 2/3: Araştırma (Paralel Mod)...")
-            print(f"   {len(plan['subtopics'])} alt başlık araştırılacak...\n")
+            self.current_state['plan'] = plan
             
             # Paralel araştırma mı yoksa sequential mı?
             use_parallel = self.config.get('performance', {}).get('parallel_research', True)
             
             if use_parallel:
-                research_results = await self._parallel_research(
-                    plan['subtopics'], 
-                    progress_callback
+                # =============================================================
+                # STAGE 2-3: RESEARCH + WRITING (DAG)
+                # =============================================================
+                self._update_stage('researching', 20, progress_callback)
+                print("🔍 STAGE 2-3/3: Araştırma + rapor yazımı (görev grafiği)...")
+                print(f"   {len(plan['subtopics'])} alt başlık, her bölüm kendi araştırması biter bitmez yazılır\n")
+                
+                research_results, writer_output = await self._run_task_graph(
+                    topic,
+                    plan,
+                    progress_callback,
+                    checkpoint,
+                    budget
                 )
             else:
+                # =============================================================
+                # STAGE 2: RESEARCH (SEQUENTIAL)
+                # =============================================================
+                self._update_stage('researching', 20, progress_callback)
+                print("🔍 STAGE 2/3: Araştırma (Sequential Mod)...")
+                print(f"   {len(plan['subtopics'])} alt başlık araştırılacak...\n")
+                
                 research_results = await self._sequential_research(
                     plan['subtopics'],
-                    progress_callback
+                    progress_callback,
+                    checkpoint,
+                    budget
+                )
+                
+                self.current_state['research_results'] = research_results
+                print(f"   ✅ Araştırma tamamlandı: {len(research_results)} bölüm\n")
+                
+                # =============================================================
+                # STAGE 3: WRITING
+                # =============================================================
+                self._update_stage('writing', 85, progress_callback)
+                print("✍️  STAGE 3/3: Rapor yazımı...")
+                
+                if checkpoint:
+                    await self.gateway.run_blocking(checkpoint.set_stage, 'writing')
+                
+                # Writer agent artık dict döndürüyor (report + perspectives + quality)
+                # Tamamlanan parçalar (giriş, bölümler, ...) checkpoint'e yazılır
+                writer_output = await self.gateway.run_blocking(
+                    self.writer.write_report,
+                    topic=topic,
+                    plan=self._kept_plan(plan, research_results),
+                    research_results=research_results,
+                    style="professional",
+                    include_perspectives=True,
+                    checkpoint=checkpoint
                 )
-            
-            self.current_state['research_results'] = research_results
-            print(f"   ✅ Araştırma tamamlandı: {len(research_results)} bölüm\n")
-            
-            # =================================================================
-            # STAGE 3: WRITING
-            # =================================================================
-            self._update_stage('writing', 85, progress_callback)
-            print("✍️  STAGE 3/3: Rapor yazımı...")
-            
-            # Writer agent artık dict döndürüyor (report + perspectives + quality)
-            writer_output = self.writer.write_report(
-                topic=topic,
-                plan=plan,
-                research_results=research_results,
-                style="professional",
-                include_perspectives=True
-            )
             
             # State'e kaydet
+            self.current_state['research_results'] = research_results
             self.current_state['report'] = writer_output['report']
             self.current_state['perspectives'] = writer_output.get('perspectives')
             self.current_state['quality_metrics'] = writer_output.get('quality_metrics')
@@ -154,6 +228,9 @@ class ResearchOrchestrator:
             # =================================================================
             self._update_stage('done', 100, progress_callback)
             
+            if checkpoint:
+                await self.gateway.run_blocking(checkpoint.mark_completed)
+            
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
             
@@ -171,10 +248,14 @@ class ResearchOrchestrator:
             if writer_output.get('perspectives') and writer_output['perspectives'].get('has_conflict'):
                 print(f"⚖️  Perspektifler: {len(writer_output['perspectives']['perspectives'])}")
             
+            if budget and budget.degradations:
+                print(f"🪶 Süre bütçesi için hafifletilen alt başlık: {len(budget.degradations)}")
+            
             print(f"❌ Hata: {len(self.current_state['errors'])}\n")
             
             return {
                 'success': True,
+                'run_id': checkpoint.run_id if checkpoint else None,
                 'topic': topic,
                 'plan': plan,
                 'research_results': research_results,
@@ -186,8 +267,11 @@ class ResearchOrchestrator:
                     'end_time': end_time.isoformat(),
                     'duration_seconds': duration,
                     'subtopics_count': len(plan['subtopics']),
+                    'researched_subtopics': len(research_results),
                     'errors_count': len(self.current_state['errors']),
-                    'errors': self.current_state['errors']
+                    'errors': self.current_state['errors'],
+                    'schedule': budget.summary() if budget else None,
+                    'hedging': hedge_stats()
                 }
             }
             
@@ -199,25 +283,64 @@ class ResearchOrchestrator:
                 'fatal': True
             })
             
+            if checkpoint:
+                print(f"💾 Kaldığı yerden devam için: python main.py --resume {checkpoint.run_id}\n")
+            
             return {
                 'success': False,
+                'run_id': checkpoint.run_id if checkpoint else None,
                 'error': str(e),
                 'partial_state': self.current_state
             }
+        
+        finally:
+            await self._close_crawler_pool()
+    
+    async def resume(self, run_id: str, progress_callback=None) -> Dict:
+        """
+        Yarıda kalan run'a kaldığı yerden devam et
+        
+        Kayıtlı plan ve başarılı alt başlıklar yeniden çalıştırılmaz;
+        yalnızca eksik/başarısız alt başlıklar ve yazılmamış rapor
+        parçaları üretilir.
+        
+        Raises:
+            ValueError: run_id biçimi geçersizse
+            FileNotFoundError: run_id için checkpoint yoksa
+        """
+        checkpoint = RunCheckpoint.load(run_id)
+        
+        print(f"\n♻️  Devam ediliyor: {run_id} (aşama: {checkpoint.stage}, "
+              f"{len(checkpoint.completed_subtopics())} alt başlık hazır)")
+        
+        return await self.run_research(
+            topic=checkpoint.topic,
+            context=checkpoint.context,
+            progress_callback=progress_callback,
+            checkpoint=checkpoint
+        )
     
     async def run_research_streaming(
         self,
         topic: str,
         context: Optional[str] = None,
-        progress_callback=None
+        progress_callback=None,
+        deadline_seconds: Optional[float] = None,
+        checkpoint: Optional[RunCheckpoint] = None
     ) -> AsyncGenerator[Dict, None]:
         """
         Streaming research workflow - her güncellemeyi anında yield et
         
+        run_research ile aynı checkpoint'leri yazar (plan, alt başlık
+        sonuçları, tamamlanan rapor parçaları); yarıda kalan run
+        resume(run_id) ile sürdürülebilir.
+        
         Args:
             topic: Araştırma konusu
             context: Ek bağlam
             progress_callback: Progress callback
+            deadline_seconds: Süre bütçesi (None = scheduling.deadline_seconds, 0 = sınırsız)
+            checkpoint: Devam edilecek checkpoint (None = yeni run, checkpoint.enabled ise)
             
         Yields:
             dict: {
@@ -227,16 +350,27 @@ class ResearchOrchestrator:
             }
         """
         start_time = datetime.now()
+        budget = RunBudget.from_config(deadline_seconds)
         
         try:
+            if checkpoint is None and checkpoints_enabled():
+                checkpoint = await self.gateway.run_blocking(RunCheckpoint.create, topic, context)
+            
             # STAGE 1: PLANNING
             yield {
                 'stage': 'planning',
                 'type': 'status',
-                'data': {'message': '📋 Plan oluşturuluyor...', 'progress': 10}
+                'data': {
+                    'message': '📋 Plan oluşturuluyor...',
+                    'progress': 10,
+                    'run_id': checkpoint.run_id if checkpoint else None
+                }
             }
             
-            plan = self.planner.create_plan(topic, context)
+            if checkpoint and checkpoint.plan:
+                plan = checkpoint.plan
+            else:
+                plan = await self.gateway.run_blocking(self.planner.create_plan, topic, context)
             self.current_state['plan'] = plan
             
             yield {
@@ -254,22 +388,30 @@ class ResearchOrchestrator:
             if not validation['is_valid']:
                 raise ValueError(f"Plan geçersiz: {validation['issues']}")
             
+            if checkpoint and not checkpoint.plan:
+                await self.gateway.run_blocking(checkpoint.save_plan, plan)
+            
             # STAGE 2: RESEARCH (PARALLEL)
             yield {
                 'stage': 'researching',
                 'type': 'status',
                 'data': {
                     'message': f'🔍 Araştırma başlıyor ({len(plan["subtopics"])} alt başlık)...',
-                    'progress': 20
+                    'progress': 20,
+                    'concurrency': self.semaphore.snapshot()
                 }
             }
             
             use_parallel = self.config.get('performance', {}).get('parallel_research', True)
             
             if use_parallel:
-                research_results = await self._parallel_research(plan['subtopics'], progress_callback)
+                research_results = await self._parallel_research(
+                    plan['subtopics'], progress_callback, checkpoint, budget
+                )
             else:
-                research_results = await self._sequential_research(plan['subtopics'], progress_callback)
+                research_results = await self._sequential_research(
+                    plan['subtopics'], progress_callback, checkpoint, budget
+                )
             
             self.current_state['research_results'] = research_results
             
@@ -279,11 +421,15 @@ class ResearchOrchestrator:
                 'data': {
                     'research_results': research_results,
                     'message': f'✅ Araştırma tamamlandı: {len(research_results)} bölüm',
-                    'progress': 80
+                    'progress': 80,
+                    'concurrency': self.semaphore.snapshot()
                 }
             }
             
             # STAGE 3: WRITING (STREAMING)
+            if checkpoint:
+                await self.gateway.run_blocking(checkpoint.set_stage, 'writing')
+            
             yield {
                 'stage': 'writing',
                 'type': 'status',
@@ -298,18 +444,19 @@ class ResearchOrchestrator:
             perspectives = None
             quality_metrics = None
             
-            for chunk in self.writer.write_report_streaming(
+            async for chunk in self.gateway.iterate(self.writer.write_report_streaming(
                 topic=topic,
-                plan=plan,
+                plan=self._kept_plan(plan, research_results),
                 research_results=research_results,
                 style="professional",
-                include_perspectives=True
-            ):
+                include_perspectives=True,
+                checkpoint=checkpoint
+            )):
                 # Metin chunk'larını topla
                 if chunk['type'] in ['metadata', 'intro', 'section', 'conclusion']:
                     full_report += chunk['content']
                 
-                # Perspektif sonuçlarını sakla
+                # Kalite metrikleri (ara skorlar bölüm sonlarında, son chunk tam skor)
                 if chunk['type'] == 'quality':
                     quality_metrics = chunk['content']
                 
@@ -323,6 +470,9 @@ class ResearchOrchestrator:
             self.current_state['report'] = full_report
             self.current_state['quality_metrics'] = quality_metrics
             
+            if checkpoint:
+                await self.gateway.run_blocking(checkpoint.mark_completed)
+            
             # DONE
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
@@ -332,6 +482,7 @@ class ResearchOrchestrator:
                 'type': 'final',
                 'data': {
                     'success': True,
+                    'run_id': checkpoint.run_id if checkpoint else None,
                     'topic': topic,
                     'plan': plan,
                     'research_results': research_results,
@@ -342,7 +493,9 @@ class ResearchOrchestrator:
                         'end_time': end_time.isoformat(),
                         'duration_seconds': duration,
                         'subtopics_count': len(plan['subtopics']),
-                        'errors_count': len(self.current_state['errors'])
+                        'researched_subtopics': len(research_results),
+                        'errors_count': len(self.current_state['errors']),
+                        'schedule': budget.summary() if budget else None
                     },
                     'message': f'✅ Tamamlandı! Süre: {duration:.1f}s'
                 }
@@ -360,15 +513,25 @@ class ResearchOrchestrator:
                 'type': 'error',
                 'data': {
                     'success': False,
+                    'run_id': checkpoint.run_id if checkpoint else None,
                     'error': str(e),
                     'state': self.current_state
                 }
             }
+        
+        finally:
+            await self._close_crawler_pool()
+    
+    async def _close_crawler_pool(self):
+        """Havuz bu orchestrator'a aitse kapat (paylaşılan havuz açık kalır)"""
+        if self.owns_crawler_pool:
+            await self.crawler_pool.close()
     
     def _update_stage(self, stage: str, progress: int, callback=None):
-        """İç kullanım: stage ve progress güncelle"""
+        """İç kullanım: stage, progress ve eşzamanlılık durumunu güncelle"""
         self.current_state['stage'] = stage
         self.current_state['progress'] = progress
+        self.current_state['concurrency'] = self.semaphore.snapshot()
         
         if callback:
             callback(stage, progress)
@@ -377,13 +540,19 @@ class ResearchOrchestrator:
         """Mevcut durumu döndür"""
         return self.current_state.copy()
     
-    def save_results(self, results: Dict, output_dir: str = "output"):
-        """Sonuçları dosyalara kaydet (perspectives + quality metrics dahil)"""
+    def save_results(self, results: Dict, output_dir: str = "output", base_name: Optional[str] = None):
+        """
+        Sonuçları dosyalara kaydet (perspectives + quality metrics dahil)
+        
+        Args:
+            base_name: Dosya adı öneki (None = research_<zaman damgası>)
+        """
         
         os.makedirs(output_dir, exist_ok=True)
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        base_name = f"research_{timestamp}"
+        if base_name is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            base_name = f"research_{timestamp}"
         
         # 1. Rapor (Markdown)
         report_file = os.path.join(output_dir, f"{base_name}_report.md")
@@ -438,6 +607,142 @@ class ResearchOrchestrator:
             'metadata': meta_file
         }
     
+    # =========================================================================
+    # HELPER METHODS - GÖREV GRAFİĞİ
+    # =========================================================================
+    
+    async def _run_task_graph(
+        self,
+        topic: str,
+        plan: Dict,
+        progress_callback=None,
+        checkpoint: Optional[RunCheckpoint] = None,
+        budget: Optional[RunBudget] = None
+    ) -> Tuple[List[Dict], Dict]:
+        """
+        Araştırma ve yazımı tek DAG'da çalıştır
+        
+            research_i ──▶ section_i
+            research_* ──▶ perspectives ──▶ intro, conclusion
+        
+        Bölüm i yalnızca araştırma i'yi bekler; giriş, sonuç ve perspektifler
+        tüm araştırmaları. Yazım düğümleri writer'ın paralellik limitini
+        (report.parallel_sections kapalıysa 1) paylaşır. Süre bütçesi
+        nedeniyle atlanan alt başlığın bölümü de yazılmaz.
+        
+        Returns:
+            (research_results, writer_output)
+        """
+        subtopics = plan['subtopics']
+        total = len(subtopics)
+        research_nodes = [f'research_{i}' for i in range(1, total + 1)]
+        
+        write_slots = asyncio.Semaphore(self.writer.max_workers if self.writer.parallel_sections else 1)
+        
+        async def research(index: int, subtopic: Dict) -> Optional[Dict]:
+            try:
+                return await self._research_single_subtopic(
+                    subtopic=subtopic,
+                    index=index,
+                    total=total,
+                    progress_callback=progress_callback,
+                    checkpoint=checkpoint,
+                    budget=budget
+                )
+            except Exception as e:
+                print(f"   ❌ Subtopic {index} başarısız: {e}")
+                return self._failed_research_result(subtopic, e)
+        
+        async def write(key: str, func, *args):
+            async with write_slots:
+                return await self.gateway.run_blocking(resumable, checkpoint, key, func, *args)
+        
+        async def section(index: int, result: Optional[Dict]) -> Optional[str]:
+            if result is None:
+                return None
+            return await write(result_section_key(result), self.writer.write_section, topic, result, index)
+        
+        async def perspectives(*results: Optional[Dict]) -> Optional[Dict]:
+            # Tüm araştırmalar bitti: kalan iş yazım
+            self._update_stage('writing', 85, progress_callback)
+            self.current_state['research_results'] = kept(results)
+            if checkpoint:
+                await self.gateway.run_blocking(checkpoint.set_stage, 'writing')
+            
+            return await write(
+                results_key('perspectives', kept(results)), self.writer.analyze_perspectives, topic, kept(results)
+            )
+        
+        async def intro(perspectives: Optional[Dict], *results: Optional[Dict]) -> str:
+            return await write(
+                results_key('intro', kept(results)), self.writer.write_intro,
+                topic, self._kept_plan(plan, kept(results)), kept(results), perspectives
+            )
+        
+        async def conclusion(perspectives: Optional[Dict], *results: Optional[Dict]) -> str:
+            return await write(
+                results_key('conclusion', kept(results)), self.writer.write_conclusion, topic, kept(results), perspectives
+            )
+        
+        def kept(results) -> List[Dict]:
+            return [result for result in results if result is not None]
+        
+        # Düğümler öncelik sırasıyla eklenir: ilk slotlar da önemli alt başlıklara gider
+        graph = TaskGraph()
+        for i, subtopic in self._dispatch_order(subtopics):
+            graph.add(f'research_{i}', research, args=(i, subtopic))
+            graph.add(f'section_{i}', section, deps=[f'research_{i}'], args=(i,))
+        graph.add('perspectives', perspectives, deps=research_nodes)
+        graph.add('intro', intro, deps=['perspectives'] + research_nodes)
+        graph.add('conclusion', conclusion, deps=['perspectives'] + research_nodes)
+        
+        start_time = time.time()
+        outputs = await graph.run()
+        
+        critical_path, _ = graph.critical_path()
+        print(f"\n   ⚡ Araştırma + yazım tamamlandı: {time.time() - start_time:.1f} saniye")
+        print(f"   🧭 Kritik yol: {' → '.join(critical_path)}")
+        
+        research_results = kept(outputs[name] for name in research_nodes)
+        
+        # Atlanan alt başlık varsa bölüm başlıkları yeniden numaralanır (## 4. → ## 3.)
+        sections = [
+            renumber_section(outputs[f'section_{i}'], number)
+            for number, i in enumerate(
+                (i for i in range(1, total + 1) if outputs[f'section_{i}'] is not None), 1
+            )
+        ]
+        
+        writer_output = await self.gateway.run_blocking(
+            self.writer.assemble_report,
+            topic,
+            research_results,
+            outputs['perspectives'],
+            outputs['intro'],
+            sections,
+            outputs['conclusion']
+        )
+        
+        return research_results, writer_output
+    
+    @staticmethod
+    def _kept_plan(plan: Dict, research_results: List[Dict]) -> Dict:
+        """Süre bütçesi nedeniyle atlanan alt başlıklar çıkarılmış plan"""
+        titles = {result.get('subtopic_title') for result in research_results}
+        return {**plan, 'subtopics': [s for s in plan['subtopics'] if s['title'] in titles]}
+    
+    @staticmethod
+    def _failed_research_result(subtopic: Dict, error: Exception) -> Dict:
+        """Başarısız alt başlık için yer tutucu sonuç (rapor yine yazılır)"""
+        return {
+            'topic': subtopic['question'],
+            'subtopic_title': subtopic['title'],
+            'error': str(error),
+            'key_findings': [],
+            'summary': f"Bu bölüm için araştırma başarısız oldu: {error}",
+            'confidence': 0
+        }
+    
     # =========================================================================
     # HELPER METHODS - PARALEL RESEARCH
     # =========================================================================
@@ -445,24 +750,30 @@ class ResearchOrchestrator:
     async def _parallel_research(
         self,
         subtopics: List[Dict],
-        progress_callback=None
+        progress_callback=None,
+        checkpoint: Optional[RunCheckpoint] = None,
+        budget: Optional[RunBudget] = None
     ) -> List[Dict]:
         """
         Paralel araştırma - Tüm subtopic'leri aynı anda araştır
-        Rate limit koruması ile (semaphore)
+        Rate limit koruması ile (öncelikli semaphore); süre bütçesi
+        nedeniyle atlananlar sonuçta yer almaz
         """
-        print("   🚀 Paralel mod aktif (max 5 concurrent request)")
+        print(f"   🚀 Paralel mod aktif (eşzamanlılık limiti: {self.semaphore.limit})")
         
-        # Her subtopic için task oluştur
-        tasks = []
-        for i, subtopic in enumerate(subtopics, 1):
-            task = self._research_single_subtopic(
+        # Her subtopic için task oluştur (öncelik sırasıyla başlatılır,
+        # sonuçlar plan sırasıyla toplanır)
+        tasks = {}
+        for i, subtopic in self._dispatch_order(subtopics):
+            tasks[i] = asyncio.ensure_future(self._research_single_subtopic(
                 subtopic=subtopic,
                 index=i,
                 total=len(subtopics),
-                progress_callback=progress_callback
-            )
-            tasks.append(task)
+                progress_callback=progress_callback,
+                checkpoint=checkpoint,
+                budget=budget
+            ))
+        tasks = [tasks[i] for i in sorted(tasks)]
         
         # Paralel çalıştır (gather all)
         start_time = time.time()
@@ -477,15 +788,8 @@ class ResearchOrchestrator:
             if isinstance(result, Exception):
                 print(f"   ❌ Subtopic {i+1} başarısız: {result}")
                 # Fallback result
-                valid_results.append({
-                    'topic': subtopics[i]['question'],
-                    'subtopic_title': subtopics[i]['title'],
-                    'error': str(result),
-                    'key_findings': [],
-                    'summary': f"Bu bölüm için araştırma başarısız oldu: {result}",
-                    'confidence': 0
-                })
-            else:
+                valid_results.append(self._failed_research_result(subtopics[i], result))
+            elif result is not None:
                 valid_results.append(result)
         
         return valid_results
@@ -493,32 +797,49 @@ class ResearchOrchestrator:
     async def _sequential_research(
         self,
         subtopics: List[Dict],
-        progress_callback=None
+        progress_callback=None,
+        checkpoint: Optional[RunCheckpoint] = None,
+        budget: Optional[RunBudget] = None
     ) -> List[Dict]:
         """
         Sequential araştırma - Eski metod (fallback)
+        
+        Alt başlıklar öncelik sırasıyla araştırılır, sonuçlar plan
+        sırasıyla döner (atlananlar hariç).
         """
         print("   📝 Sequential mod (yavaş ama güvenli)")
         
-        research_results = []
+        results_by_index = {}
         total_subtopics = len(subtopics)
         
-        for i, subtopic in enumerate(subtopics, 1):
+        for step, (i, subtopic) in enumerate(self._dispatch_order(subtopics), 1):
             print(f"   [{i}/{total_subtopics}] {subtopic['title']}")
             
             # Progress güncelle
-            progress = 20 + (60 * i / total_subtopics)  # 20-80 arası
+            progress = 20 + (60 * step / total_subtopics)  # 20-80 arası
             self._update_stage('researching', progress, progress_callback)
             
+            saved = checkpoint.get_research(i - 1) if checkpoint else None
+            if saved is not None:
+                print("   ♻️  Checkpoint'ten alındı\n")
+                results_by_index[i] = saved
+                continue
+            
+            settings = self._research_settings(subtopic, budget)
+            if settings is None:
+                print("   ⏭️  Süre bütçesi doldu, atlandı\n")
+                continue
+            
             try:
-                result = await self.researcher.research_topic(
-                    topic=subtopic['question'],
-                    max_sources=5,
-                    scrape_content=False
-                )
+                result = await self._call_researcher(subtopic, settings, budget)
+                if result is None:
+                    print("   ⏭️  Süre bütçesi içinde bitmedi, atlandı\n")
+                    continue
+                
+                results_by_index[i] = result
                 
-                result['subtopic_title'] = subtopic['title']
-                research_results.append(result)
+                if checkpoint:
+                    await self.gateway.run_blocking(checkpoint.save_research, i - 1, result)
                 
                 print(f"   ✅ Tamamlandı (güven: {result.get('confidence', 0)}/5)\n")
                 
@@ -530,42 +851,90 @@ class ResearchOrchestrator:
                     'error': str(e)
                 })
                 
-                research_results.append({
-                    'topic': subtopic['question'],
-                    'error': str(e),
-                    'key_findings': [],
-                    'summary': f"Bu bölüm için araştırma başarısız oldu: {e}",
-                    'confidence': 0
-                })
-            
-            # Rate limiting
-            if i < total_subtopics:
-                print(f"   ⏳ Rate limit için 15 saniye bekleniyor...")
-                await asyncio.sleep(15)
+                results_by_index[i] = self._failed_research_result(subtopic, e)
         
-        return research_results
+        return [results_by_index[i] for i in sorted(results_by_index)]
+    
+    @staticmethod
+    def _dispatch_order(subtopics: List[Dict]) -> List[Tuple[int, Dict]]:
+        """(1 tabanlı indeks, alt başlık) - yüksek öncelik önce, eşitlikte plan sırası"""
+        return sorted(enumerate(subtopics, 1), key=lambda item: -item[1].get('priority', 3))
+    
+    @staticmethod
+    def _research_settings(subtopic: Dict, budget: Optional[RunBudget]) -> Optional[Dict]:
+        """Alt başlığın araştırma ayarları (bütçe atlattıysa None)"""
+        if budget is None:
+            return {'max_sources': 5, 'scrape_content': should_enable_scraping()}
+        
+        return budget.research_settings(subtopic, max_sources=5, scrape_content=should_enable_scraping())
+    
+    async def _call_researcher(
+        self,
+        subtopic: Dict,
+        settings: Dict,
+        budget: Optional[RunBudget] = None
+    ) -> Optional[Dict]:
+        """Researcher'ı çalıştır (bütçe varsa süre sınırıyla; aşılırsa None)"""
+        research = self.researcher.research_topic(
+            topic=subtopic['question'],
+            crawler_pool=self.crawler_pool,
+            **settings
+        )
+        
+        if budget is None:
+            result = await research
+        else:
+            try:
+                result = await asyncio.wait_for(research, timeout=budget.research_timeout())
+            except asyncio.TimeoutError:
+                budget.record(subtopic, 'timed_out')
+                return None
+        
+        result['subtopic_title'] = subtopic['title']
+        return result
     
     async def _research_single_subtopic(
         self,
         subtopic: Dict,
         index: int,
         total: int,
-        progress_callback=None
-    ) -> Dict:
+        progress_callback=None,
+        checkpoint: Optional[RunCheckpoint] = None,
+        budget: Optional[RunBudget] = None
+    ) -> Optional[Dict]:
         """
-        Tek bir subtopic'i araştır (rate limit korumalı)
+        Tek bir subtopic'i araştır (rate limit korumalı, öncelik sırasıyla)
+        
+        Checkpoint'te sonucu olan alt başlık yeniden araştırılmaz;
+        başarılı sonuç hemen checkpoint'e yazılır. Süre bütçesi nedeniyle
+        atlanırsa None döner.
         """
-        async with self.semaphore:  # Rate limit koruması
-            print(f"   [{index}/{total}] Başlatılıyor: {subtopic['title'][:50]}...")
+        saved = checkpoint.get_research(index - 1) if checkpoint else None
+        if saved is not None:
+            print(f"   [{index}/{total}] ♻️  Checkpoint'ten alındı: {subtopic['title'][:50]}")
+            return saved
+        
+        # Rate limit koruması; boşalan slotu en yüksek öncelikli bekleyen alır
+        async with self.semaphore.slot(subtopic.get('priority', 3)):
+            # Ayarlar başlama anındaki bütçeye göre belirlenir
+            settings = self._research_settings(subtopic, budget)
+            if settings is None:
+                print(f"   [{index}/{total}] ⏭️  Süre bütçesi doldu, atlandı: {subtopic['title'][:50]}")
+                return None
+            
+            print(
+                f"   [{index}/{total}] Başlatılıyor: {subtopic['title'][:50]}... "
+                f"({self.semaphore.in_flight}/{self.semaphore.limit} slot)"
+            )
             
             try:
-                result = await self.researcher.research_topic(
-                    topic=subtopic['question'],
-                    max_sources=5,
-                    scrape_content=False
-                )
+                result = await self._call_researcher(subtopic, settings, budget)
+                if result is None:
+                    print(f"   [{index}/{total}] ⏭️  Süre bütçesi içinde bitmedi, atlandı")
+                    return None
                 
-                result['subtopic_title'] = subtopic['title']
+                if checkpoint:
+                    await self.gateway.run_blocking(checkpoint.save_research, index - 1, result)
                 
                 print(f"   [{index}/{total}] ✅ Tamamlandı (güven: {result.get('confidence', 0)}/5)")
                 
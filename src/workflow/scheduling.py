@@ -0,0 +1,487 @@
+"""
+Scheduling - Öncelikli Dağıtım ve Süre Bütçesi
+==============================================
+
+- PrioritySemaphore: boş slot açıldığında bekleyenlerden en yüksek
+  öncelikli olan alır (eşit öncelikte geliş sırası). Planner'ın alt
+  başlıklara verdiği priority (1-5) önce önemli olanların araştırılmasını
+  sağlar.
+- RunBudget: run için deadline_seconds. Bütçenin bir kısmı yazıma
+  ayrılır; araştırma bütçesi doldukça yeni başlayan alt başlıklar
+  kademeli olarak hafifletilir:
+
+      kullanılan oran < skip_scraping_after   → tam araştırma
+      < reduce_sources_after                  → scraping yok
+      < 1.0                                   → scraping yok, az kaynak,
+                                                düşük öncelikliler atlanır
+      ≥ 1.0                                   → başlamamış alt başlıklar atlanır
+                                                (en az min_subtopics araştırılır)
+
+  Uçuştaki araştırma, araştırma bütçesi + research_grace_seconds içinde
+  bitmezse iptal edilip atlanır.
+- AdaptiveConcurrencyLimiter: boyutu AIMD ile değişen PrioritySemaphore.
+  Slot içindeki iş gecikmesi sağlıklı bittikçe limit toplamsal artar
+  (dolu pencere başına +1); 429/5xx/timeout görüldüğünde (gateway'in
+  tekrar denemeleri dahil) çarpımsal olarak düşer. get_research_limiter()
+  süreç genelinde tek limiter döndürür: öğrenilen limit run'lar (ve
+  Streamlit oturumları) arasında korunur, üst sınırı gateway'in
+  max_workers'ıdır.
+
+Ayarlar: config.yaml → scheduling
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from src.utils.retry_helper import CircuitOpenError, is_retryable, report_overload_to
+
+
+class PrioritySemaphore:
+    """
+    Bekleyenleri önceliğe göre uyandıran asyncio semaphore'u
+
+    Farklı thread'lerdeki event loop'lar (örn. eşzamanlı Streamlit
+    oturumları) aynı semaphore'u paylaşabilir: durum kilit altında
+    değişir, başka loop'un bekleyeni kendi loop'unda uyandırılır.
+    """
+
+    def __init__(self, value: int):
+        if value < 1:
+            raise ValueError("PrioritySemaphore en az 1 slot gerektirir")
+
+        self._limit = value
+        self._value = value  # boş slot (limit küçülünce negatif olabilir)
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._lock = threading.RLock()
+
+    async def acquire(self, priority: int = 0):
+        """Slot al (yüksek priority önce)"""
+        with self._lock:
+            if self._value > 0 and not self._waiters:
+                self._value -= 1
+                return
+
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (-priority, next(self._counter), future))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Slot verildikten sonra iptal edildiyse slotu geri ver
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        """Slotu bekleyen en yüksek öncelikliye devret (yoksa serbest bırak)"""
+        with self._lock:
+            self._value += 1
+            self._wake()
+
+    def _wake(self):
+        """Boş slotları bekleyenlere öncelik sırasıyla dağıt (kilit altında)"""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        while self._value > 0 and self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+
+            self._value -= 1
+            loop = future.get_loop()
+            if loop is running:
+                self._grant(future)
+                continue
+
+            try:
+                loop.call_soon_threadsafe(self._grant, future)
+            except RuntimeError:
+                # Bekleyenin loop'u kapanmış: slot boşta kalır
+                self._value += 1
+
+    def _grant(self, future: asyncio.Future):
+        """Slotu bekleyene ver; bu arada iptal edildiyse geri bırak"""
+        if future.done():
+            self.release()
+        else:
+            future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, priority: int = 0):
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self.limit - self._value
+
+    def snapshot(self) -> Dict:
+        """Progress olayları için anlık durum"""
+        return {'limit': self.limit, 'in_flight': self.in_flight, 'waiting': self.waiting}
+
+
+class AdaptiveConcurrencyLimiter(PrioritySemaphore):
+    """AIMD ile boyutu ayarlanan öncelikli semaphore"""
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        decrease_cooldown_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            initial_limit: Başlangıç eşzamanlılığı
+            min_limit, max_limit: Limitin alt/üst sınırı
+            backoff_ratio: Aşırı yük sinyalinde limitin çarpıldığı oran
+            latency_tolerance: Gecikme bu kat × ortalamayı aşarsa limit artmaz
+            decrease_cooldown_seconds: Art arda düşüşler arasındaki en kısa süre
+                (aynı dalganın 429'ları limiti tek seferde düşürür)
+            clock: Zaman kaynağı (test için değiştirilebilir)
+        """
+        initial_limit = min(max(initial_limit, min_limit), max_limit)
+        super().__init__(initial_limit)
+
+        self._limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.decrease_cooldown_seconds = decrease_cooldown_seconds
+        self.clock = clock
+
+        self._latency_avg: Optional[float] = None
+        self._last_decrease: Optional[float] = None
+
+    @classmethod
+    def from_config(cls, initial_limit: int, max_limit: Optional[int] = None) -> "AdaptiveConcurrencyLimiter":
+        """config.yaml → scheduling.concurrency_* (max_limit verilirse concurrency_max'ı da sınırlar)"""
+        from src.utils.config_loader import get_config
+
+        config_max = get_config('scheduling.concurrency_max', 16)
+        return cls(
+            initial_limit,
+            min_limit=get_config('scheduling.concurrency_min', 1),
+            max_limit=min(config_max, max_limit) if max_limit else config_max,
+            backoff_ratio=get_config('scheduling.concurrency_backoff_ratio', 0.5),
+            latency_tolerance=get_config('scheduling.concurrency_latency_tolerance', 2.0),
+            decrease_cooldown_seconds=get_config('scheduling.concurrency_cooldown_seconds', 5.0)
+        )
+
+    def _resize(self, new_limit: float, reason: str):
+        with self._lock:
+            old_limit = self.limit
+            self._limit = min(max(new_limit, self.min_limit), self.max_limit)
+
+            delta = self.limit - old_limit
+            if delta:
+                self._value += delta
+                self._wake()
+
+        if delta:
+            logger.info(f"Eşzamanlılık limiti {old_limit} → {self.limit} ({reason})")
+
+    def on_success(self, latency: float):
+        """Slot hatasız bitti: gecikme sağlıklı ve talep varsa limiti artır"""
+        with self._lock:
+            healthy = self._latency_avg is None or latency <= self.latency_tolerance * self._latency_avg
+            self._latency_avg = latency if self._latency_avg is None else 0.8 * self._latency_avg + 0.2 * latency
+
+            # Limit doluyken (bekleyen var ya da tüm slotlar kullanımda) kanıt sayılır
+            saturated = self.waiting > 0 or self.in_flight >= self.limit
+            if healthy and saturated:
+                # Toplamsal artış: limit kadar sağlıklı tamamlanma başına +1
+                self._resize(self._limit + 1 / self.limit, "sağlıklı gecikme")
+
+    def on_overload(self, error: Optional[BaseException] = None):
+        """429/5xx/timeout: limiti çarpımsal düşür (cooldown içinde bir kez)"""
+        with self._lock:
+            now = self.clock()
+            if self._last_decrease is not None and now - self._last_decrease < self.decrease_cooldown_seconds:
+                return
+
+            self._last_decrease = now
+            self._resize(self._limit * self.backoff_ratio, f"aşırı yük: {type(error).__name__ if error else '?'}")
+
+    @asynccontextmanager
+    async def slot(self, priority: int = 0):
+        """
+        Slot al; bloğun sonucunu ve içindeki geçici hataları limite yansıt
+
+        Gateway'in tekrar denediği 429'lar da (worker thread'lerinde olsa
+        bile) report_overload_to üzerinden buraya ulaşır.
+        """
+        await self.acquire(priority)
+
+        loop = asyncio.get_running_loop()
+        overloaded = []
+
+        def listener(error: BaseException):
+            overloaded.append(error)
+            loop.call_soon_threadsafe(self.on_overload, error)
+
+        started = self.clock()
+        try:
+            with report_overload_to(listener):
+                yield
+        except Exception as e:
+            if is_retryable(e) or isinstance(e, CircuitOpenError):
+                self.on_overload(e)
+            raise
+        else:
+            if not overloaded:
+                self.on_success(self.clock() - started)
+        finally:
+            self.release()
+
+
+def create_research_limiter(initial_limit: int, max_limit: Optional[int] = None) -> PrioritySemaphore:
+    """Alt başlık araştırma limiti (scheduling.adaptive_concurrency kapalıysa sabit)"""
+    from src.utils.config_loader import get_config
+
+    if get_config('scheduling.adaptive_concurrency', True):
+        return AdaptiveConcurrencyLimiter.from_config(initial_limit, max_limit)
+    return PrioritySemaphore(initial_limit)
+
+
+# Süreç genelinde araştırma limiti (AIMD durumu run'lar arasında korunur)
+_research_limiter: Optional[PrioritySemaphore] = None
+_research_limiter_lock = threading.Lock()
+
+
+def get_research_limiter() -> PrioritySemaphore:
+    """
+    Paylaşılan araştırma limitini döndür (yoksa oluştur)
+
+    performance.max_concurrent_requests ile başlar, sağlıklı gecikmede
+    scheduling.concurrency_max'a kadar artabilir. Gateway pool'u bu üst
+    sınıra göre boyutlanır; yine de daha küçükse limit pool boyutunu aşmaz
+    (fazla slot pool kuyruğunda beklemekten öte iş yapmaz).
+    """
+    global _research_limiter
+
+    if _research_limiter is None:
+        with _research_limiter_lock:
+            if _research_limiter is None:
+                from src.utils.config_loader import get_config
+                from src.utils.llm_gateway import get_llm_gateway
+
+                _research_limiter = create_research_limiter(
+                    get_config('performance.max_concurrent_requests', 5),
+                    max_limit=get_llm_gateway().max_workers
+                )
+
+    return _research_limiter
+
+
+class RunBudget:
+    """Run süre bütçesi ve kademeli hafifletme politikası"""
+
+    def __init__(
+        self,
+        deadline_seconds: float,
+        writing_reserve_seconds: float = 25,
+        skip_scraping_after: float = 0.5,
+        reduce_sources_after: float = 0.75,
+        reduced_max_sources: int = 2,
+        drop_priority_at_or_below: int = 1,
+        min_subtopics: int = 1,
+        research_grace_seconds: float = 10,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            deadline_seconds: Run'ın toplam süre bütçesi (planlama dahil)
+            writing_reserve_seconds: Bütçenin sonundan yazıma ayrılan süre
+            skip_scraping_after: Araştırma bütçesinin bu oranından sonra scraping yok
+            reduce_sources_after: Bu orandan sonra az kaynak + düşük öncelik atlama
+            reduced_max_sources: Hafifletilmiş araştırmada kaynak sayısı
+            drop_priority_at_or_below: Bu önceliğe kadar olan alt başlıklar atlanabilir
+            min_subtopics: Bütçe bitse de araştırılacak minimum alt başlık
+            research_grace_seconds: Uçuştaki araştırmaya bütçe sonrası tanınan ek süre
+            clock: Zaman kaynağı (test için değiştirilebilir)
+        """
+        self.deadline_seconds = deadline_seconds
+        self.research_seconds = max(deadline_seconds - writing_reserve_seconds, deadline_seconds * 0.5)
+        self.skip_scraping_after = skip_scraping_after
+        self.reduce_sources_after = reduce_sources_after
+        self.reduced_max_sources = reduced_max_sources
+        self.drop_priority_at_or_below = drop_priority_at_or_below
+        self.min_subtopics = min_subtopics
+        self.research_grace_seconds = research_grace_seconds
+        self.clock = clock
+
+        self.started_at = clock()
+        self.dispatched = 0
+        # Hafifletme kayıtları: {'subtopic', 'priority', 'action'}
+        self.degradations: List[Dict] = []
+
+    @classmethod
+    def from_config(cls, deadline_seconds: Optional[float] = None) -> Optional["RunBudget"]:
+        """config.yaml → scheduling (deadline 0/None ise bütçe yok)"""
+        from src.utils.config_loader import get_config
+
+        if deadline_seconds is None:
+            deadline_seconds = get_config('scheduling.deadline_seconds', 0)
+        if not deadline_seconds:
+            return None
+
+        return cls(
+            deadline_seconds=deadline_seconds,
+            writing_reserve_seconds=get_config('scheduling.writing_reserve_seconds', 25),
+            skip_scraping_after=get_config('scheduling.skip_scraping_after', 0.5),
+            reduce_sources_after=get_config('scheduling.reduce_sources_after', 0.75),
+            reduced_max_sources=get_config('scheduling.reduced_max_sources', 2),
+            drop_priority_at_or_below=get_config('scheduling.drop_priority_at_or_below', 1),
+            min_subtopics=get_config('scheduling.min_subtopics', 1),
+            research_grace_seconds=get_config('scheduling.research_grace_seconds', 10)
+        )
+
+    def elapsed(self) -> float:
+        return self.clock() - self.started_at
+
+    def research_used(self) -> float:
+        """Araştırma bütçesinin kullanılan oranı"""
+        return self.elapsed() / self.research_seconds
+
+    def research_timeout(self) -> float:
+        """Şimdi başlayan araştırma için süre sınırı"""
+        return max(self.research_seconds - self.elapsed(), 0) + self.research_grace_seconds
+
+    def research_settings(
+        self,
+        subtopic: Dict,
+        max_sources: int,
+        scrape_content: bool
+    ) -> Optional[Dict]:
+        """
+        Başlamak üzere olan alt başlık için araştırma ayarları
+
+        Returns:
+            {'max_sources', 'scrape_content'} veya atlanacaksa None
+        """
+        used = self.research_used()
+        priority = subtopic.get('priority', 3)
+        guaranteed = self.dispatched < self.min_subtopics
+
+        if not guaranteed and (
+            used >= 1.0
+            or (used >= self.reduce_sources_after and priority <= self.drop_priority_at_or_below)
+        ):
+            self.record(subtopic, 'dropped')
+            return None
+
+        self.dispatched += 1
+
+        if used >= self.reduce_sources_after:
+            if scrape_content or max_sources > self.reduced_max_sources:
+                self.record(subtopic, f'reduced_sources({self.reduced_max_sources})')
+            return {'max_sources': min(max_sources, self.reduced_max_sources), 'scrape_content': False}
+
+        if used >= self.skip_scraping_after and scrape_content:
+            self.record(subtopic, 'skip_scraping')
+            return {'max_sources': max_sources, 'scrape_content': False}
+
+        return {'max_sources': max_sources, 'scrape_content': scrape_content}
+
+    def record(self, subtopic: Dict, action: str):
+        self.degradations.append({
+            'subtopic': subtopic.get('title'),
+            'priority': subtopic.get('priority', 3),
+            'action': action,
+            'elapsed_seconds': round(self.elapsed(), 1)
+        })
+
+    def summary(self) -> Dict:
+        """Run metadata'sı için özet"""
+        return {
+            'deadline_seconds': self.deadline_seconds,
+            'elapsed_seconds': round(self.elapsed(), 1),
+            'degradations': self.degradations
+        }
+
+
+# Test (sahte saat ve sahte araştırmalarla)
+if __name__ == "__main__":
+
+    async def demo():
+        # Öncelik sırası: 1 slot, 6 bekleyen
+        semaphore = PrioritySemaphore(1)
+        order = []
+
+        async def worker(name, priority):
+            async with semaphore.slot(priority):
+                order.append(name)
+                await asyncio.sleep(0.01)
+
+        await semaphore.acquire()
+        tasks = [
+            asyncio.ensure_future(worker(f"p{priority}_{i}", priority))
+            for i, priority in enumerate([1, 5, 3, 5, 2, 4])
+        ]
+        await asyncio.sleep(0)
+        semaphore.release()
+        await asyncio.gather(*tasks)
+        print(f"Dağıtım sırası: {order}")
+
+    asyncio.run(demo())
+
+    # Bütçe: 90s deadline, 25s yazım payı → 65s araştırma
+    now = [0.0]
+    budget = RunBudget(90, clock=lambda: now[0])
+    subtopics = [{'title': f"Alt başlık {i}", 'priority': p} for i, p in enumerate([5, 4, 1, 3, 1, 2, 5])]
+
+    for subtopic, at in zip(subtopics, [0, 20, 36, 40, 50, 55, 70]):
+        now[0] = at
+        settings = budget.research_settings(subtopic, max_sources=5, scrape_content=True)
+        print(f"t={at:3}s p={subtopic['priority']} → {settings}")
+
+    print(f"Hafifletmeler: {budget.summary()['degradations']}")
+
+    # AIMD: sağlıklı dalgalarda limit artar, 429 dalgasında yarıya iner
+    async def aimd_demo():
+        limiter = AdaptiveConcurrencyLimiter(2, max_limit=8, decrease_cooldown_seconds=0.05)
+        history = []
+
+        async def call(fail: bool):
+            async with limiter.slot():
+                await asyncio.sleep(0.01)
+                if fail:
+                    from google.api_core.exceptions import ResourceExhausted
+                    raise ResourceExhausted("quota")
+
+        for wave, fail in enumerate([False] * 6 + [True] + [False] * 3):
+            calls = [call(fail) for _ in range(limiter.limit + 2)]
+            await asyncio.gather(*calls, return_exceptions=True)
+            history.append(limiter.limit)
+            await asyncio.sleep(0.06)
+
+        print(f"AIMD limit geçmişi: {history}")
+
+    asyncio.run(aimd_demo())
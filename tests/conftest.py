@@ -0,0 +1,8 @@
+"""
+Test ayarları - proje kökünü import yoluna ekler
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
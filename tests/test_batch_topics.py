@@ -0,0 +1,26 @@
+"""
+main.load_batch_topics testleri - geçersiz satırlar ve güvenli id'ler
+"""
+
+from main import load_batch_topics
+
+
+def test_load_batch_topics(tmp_path):
+    path = tmp_path / "topics.jsonl"
+    path.write_text(
+        '42\n'
+        '[1, 2]\n'
+        '{"topic": "Kuantum", "id": "../../etc/passwd"}\n'
+        'Düz metin konu\n'
+        '{"topic": 3}\n'
+        '{"topic": "Yapay Zeka", "id": "///"}\n',
+        encoding='utf-8'
+    )
+
+    jobs = load_batch_topics(str(path))
+
+    assert [job['topic'] for job in jobs] == ["Kuantum", "Düz metin konu", "Yapay Zeka"]
+    assert jobs[0]['id'] == "etc_passwd"
+    assert jobs[1]['id'] == "0002_d_z_metin_konu"
+    # Slug'ı boş kalan id yerine varsayılan kullanılır
+    assert jobs[2]['id'] == "0003_yapay_zeka"
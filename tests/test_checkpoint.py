@@ -0,0 +1,82 @@
+"""
+checkpoint testleri - run_id doğrulama, streaming parça kaydı ve parça anahtarları
+"""
+
+import pytest
+
+from src.agents.writer_agent import WriterAgent
+from src.utils.resumable import result_section_key, results_key
+from src.workflow.checkpoint import RunCheckpoint
+
+
+def test_load_roundtrip(tmp_path):
+    checkpoint = RunCheckpoint.create("konu", checkpoint_dir=tmp_path)
+    checkpoint.save_plan({'subtopics': []})
+
+    loaded = RunCheckpoint.load(checkpoint.run_id, checkpoint_dir=tmp_path)
+    assert loaded.topic == "konu"
+    assert loaded.stage == 'researching'
+
+
+@pytest.mark.parametrize("run_id", [
+    "../../etc/passwd",
+    "../20240101_120000_abcdef",
+    "/tmp/20240101_120000_abcdef",
+    "20240101_120000_abcdef/../x",
+    "20240101_120000_ABCDEF",
+    "",
+])
+def test_load_rejects_invalid_run_id(tmp_path, run_id):
+    with pytest.raises(ValueError):
+        RunCheckpoint.load(run_id, checkpoint_dir=tmp_path)
+
+
+def test_load_missing_run_id(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        RunCheckpoint.load("20240101_120000_abcdef", checkpoint_dir=tmp_path)
+
+
+def test_streamed_part_saved_when_exhausted(tmp_path):
+    checkpoint = RunCheckpoint.create("konu", checkpoint_dir=tmp_path)
+
+    stream = WriterAgent._record_stream(iter(["Gi", "riş"]), checkpoint, 'intro')
+    assert next(stream) == "Gi"
+    assert checkpoint.get_writer_part('intro') is None
+
+    assert list(stream) == ["riş"]
+    assert checkpoint.get_writer_part('intro') == "Giriş"
+
+
+def test_writer_parts_keyed_by_subtopic(tmp_path):
+    checkpoint = RunCheckpoint.create("konu", checkpoint_dir=tmp_path)
+    checkpoint.save_plan({'subtopics': [{'title': t} for t in ("A", "B", "C")]})
+    results = [{'subtopic_title': t} for t in ("A", "B", "C")]
+
+    # Task graph yolu: bölüm plan indeksiyle numaralanır, giriş tüm kümeyle yazılır
+    checkpoint.save_writer_part(result_section_key(results[2]), "## 3. C\n\nmetin")
+    checkpoint.save_writer_part(results_key('intro', results), "eski giriş")
+
+    written = []
+
+    def write_section(topic, result, number):
+        written.append(result['subtopic_title'])
+        return f"## {number}. {result['subtopic_title']}"
+
+    writer = WriterAgent.__new__(WriterAgent)
+    writer.write_section = write_section
+    writer.write_intro = lambda *args: "yeni giriş"
+    writer.write_conclusion = lambda *args: "sonuç"
+
+    # B atlandı: C'nin bölümü kaydırılmadan yeniden kullanılır, giriş yeniden yazılır
+    kept = [results[0], results[2]]
+    _, intro, sections, _ = writer._write_parts_sequential("konu", {}, kept, False, checkpoint)
+
+    assert written == ["A"]
+    assert sections == ["## 1. A", "## 2. C\n\nmetin"]
+    assert intro == "yeni giriş"
+
+    # C'nin araştırması yeniden kaydedilince yalnız onun bölümü ve toplu parçalar düşer
+    checkpoint.save_research(2, results[2])
+    assert checkpoint.get_writer_part(result_section_key(results[0])) == "## 1. A"
+    assert checkpoint.get_writer_part(result_section_key(results[2])) is None
+    assert checkpoint.get_writer_part(results_key('intro', kept)) is None
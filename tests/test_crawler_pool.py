@@ -0,0 +1,39 @@
+"""
+crawler_pool testleri - domain/global slot sırası ve domain semaphore temizliği
+"""
+
+import asyncio
+
+from src.tools.crawler_pool import CrawlerPool
+
+
+class SlowFetcher:
+    """Her isteği kısa süre bekletip başarılı dönen sahte HttpFetcher"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def fetch(self, url):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        return {'url': url, 'content': 'ok', 'success': True, 'needs_browser': False}
+
+    async def close(self):
+        pass
+
+
+def test_busy_domain_does_not_hold_global_slots():
+    pool = CrawlerPool(max_concurrent=2, max_per_domain=1)
+    pool.http_fetcher = fetcher = SlowFetcher()
+
+    urls = [f"https://a.example/{i}" for i in range(4)] + ["https://b.example/1"]
+
+    results = asyncio.run(pool.fetch_many(urls))
+
+    assert all(result['success'] for result in results)
+    # a.example kuyruğu global slotları doldurmadığı için b.example paralel gitti
+    assert fetcher.peak == 2
+    assert pool._domain_semaphores == {} and pool._domain_users == {}
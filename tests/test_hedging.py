@@ -0,0 +1,53 @@
+"""
+hedging testleri - günlük kota payı ve async hedge'in gecikme kaydı
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+from src.utils.hedging import RequestHedger
+from src.utils.rate_limiter import SlidingWindowRateLimiter
+
+
+def test_try_acquire_keeps_daily_reserve():
+    limiter = SlidingWindowRateLimiter("test", requests_per_minute=100, requests_per_day=4)
+
+    assert limiter.try_acquire(daily_reserve=2)
+    assert limiter.try_acquire(daily_reserve=2)
+    # Kalan 2 istek asıl isteklere ayrıldı
+    assert not limiter.try_acquire(daily_reserve=2)
+    assert limiter.requests_today == 2
+
+    limiter.acquire_sync()
+    assert limiter.requests_today == 3
+
+
+def test_async_hedge_records_losing_call():
+    hedger = RequestHedger("test", min_samples=3, max_hedge_ratio=1.0, min_delay_seconds=0.05)
+    for _ in range(3):
+        hedger.record(0.01)
+
+    durations = iter([0.5, 0.01])
+    threads = []
+
+    def call():
+        threads.append(threading.current_thread().name)
+        time.sleep(next(durations))
+        return "ok"
+
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="primary")
+    backup_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="backup")
+    started = time.monotonic()
+    assert asyncio.run(hedger.run_async(call, executor=pool, backup_executor=backup_pool)) == "ok"
+    assert time.monotonic() - started < 0.3
+    assert hedger.hedge_wins == 1
+
+    # Asıl istek çağıranın pool'unda, yalnız yedek istek backup pool'unda çalışır
+    assert threads[0].startswith("primary") and threads[1].startswith("backup")
+
+    # Kaybeden (iptal edilen) asıl istek thread'inde biter ve gecikmesi kaydedilir
+    pool.shutdown(wait=True)
+    backup_pool.shutdown(wait=True)
+    assert max(hedger._latencies) >= 0.5
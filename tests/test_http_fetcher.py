@@ -0,0 +1,117 @@
+"""
+http_fetcher testleri - yerel http.server fixture'ı ile
+"""
+
+import asyncio
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from src.tools.http_fetcher import HttpFetcher, extract_main_content
+
+STATIC_PAGE = """<html><head><title>Test</title><script>var x = 1;</script></head>
+<body><nav><a href="/">Ana sayfa</a> <a href="/about">Hakkında</a></nav>
+<article><h1>Kuantum Hesaplama</h1>
+""" + "<p>Kuantum bilgisayarlar kübitleri kullanarak hesaplama yapar. " * 20 + """</p>
+<ul><li>Süperpozisyon</li><li>Dolanıklık</li></ul>
+<p>Detaylar için <a href="/kaynak">kaynağa</a> bakın.</p></article>
+<footer>Telif hakkı</footer></body></html>"""
+
+SPA_PAGE = """<html><body><div id="root"></div>
+<noscript>You need to enable JavaScript to run this app.</noscript>
+<script src="/bundle.js"></script></body></html>"""
+
+STATUSES = {"/forbidden": 403, "/throttled": 429, "/missing": 404}
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        status = STATUSES.get(self.path, 200)
+        body = (SPA_PAGE if self.path == "/spa" else STATIC_PAGE).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def _fetch(url):
+    async def run():
+        async with HttpFetcher(min_content_chars=200) as fetcher:
+            return await fetcher.fetch(url)
+    return asyncio.run(run())
+
+
+def test_static_page_extracted(base_url):
+    result = _fetch(base_url + "/static")
+
+    assert result['success'] and not result['needs_browser']
+    assert result['content'].startswith("# Kuantum Hesaplama")
+    assert "- Süperpozisyon" in result['content']
+    assert f"[kaynağa]({base_url}/kaynak)" in result['content']
+    assert "Ana sayfa" not in result['content']
+    assert "Telif" not in result['content']
+
+
+def test_spa_shell_needs_browser(base_url):
+    result = _fetch(base_url + "/spa")
+
+    assert not result['success'] and result['needs_browser']
+
+
+@pytest.mark.parametrize("path, needs_browser", [
+    ("/forbidden", True),
+    ("/throttled", True),
+    ("/missing", False),
+])
+def test_http_error_statuses(base_url, path, needs_browser):
+    result = _fetch(base_url + path)
+
+    assert not result['success']
+    assert result['needs_browser'] is needs_browser
+
+
+@pytest.mark.parametrize("url", [
+    "closed-port",
+    "http://",
+])
+def test_connection_errors_do_not_need_browser(url):
+    if url == "closed-port":
+        # Alınıp bırakılan port: dinleyen yok, bağlantı reddedilir
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            url = f"http://127.0.0.1:{sock.getsockname()[1]}/"
+
+    result = _fetch(url)
+
+    assert not result['success'] and result['error']
+    assert result['needs_browser'] is False
+
+
+def test_noise_classes_match_whole_tokens():
+    paragraph = "<p>" + "İçerik metni. " * 20 + "</p>"
+    html = (
+        '<html><body>'
+        f'<div class="canvas-wrapper">{paragraph}</div>'
+        '<div class="site-nav"><p>Menü bağlantıları</p></div>'
+        '<div id="comments_list"><p>Yorum</p></div>'
+        '</body></html>'
+    )
+
+    content, _ = extract_main_content(html)
+    assert "İçerik metni." in content
+    assert "Menü" not in content
+    assert "Yorum" not in content
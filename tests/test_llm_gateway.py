@@ -0,0 +1,41 @@
+"""
+llm_gateway testleri - LLM cache anahtarı kuralları
+"""
+
+import pytest
+
+from src.utils import llm_gateway
+from src.utils.llm_gateway import LLMGateway
+
+
+class FakeCache:
+    def make_key(self, *parts):
+        return repr(parts)
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    monkeypatch.setattr(llm_gateway, "get_llm_cache", FakeCache)
+    return LLMGateway(max_workers=1)
+
+
+def test_deterministic_model_cached_by_default(gateway):
+    model = gateway.create_model("gemini-test", generation_config={"temperature": 0})
+
+    assert gateway._cache_key(model, "soru", None, {}) is not None
+    assert gateway._cache_key(model, "soru", False, {}) is None
+
+
+def test_sampled_model_cached_only_on_opt_in(gateway):
+    model = gateway.create_model("gemini-test", generation_config={"temperature": 0.7})
+
+    assert gateway._cache_key(model, "soru", None, {}) is None
+    assert gateway._cache_key(model, "soru", True, {}) is not None
+
+
+def test_missing_temperature_treated_as_sampled(gateway):
+    # Gemini'nin varsayılan temperature'ı 0 değil
+    model = gateway.create_model("gemini-test")
+
+    assert gateway._cache_key(model, "soru", None, {}) is None
+    assert gateway._cache_key(model, "soru", True, {}) is not None
@@ -0,0 +1,94 @@
+"""
+retry_helper testleri - devre kesicinin half-open deneme çağrısı
+"""
+
+import asyncio
+import time
+
+import pytest
+from google.api_core.exceptions import InvalidArgument, ResourceExhausted
+
+from src.utils import retry_helper
+from src.utils.retry_helper import CircuitBreaker, CircuitOpenError, retry_async, retry_sync
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    """Tek hatada açılan, 0.1s sonra deneme çağrısına izin veren devre"""
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.1)
+    monkeypatch.setitem(retry_helper._breakers, "test", breaker)
+    return breaker
+
+
+def _open(breaker):
+    breaker.record_failure()
+    assert breaker.state == "open"
+    time.sleep(0.15)
+    assert breaker.state == "half-open"
+
+
+def test_probe_with_client_error_closes_circuit(breaker):
+    _open(breaker)
+
+    def bad_request():
+        raise InvalidArgument("bad prompt")
+
+    with pytest.raises(InvalidArgument):
+        retry_sync(bad_request, endpoint="test", max_retries=1)
+
+    # 400 yanıtı endpoint'in ayakta olduğunu gösterir; sonraki çağrı geçer
+    assert breaker.state == "closed"
+    assert retry_sync(lambda: "ok", endpoint="test", max_retries=1) == "ok"
+
+
+def test_cancelled_probe_releases_slot(breaker):
+    _open(breaker)
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    async def scenario():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(retry_async(hang, endpoint="test", max_retries=1), timeout=0.05)
+
+        # İptal edilen deneme çağrısı slotu bırakır; devre yine half-open
+        await asyncio.sleep(0.3)
+
+        async def healthy():
+            return "ok"
+
+        return await retry_async(healthy, endpoint="test", max_retries=1)
+
+    assert asyncio.run(scenario()) == "ok"
+    assert breaker.state == "closed"
+
+
+def test_failed_probe_reopens_circuit(breaker):
+    _open(breaker)
+
+    def quota():
+        raise ResourceExhausted("quota")
+
+    with pytest.raises(ResourceExhausted):
+        retry_sync(quota, endpoint="test", max_retries=3, initial_delay=0)
+
+    with pytest.raises(CircuitOpenError):
+        retry_sync(lambda: "ok", endpoint="test", max_retries=1)
+
+
+def test_zero_max_retries_means_single_attempt(monkeypatch):
+    from src.utils import config_loader
+    # Config varsayılanı 5 deneme: max_retries=0 buna düşmemeli
+    monkeypatch.setattr(
+        config_loader, "get_config",
+        lambda key, default=None: 5 if key == 'rate_limits.retry_max_attempts' else default
+    )
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        raise ResourceExhausted("quota")
+
+    with pytest.raises(ResourceExhausted):
+        retry_sync(flaky, max_retries=0, initial_delay=0)
+    assert len(calls) == 1
@@ -0,0 +1,69 @@
+"""
+scheduling testleri - paylaşılan araştırma limiti
+"""
+
+import asyncio
+import threading
+
+from src.utils.llm_gateway import get_llm_gateway
+from src.workflow import scheduling
+from src.workflow.scheduling import PrioritySemaphore, get_research_limiter
+
+
+def test_research_limiter_is_shared_and_capped(monkeypatch):
+    monkeypatch.setattr(scheduling, "_research_limiter", None)
+
+    limiter = get_research_limiter()
+    assert get_research_limiter() is limiter
+    assert limiter.max_limit <= get_llm_gateway().max_workers
+
+
+def test_research_limiter_grows_past_initial_limit(monkeypatch):
+    monkeypatch.setattr(scheduling, "_research_limiter", None)
+    limiter = get_research_limiter()
+    start = limiter.limit
+
+    async def saturate():
+        held = 0
+        for _ in range(50):
+            # Limit büyüdükçe yeni slotları da doldur: artış yalnız doygunken olur
+            while limiter.in_flight < limiter.limit:
+                await limiter.acquire()
+                held += 1
+            limiter.on_success(0.1)
+        for _ in range(held):
+            limiter.release()
+
+    asyncio.run(saturate())
+    assert limiter.limit > start
+    assert limiter.limit <= get_llm_gateway().max_workers
+
+
+def test_semaphore_shared_across_event_loops():
+    semaphore = PrioritySemaphore(1)
+    held = threading.Event()
+    release = threading.Event()
+
+    async def holder():
+        await semaphore.acquire()
+        held.set()
+        await asyncio.get_running_loop().run_in_executor(None, release.wait)
+        semaphore.release()
+
+    thread = threading.Thread(target=asyncio.run, args=(holder(),))
+    thread.start()
+    held.wait(timeout=5)
+
+    async def waiter():
+        task = asyncio.ensure_future(semaphore.acquire(priority=1))
+        await asyncio.sleep(0.05)
+        assert not task.done()
+
+        # Slot başka thread'deki loop'tan bırakılır
+        release.set()
+        await asyncio.wait_for(task, timeout=5)
+        semaphore.release()
+
+    asyncio.run(waiter())
+    thread.join(timeout=5)
+    assert semaphore.in_flight == 0
@@ -0,0 +1,23 @@
+"""
+source_scorer testleri - toplu skorlama tek tek skorlamayla aynı sonucu verir
+"""
+
+from src.utils.source_scorer import SourceScorer
+
+
+def test_score_batch_matches_score_source():
+    scorer = SourceScorer()
+    content = "# Giriş\n- madde\n1. adım\nresearch data findings https://kaynak.org " * 300
+    sources = [
+        {'url': 'https://mit.edu/paper', 'title': 'Makale', 'content': content, 'published_date': '2020-01-01'},
+        {'url': 'http://example.com', 'title': '', 'content': '', 'published_date': None},
+        {'url': 'https://example.org/a', 'title': 'Not', 'content': 'kısa metin', 'published_date': '2020-01-01'},
+        {'url': '', 'title': '', 'content': 'research', 'published_date': 'geçersiz'},
+    ]
+
+    expected = [
+        scorer.score_source(s['url'], s['title'], s['content'], s['published_date'])
+        for s in sources
+    ]
+    assert scorer.score_batch(sources) == expected
+    assert scorer.score_batch([]) == []
@@ -0,0 +1,42 @@
+"""
+writer_agent testleri - tüketici ayrılınca arka plan akışları durur
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.agents import writer_agent
+from src.agents.writer_agent import WriterAgent
+
+
+class FakeGateway:
+    """Sonsuz chunk üreten, kapatılınca bunu kaydeden sahte stream_sync"""
+
+    def __init__(self):
+        self.closed = threading.Event()
+
+    def stream_sync(self, model, prompt, **kwargs):
+        try:
+            while True:
+                time.sleep(0.01)
+                yield "chunk "
+        finally:
+            self.closed.set()
+
+
+def test_producer_stops_when_consumer_leaves(monkeypatch):
+    gateway = FakeGateway()
+    monkeypatch.setattr(writer_agent, "get_llm_gateway", lambda: gateway)
+
+    writer = WriterAgent.__new__(WriterAgent)
+    writer.model = None
+    pool = ThreadPoolExecutor(max_workers=1)
+    stop = threading.Event()
+
+    stream = writer._open_stream(pool, "prompt", stop)
+    assert next(stream) == "chunk "
+
+    stop.set()
+    assert gateway.closed.wait(timeout=1)
+    pool.shutdown(wait=True)